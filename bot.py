@@ -52,6 +52,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop cuts per-iteration event loop overhead; use the default loop
+    # where it is not installed (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
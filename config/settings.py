@@ -71,10 +71,18 @@ SYSTEM_CONFIG = {
     "rate_limit_buffer": 0.8,  # 80% of rate limit
     "max_requests_per_minute": 45,  # Maximum API requests per minute
     "max_orders_per_second": 5,  # Maximum orders per second
+    # Enforce the limits across processes via Redis. Off until the
+    # rate_limited_api wrapper waits asynchronously: it would block the
+    # event loop on Redis calls and sleeps
+    "shared_rate_limit": False,
     
     # Circuit breaker settings
-    "error_threshold": 5,  # Number of errors before circuit breaker trips
+    "error_threshold": 5,  # Consecutive errors before circuit breaker trips
     "circuit_timeout": 600,  # Seconds to keep circuit breaker open (10 minutes)
+    "circuit_max_timeout": 3600,  # Upper bound as failed probes double the timeout
+    "circuit_window_size": 20,  # Recent API calls the failure ratio counts over
+    "circuit_failure_ratio": 0.5,  # Also trip when a full window fails this often
+    "circuit_probe_limit": 1,  # Calls let through to test a recovering exchange
     
     # Backoff settings
     "initial_backoff": 1,  # Initial backoff in seconds
@@ -136,6 +144,9 @@ REDIS_CONFIG = {
     "socket_connect_timeout": 5,
     "retry_on_timeout": True,
     "health_check_interval": 30,
+    "unix_socket_path": os.getenv("REDIS_UNIX_SOCKET", ""),  # Set when Redis runs on the same host
+    # Total over the text and binary client pools
+    "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", "32")),
 }
 
 # PostgreSQL configuration
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Script untuk meng-compile kernel indikator secara AOT (ahead-of-time)
+dengan numba.pycc, supaya proses baru tidak menunggu JIT compile pada
+panggilan pertama.
+
+Hasilnya adalah modul `src/strategies/_indicators_aot` (shared object)
+yang otomatis dipakai oleh BollStochStrategy jika tersedia.
+"""
+
+import os
+import sys
+import logging
+
+from numba.pycc import CC
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Add parent directory to path to import from src
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.strategies import indicator_kernels  # noqa: E402
+
+cc = CC("_indicators_aot")
+cc.output_dir = os.path.join(ROOT_DIR, "src", "strategies")
+
+
+@cc.export("indicators", "void(f8[:], f8[:, :], i8, f8, i8, i8, i8, i8)")
+def indicators(close, out, boll_window, boll_std, ema_window, stoch_window,
+               smooth_k, smooth_d):
+    indicator_kernels.indicators(
+        close, out, boll_window, boll_std, ema_window, stoch_window,
+        smooth_k, smooth_d
+    )
+
+
+if __name__ == "__main__":
+    logger.info(f"Compiling indicator kernels into {cc.output_dir}")
+    cc.compile()
+    logger.info("AOT indicator module built")
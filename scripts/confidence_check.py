@@ -333,8 +333,11 @@ async def display_confidence_levels(hours=1, detailed=False, update_status=True)
                 combined_confidence["last_updated"] = datetime.now().isoformat()
 
                 # Save to Redis
-                redis_manager.redis.set("confidence_levels", json.dumps(combined_confidence))
-                redis_manager.redis.expire("confidence_levels", 60 * 60 * 24)  # 1 day expiration
+                # 1 day expiration
+                redis_manager.redis.set(
+                    "confidence_levels", json.dumps(combined_confidence),
+                    ex=redis_manager.TTL_DAY
+                )
                 print(f"Updated confidence levels in Redis for {len(log_confidence)} symbols")
 
                 # Also save as individual signals
@@ -463,8 +466,8 @@ async def display_confidence_levels(hours=1, detailed=False, update_status=True)
                 if redis_manager.is_connected():
                     # Update price in Redis
                     price_key = f"price:{symbol}"
-                    redis_manager.redis.set(price_key, str(current_price))
-                    redis_manager.redis.expire(price_key, 60)  # Cache for 1 minute
+                    # Cache for 1 minute
+                    redis_manager.redis.set(price_key, str(current_price), ex=60)
                     
                     # Update confidence data in Redis
                     if symbol in all_confidence:
@@ -485,8 +488,8 @@ async def display_confidence_levels(hours=1, detailed=False, update_status=True)
                 if redis_manager.is_connected():
                     # Update price in Redis
                     price_key = f"price:{symbol}"
-                    redis_manager.redis.set(price_key, str(current_price))
-                    redis_manager.redis.expire(price_key, 60)  # Cache for 1 minute
+                    # Cache for 1 minute
+                    redis_manager.redis.set(price_key, str(current_price), ex=60)
             except Exception as e:
                 print(f"⚠️ Error updating Redis price for {symbol}: {e}")
                 
@@ -80,8 +80,11 @@ async def fetch_and_store_historical_data(days=30):
                     try:
                         # Convert DataFrame to JSON
                         json_data = df.to_json(orient='records', date_format='iso')
-                        redis_manager.redis.set(redis_key, json_data)
-                        redis_manager.redis.expire(redis_key, 60 * 60 * 24 * 7)  # 7 days expiration
+                        # 7 days expiration
+                        redis_manager.redis.set(
+                            redis_key, json_data,
+                            ex=redis_manager.TTL_WEEK
+                        )
                         logger.info(f"Stored {len(df)} candles in Redis for {symbol} {timeframe}")
                     except Exception as e:
                         logger.error(f"Error storing data in Redis for {symbol} {timeframe}: {e}")
@@ -74,8 +74,11 @@ async def sell_asset(symbol, amount=None, sell_all=False):
 
     # ExchangeConnector doesn't have a connect() method, it's initialized automatically
 
-    # Get balance
-    balance = await get_balance(exchange, symbol)
+    # Get balance and current price concurrently, they are independent
+    balance, current_price = await asyncio.gather(
+        get_balance(exchange, symbol),
+        get_current_price(exchange, symbol)
+    )
 
     if balance == 0:
         logger.error(f"No {symbol} balance found")
@@ -86,10 +89,7 @@ async def sell_asset(symbol, amount=None, sell_all=False):
     # Determine amount to sell
     sell_amount = balance if sell_all else (amount if amount is not None else balance)
 
-    # Get current price
     market_symbol = f"{symbol}USDT"
-    current_price = await get_current_price(exchange, symbol)
-
     if current_price == 0:
         logger.error(f"Could not get current price for {market_symbol}")
         return
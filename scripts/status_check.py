@@ -73,8 +73,11 @@ async def extract_confidence_from_logs(monitor):
 
                 # Also save to Redis for quick access
                 try:
-                    redis_manager.redis.set("confidence_levels", json.dumps(existing_levels))
-                    redis_manager.redis.expire("confidence_levels", 60 * 60 * 24)  # 1 day expiration
+                    # 1 day expiration
+                    redis_manager.redis.set(
+                        "confidence_levels", json.dumps(existing_levels),
+                        ex=redis_manager.TTL_DAY
+                    )
                     print("Saved confidence levels to Redis")
                 except Exception as e:
                     print(f"Error saving confidence levels to Redis: {e}")
@@ -290,16 +293,10 @@ async def update_active_trades_prices(monitor):
             if redis_manager.is_connected():
                 try:
                     # Try to get OHLCV data from Redis
-                    ohlcv_key = f"ohlcv:{symbol}:1m"
-                    ohlcv_data = redis_manager.redis.get(ohlcv_key)
+                    df = redis_manager.get_ohlcv(symbol, "1m")
 
-                    if ohlcv_data:
+                    if df is not None:
                         try:
-                            # Parse JSON data
-                            from io import StringIO
-                            import pandas as pd
-                            df = pd.read_json(StringIO(ohlcv_data))
-
                             if not df.empty:
                                 # Check if data is recent (last 5 minutes)
                                 last_timestamp = df.iloc[-1].name if hasattr(df.iloc[-1], 'name') else None
@@ -379,8 +376,11 @@ async def update_active_trades_prices(monitor):
 
         # Also save all active trades to Redis
         try:
-            redis_manager.redis.set("active_trades", json.dumps(updated_trades))
-            redis_manager.redis.expire("active_trades", 60 * 60 * 24)  # 1 day expiration
+            # 1 day expiration
+            redis_manager.redis.set(
+                "active_trades", json.dumps(updated_trades),
+                ex=redis_manager.TTL_DAY
+            )
             print(f"Saved {len(updated_trades)} active trades to Redis")
         except Exception as e:
             print(f"Error saving active trades to Redis: {e}")
@@ -105,8 +105,11 @@ async def update_trade_prices():
             
             # Also save all active trades to Redis
             try:
-                redis_manager.redis.set("active_trades", json.dumps(updated_trades))
-                redis_manager.redis.expire("active_trades", 60 * 60 * 24)  # 1 day expiration
+                # 1 day expiration
+                redis_manager.redis.set(
+                    "active_trades", json.dumps(updated_trades),
+                    ex=redis_manager.TTL_DAY
+                )
                 logger.info(f"Saved {len(updated_trades)} active trades to Redis")
             except Exception as e:
                 logger.error(f"Error saving active trades to Redis: {e}")
@@ -1,8 +1,31 @@
 from typing import Dict, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
+# Timeframes accepted by TradingConfig.validate
+VALID_TIMEFRAMES = frozenset({"1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h"})
+
+# (value getter, min, max, error message) checked in order by validate
+_RANGE_CHECKS = (
+    (lambda c: c.leverage, 1, 20, "Leverage must be between 1 and 20"),
+    (lambda c: c.risk_percentage, 0.1, 5,
+     "Risk percentage must be between 0.1% and 5%"),
+    (lambda c: c.min_balance, 5, 1000000,
+     "Minimum balance must be between 5 and 1,000,000 USDT"),
+    (lambda c: c.max_daily_trades, 1, 100,
+     "Max daily trades must be between 1 and 100"),
+    (lambda c: c.max_daily_loss_percent, 1, 20,
+     "Max daily loss percent must be between 1% and 20%"),
+    (lambda c: c.max_drawdown_percent, 5, 50,
+     "Max drawdown percent must be between 5% and 50%"),
+    (lambda c: c.partial_tp_1 + c.partial_tp_2, 0.1, 1,
+     "Sum of partial take profits must be between 0.1 and 1"),
+    (lambda c: c.trailing_distance_pct, 0.001, 0.05,
+     "Trailing distance must be between 0.1% and 5%"),
+)
+
+
 @dataclass
 class TradingConfig:
     symbol: str
@@ -24,26 +47,10 @@ class TradingConfig:
 
     @classmethod
     def from_dict(cls, config: Dict[str, Any]) -> "TradingConfig":
-        return cls(
-            symbol=config["symbol"],
-            leverage=config["leverage"],
-            timeframe=config["timeframe"],
-            risk_percentage=config["risk_percentage"],
-            max_position_size=config["max_position_size"],
-            min_balance=config["min_balance"],
-            max_daily_trades=config["max_daily_trades"],
-            max_daily_loss_percent=config["max_daily_loss_percent"],
-            max_drawdown_percent=config["max_drawdown_percent"],
-            partial_tp_1=config["partial_tp_1"],
-            partial_tp_2=config["partial_tp_2"],
-            tp1_target=config["tp1_target"],
-            tp2_target=config["tp2_target"],
-            trailing_distance_pct=config["trailing_distance_pct"],
-            initial_profit_for_trailing_stop=config[
-                "initial_profit_for_trailing_stop"
-            ],
-            fee_rate=config["fee_rate"],
-        )
+        missing = _REQUIRED_FIELDS - config.keys()
+        if missing:
+            raise KeyError(f"Missing trading config fields: {sorted(missing)}")
+        return cls(**{name: config[name] for name in _REQUIRED_FIELDS})
 
     def validate(self) -> Tuple[bool, Optional[str]]:
         """
@@ -55,52 +62,12 @@ class TradingConfig:
                 message.
         """
         try:
-            if not (1 <= self.leverage <= 20):
-                return False, "Leverage must be between 1 and 20"
-
-            if not (0.1 <= self.risk_percentage <= 5):
-                return False, "Risk percentage must be between 0.1% and 5%"
-
-            if not (5 <= self.min_balance <= 1000000):
-                return (
-                    False,
-                    "Minimum balance must be between 5 and 1,000,000 USDT",
-                )
-
-            if self.timeframe not in [
-                "1m",
-                "3m",
-                "5m",
-                "15m",
-                "30m",
-                "1h",
-                "2h",
-                "4h",
-            ]:
+            if self.timeframe not in VALID_TIMEFRAMES:
                 return False, "Invalid timeframe"
 
-            if not (1 <= self.max_daily_trades <= 100):
-                return False, "Max daily trades must be between 1 and 100"
-
-            if not (1 <= self.max_daily_loss_percent <= 20):
-                return (
-                    False,
-                    "Max daily loss percent must be between 1% and 20%",
-                )
-
-            if not (5 <= self.max_drawdown_percent <= 50):
-                return False, (
-                    "Max drawdown percent must be between 5% and 50%"
-                )
-
-            if not (0.1 <= self.partial_tp_1 + self.partial_tp_2 <= 1):
-                return (
-                    False,
-                    "Sum of partial take profits must be between 0.1 and 1",
-                )
-
-            if not (0.001 <= self.trailing_distance_pct <= 0.05):
-                return False, "Trailing distance must be between 0.1% and 5%"
+            for value, low, high, message in _RANGE_CHECKS:
+                if not (low <= value(self) <= high):
+                    return False, message
 
             return True, None
 
@@ -108,6 +75,10 @@ class TradingConfig:
             return False, f"Validation error: {str(e)}"
 
 
+# Keys TradingConfig.from_dict requires, one per dataclass field
+_REQUIRED_FIELDS = frozenset(f.name for f in fields(TradingConfig))
+
+
 def validate_exchange_config(exchange: Any) -> Tuple[bool, Optional[str]]:
     """Validate exchange configuration and connectivity."""
     try:
@@ -17,11 +17,15 @@ from config.settings import (
     REDIS_CONFIG,
     POSTGRES_CONFIG,
 )
-from src.strategies.boll_stoch_strategy import BollStochStrategy
+from src.strategies.boll_stoch_strategy import AllocationPolicy, BollStochStrategy
 from src.exchange.connector import ExchangeConnector
 from src.core.position_manager import PositionManager
 from src.utils.status_monitor import BotStatusMonitor
-from src.utils.telegram_utils import setup_telegram, send_telegram_message
+from src.utils.telegram_utils import (
+    setup_telegram,
+    send_telegram_message,
+    flush_telegram,
+)
 from src.utils.error_handlers import (
     handle_exchange_errors,
     handle_strategy_errors,
@@ -70,6 +74,7 @@ class TradingBot:
         self.last_status_update = time.time()  # timestamp of last status update (epoch time)
         self.last_health_check = datetime.now()
         self.last_data_sync = datetime.now() - timedelta(hours=1)  # Force sync on startup
+        self.allocation_policy = AllocationPolicy.from_dict(TRADING_CONFIG)
 
     @handle_exchange_errors(notify=True)
     async def initialize(self):
@@ -212,14 +217,21 @@ class TradingBot:
             # Buat dictionary untuk menyimpan data OHLCV dari berbagai timeframe
             ohlcv_data = {}
 
+            # Ambil data cache Redis untuk semua timeframe sekaligus
+            timeframes = STRATEGY_CONFIG.get("timeframes", ["1h"])
+            cached_ohlcv = {}
+            if self.redis and self.redis.is_connected():
+                cached_ohlcv = self.redis.get_ohlcv_bulk(
+                    [(symbol, timeframe) for timeframe in timeframes]
+                )
+
             # Ambil data untuk setiap timeframe
-            for timeframe in STRATEGY_CONFIG.get("timeframes", ["1h"]):
+            for timeframe in timeframes:
                 # Coba ambil dari Redis dulu
-                df = None
-                if self.redis and self.redis.is_connected():
+                df = cached_ohlcv.get((symbol, timeframe))
+                if df is not None:
                     try:
-                        df = self.redis.get_ohlcv(symbol, timeframe)
-                        if df is not None and not df.empty:
+                        if not df.empty:
                             # Verifikasi format data
                             if self._validate_and_fix_ohlcv(df, symbol, timeframe, "Redis"):
                                 logger.debug(f"Using cached OHLCV data for {symbol} {timeframe} from Redis")
@@ -228,7 +240,7 @@ class TradingBot:
                             else:
                                 logger.warning(f"Invalid OHLCV format from Redis for {symbol} {timeframe}")
                     except Exception as e:
-                        logger.error(f"Error getting OHLCV data from Redis: {e}")
+                        logger.error(f"Error validating OHLCV data from Redis: {e}")
                         df = None
 
                 # Jika tidak ada di Redis atau format tidak valid, ambil dari exchange
@@ -269,22 +281,19 @@ class TradingBot:
                 return False
 
             # Calculate technical indicators for each timeframe before analysis
+            # Timeframes are calculated concurrently on the strategy's pool
             ohlcv_data_with_indicators = {}
-            for tf, df in ohlcv_data.items():
-                try:
-                    # Calculate indicators using calculate_indicators method
-                    df_with_indicators = self.strategy.calculate_indicators(df, symbol, tf)
-                    if df_with_indicators is not None and not df_with_indicators.empty:
-                        # Ensure all required indicators are present
-                        required_indicators = ['close', 'bb_upper', 'bb_lower', 'bb_middle', 'ema', 'stoch_k', 'stoch_d']
-                        if all(indicator in df_with_indicators.columns for indicator in required_indicators):
-                            ohlcv_data_with_indicators[tf] = df_with_indicators
-                            logger.debug(f"Added indicators for {symbol} {tf}")
-                        else:
-                            missing = [ind for ind in required_indicators if ind not in df_with_indicators.columns]
-                            logger.error(f"Missing indicators for {symbol} {tf}: {missing}")
-                except Exception as e:
-                    logger.error(f"Error calculating indicators for {symbol} {tf}: {e}")
+            indicator_results = self.strategy.calculate_indicators_batch(ohlcv_data, symbol)
+            for tf, df_with_indicators in indicator_results.items():
+                if df_with_indicators is not None and not df_with_indicators.empty:
+                    # Ensure all required indicators are present
+                    required_indicators = ['close', 'bb_upper', 'bb_lower', 'bb_middle', 'ema', 'stoch_k', 'stoch_d']
+                    if all(indicator in df_with_indicators.columns for indicator in required_indicators):
+                        ohlcv_data_with_indicators[tf] = df_with_indicators
+                        logger.debug(f"Added indicators for {symbol} {tf}")
+                    else:
+                        missing = [ind for ind in required_indicators if ind not in df_with_indicators.columns]
+                        logger.error(f"Missing indicators for {symbol} {tf}: {missing}")
 
             # If no data with indicators, exit
             if not ohlcv_data_with_indicators:
@@ -366,7 +375,7 @@ class TradingBot:
 
                 # Calculate position size and get allocation info
                 position_size, allocation_info = self.strategy.calculate_position_size(
-                    available_balance, current_price, pair_config, TRADING_CONFIG
+                    available_balance, current_price, pair_config, self.allocation_policy
                 )
                 position_value = allocation_info.get('allocation_usdt', 0)
 
@@ -468,6 +477,17 @@ class TradingBot:
             logger.error(f"Unexpected type for active_trades: {type(active_trades)}")
             active_trades_items = []
 
+        # Fetch cached close prices for every open trade in one round trip
+        price_timeframes = ['1m', '5m', '15m', '1h']
+        cached_closes = {}
+        if active_trades_items and self.redis and self.redis.is_connected():
+            active_trades_items = list(active_trades_items)
+            cached_closes = self.redis.get_close_bulk([
+                (symbol, timeframe)
+                for symbol, _ in active_trades_items
+                for timeframe in price_timeframes
+            ])
+
         for symbol, trade_data in active_trades_items:
             entry_price = trade_data.get('entry_price')
             if not entry_price:
@@ -475,12 +495,12 @@ class TradingBot:
                 continue
             current_price = None
             # Try Redis first
-            if self.redis and self.redis.is_connected():
+            if cached_closes:
                 try:
-                    for timeframe in ['1m', '5m', '15m', '1h']:
-                        df = self.redis.get_ohlcv(symbol, timeframe)
-                        if df is not None and not df.empty:
-                            current_price = float(df.iloc[-1]['close'])
+                    for timeframe in price_timeframes:
+                        closes = cached_closes.get((symbol, timeframe))
+                        if closes is not None and len(closes):
+                            current_price = float(closes[-1])
                             logger.debug(f"[PATCH] Using cached price for {symbol} from Redis ({timeframe}): {current_price}")
                             break
                 except Exception as e:
@@ -633,8 +653,11 @@ class TradingBot:
         if self.redis and self.redis.is_connected():
             try:
                 import json
-                self.redis.redis.set("active_trades", json.dumps(active_trades))
-                self.redis.redis.expire("active_trades", 60 * 60 * 24)  # 1 day expiration
+                # 1 day expiration
+                self.redis.redis.set(
+                    "active_trades", json.dumps(active_trades),
+                    ex=self.redis.TTL_DAY
+                )
                 logger.debug("Saved active trades to Redis")
             except Exception as e:
                 logger.error(f"Error saving active trades to Redis: {e}")
@@ -853,6 +876,13 @@ class TradingBot:
         except Exception as e:
             logger.error(f"Error during final data sync: {e}")
 
+        # Stop the strategy's indicator worker threads
+        try:
+            if self.strategy:
+                self.strategy.close()
+        except Exception as e:
+            logger.error(f"Error closing strategy: {e}")
+
         # Close database connections
         try:
             if self.redis:
@@ -873,6 +903,7 @@ class TradingBot:
         if TELEGRAM_CONFIG["enabled"]:
             try:
                 await send_telegram_message("🔴 Trading bot shutdown")
+                await flush_telegram()
             except Exception as e:
                 logger.error(f"Error sending shutdown notification: {e}")
 
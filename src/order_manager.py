@@ -185,25 +185,34 @@ def close_position(
     """
     try:
         positions = exchange.fetch_positions([symbol])
-        for position in positions:
-            if (
-                position["side"] == position_side
-                and float(position["contracts"]) > 0
-            ):
-                side = "sell" if position_side == "long" else "buy"
-                exchange.create_order(
-                    symbol=symbol,
-                    type="MARKET",
-                    side=side,
-                    amount=float(position["contracts"]),
-                    params={"reduceOnly": True},
+        # First open position on the requested side, parsing contracts once
+        contracts = next(
+            (
+                amount
+                for amount in (
+                    float(p["contracts"])
+                    for p in positions
+                    if p["side"] == position_side
                 )
-                logging.info(
-                    f"Closed {position_side} position for {symbol}"
-                )
-                return True
+                if amount > 0
+            ),
+            None,
+        )
+        if contracts is None:
+            return False
 
-        return False
+        side = "sell" if position_side == "long" else "buy"
+        exchange.create_order(
+            symbol=symbol,
+            type="MARKET",
+            side=side,
+            amount=contracts,
+            params={"reduceOnly": True},
+        )
+        logging.info(
+            f"Closed {position_side} position for {symbol}"
+        )
+        return True
 
     except Exception as e:
         logging.error(
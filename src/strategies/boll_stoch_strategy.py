@@ -1,17 +1,74 @@
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional
-from ta.volatility import BollingerBands
-from ta.momentum import StochRSIIndicator, RSIIndicator
-from ta.trend import EMAIndicator
+from typing import Dict, List, Tuple, Any, Optional, Union
 
-from src.utils.error_handlers import handle_strategy_errors
+from src.strategies import indicator_kernels
+from src.utils.error_handlers import handle_strategy_errors, StrategyError
 from src.utils.structured_logger import get_logger
 
+__all__ = ["AllocationPolicy", "BollStochStrategy"]
+
 logger = get_logger(__name__)
 
+# Prefer the AOT-compiled kernel (scripts/build_indicators.py) to skip the
+# first-call JIT compile; fall back to the njit version when not built
+try:
+    from src.strategies._indicators_aot import indicators as compute_indicators
+except ImportError:
+    compute_indicators = indicator_kernels.indicators
+
+# Column order used when pulling the latest indicator row as one numpy
+# array instead of per-column ``.iloc[-1]`` lookups
+SIGNAL_COLUMNS = ["close", "bb_upper", "bb_lower", "bb_middle", "ema", "stoch_k", "stoch_d"]
+SELL_COLUMNS = ["close", "bb_upper", "ema", "stoch_k", "stoch_d"]
+
+# Indicator columns in the order they are laid out in the output buffer
+INDICATOR_COLUMNS = ["bb_upper", "bb_middle", "bb_lower", "ema", "stoch_k", "stoch_d"]
+
+
+@dataclass(frozen=True)
+class AllocationPolicy:
+    """Per-trade allocation settings resolved once from the trading config."""
+    allocation_pct: float = 0.2  # Default 20%
+    min_allocation: float = 10  # Default 10 USDT
+    max_allocation: float = 100  # Default 100 USDT
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "AllocationPolicy":
+        return cls(
+            allocation_pct=config.get("allocation_per_trade", 0.2),
+            min_allocation=config.get("min_allocation_usdt", 10),
+            max_allocation=config.get("max_allocation_usdt", 100),
+        )
+
+
+@dataclass(frozen=True)
+class _LastRowState:
+    """Indicator state after the last closed candle of a cached frame.
+
+    Enough to compute the indicators of the in-progress candle from its
+    close alone: the closes and RSI values still inside the rolling
+    windows, and the running EMA and Wilder averages.
+    """
+    closes: np.ndarray  # Last boll_window - 1 closed closes
+    last_close: float
+    ema: float
+    avg_gain: float
+    avg_loss: float
+    rsi: np.ndarray  # RSI of the closed bars the stochastic windows reach
+
 
 class BollStochStrategy:
+    """Bollinger Bands + EMA + Stochastic RSI multi-timeframe strategy"""
+
+    # Most (symbol, timeframe) indicator frames kept for reuse
+    MAX_CACHED = 128
+
     def __init__(
         self,
         boll_length: int = 20,
@@ -23,6 +80,7 @@ class BollStochStrategy:
         stoch_oversold: int = 20,
         stoch_overbought: int = 80,
         min_confidence: float = 0.6,
+        timeframes: Optional[List[str]] = None,
         **kwargs,  # Accept any additional parameters
     ):
         # Map config names to internal variable names
@@ -34,6 +92,19 @@ class BollStochStrategy:
         self.stoch_smooth_d = stoch_smooth_d
         self.stoch_oversold = stoch_oversold
         self.stoch_overbought = stoch_overbought
+        self.timeframes = timeframes or ["15m", "1h", "4h", "1d"]
+
+        # Timeframe durations in minutes, used to order timeframes
+        self._tf_minutes = {"15m": 15, "1h": 60, "4h": 240, "1d": 1440}
+
+        # Last closed candle each (symbol, timeframe) was computed for, the
+        # resulting DataFrame and, once a partial-candle poll needed it, the
+        # state to refresh its last row. Least recently used entries are
+        # evicted past MAX_CACHED
+        self._cached: "OrderedDict[Tuple[str, str], list]" = OrderedDict()
+
+        # Shared pool for computing indicators of all timeframes concurrently
+        self._pool = ThreadPoolExecutor(max_workers=len(self.timeframes))
 
     def _validate_price_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate and clean price data"""
@@ -46,7 +117,9 @@ class BollStochStrategy:
             if col not in df.columns:
                 continue
 
-            # Replace inf/-inf with NaN first
+            # Coerce to float64 so downstream numpy row reads stay numeric,
+            # then replace inf/-inf with NaN
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(np.float64)
             df[col] = df[col].replace([np.inf, -np.inf], np.nan)
 
             # Count NaN values before filling
@@ -61,12 +134,9 @@ class BollStochStrategy:
                 # For price columns, use forward fill then backward fill
                 if col in ['open', 'high', 'low', 'close']:
                     df[col] = df[col].ffill().bfill()
-                    # If still NaN, use previous close for OHLC
-                    if df[col].isna().any():
-                        if col == 'close':
-                            df[col] = df[col].fillna(method='ffill').fillna(method='bfill')
-                        else:
-                            df[col] = df[col].fillna(df['close'])
+                    # If still NaN, use close for open/high/low
+                    if col != 'close' and df[col].isna().any():
+                        df[col] = df[col].fillna(df['close'])
                 # For volume, fill with 0
                 elif col == 'volume':
                     df[col] = df[col].fillna(0)
@@ -78,6 +148,139 @@ class BollStochStrategy:
 
         return df
 
+    def _last_closed_ts(self, df: pd.DataFrame, timeframe: str) -> Optional[pd.Timestamp]:
+        """Get the timestamp of the most recent closed candle.
+
+        Returns the second to last timestamp when the last candle is
+        still in progress, or None if the index is not a DatetimeIndex.
+        """
+        if not isinstance(df.index, pd.DatetimeIndex) or len(df) < 2:
+            return None
+
+        last_ts = df.index[-1]
+        now = pd.Timestamp.now(tz="UTC")
+        if last_ts.tzinfo is None:
+            now = now.tz_localize(None)
+
+        candle_end = last_ts + pd.Timedelta(minutes=self._timeframe_minutes(timeframe))
+        return df.index[-2] if candle_end > now else last_ts
+
+    def _last_row_state(self, cached: pd.DataFrame) -> Optional[_LastRowState]:
+        """State after the last closed candle of cached, None if too short.
+
+        Runs one RSI pass over the closed candles, once per closed candle
+        rather than on every poll.
+        """
+        window, sk, sd = self.stoch_window, self.stoch_smooth_k, self.stoch_smooth_d
+        n = len(cached)
+        # The last row must be past every warmup, so the closed rows before
+        # it hold kernel output rather than seeded values
+        if n - 1 < max(self.boll_window, self.ema_window, 2 * (window - 1) + sk + sd - 1):
+            return None
+
+        closed = cached["close"].to_numpy(dtype=np.float64)[:-1]
+        rsi = np.empty_like(closed)
+        avg_gain, avg_loss = indicator_kernels.wilder_rsi(closed, window, rsi)
+        return _LastRowState(
+            closes=closed[len(closed) - (self.boll_window - 1):].copy(),
+            last_close=float(closed[-1]),
+            ema=float(cached["ema"].iat[-2]),
+            avg_gain=float(avg_gain),
+            avg_loss=float(avg_loss),
+            rsi=rsi[len(rsi) - (window + sk + sd - 3):].copy(),
+        )
+
+    def _last_row(self, state: _LastRowState, close: float) -> np.ndarray:
+        """Indicators of a candle closing at close after state's candles.
+
+        Follows the compiled kernels one bar further, in INDICATOR_COLUMNS
+        order, with NaN where they would give NaN.
+        """
+        window_closes = np.append(state.closes, close)
+        middle = window_closes.mean()
+        band = self.boll_std * window_closes.std()
+
+        alpha = 2.0 / (self.ema_window + 1)
+        ema = alpha * close + (1.0 - alpha) * state.ema
+
+        change = close - state.last_close
+        alpha = 1.0 / self.stoch_window
+        avg_gain = state.avg_gain + alpha * (max(change, 0.0) - state.avg_gain)
+        avg_loss = state.avg_loss + alpha * (max(-change, 0.0) - state.avg_loss)
+        rsi = np.append(
+            state.rsi, 100.0 if avg_loss == 0.0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        )
+
+        # Stochastic of each bar the %K and %D averages reach, then the two
+        # moving averages; NaN in any window carries through like the kernel
+        window, sk, sd = self.stoch_window, self.stoch_smooth_k, self.stoch_smooth_d
+        stoch = np.empty(sk + sd - 1)
+        for j in range(len(stoch)):
+            values = rsi[j:j + window]
+            lowest = values.min()
+            spread = values.max() - lowest
+            stoch[j] = 100.0 * (values[-1] - lowest) / spread if spread > 0.0 else np.nan
+        k = np.array([stoch[j:j + sk].mean() for j in range(sd)])
+
+        return np.array([middle + band, middle, middle - band, ema, k[-1], k.mean()])
+
+    def _refresh_last_row(self, entry: list, df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """Cached indicators with the in-progress candle taken from df.
+
+        The closed candles are unchanged, so only the last row is updated,
+        in place, from state carried over the closed candles: no pass over
+        the full history and no copy of the frame. Returns None when ``df``
+        does not line up with the cached frame or its last candle needs the
+        cleaning of a full pass.
+        """
+        cached = entry[1]
+        if len(df) != len(cached) or df.index[-1] != cached.index[-1]:
+            return None
+
+        price_cols = [
+            col for col in ("open", "high", "low", "close", "volume")
+            if col in df.columns and col in cached.columns
+        ]
+        if "close" not in price_cols:
+            return None
+        try:
+            prices = df[price_cols].iloc[-1].to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        close = prices[price_cols.index("close")]
+        if not np.isfinite(prices).all() or close <= 0:
+            return None
+
+        if entry[2] is None:
+            entry[2] = self._last_row_state(cached)
+            if entry[2] is None:
+                return None
+        row = self._last_row(entry[2], close)
+        if np.isnan(row).any() or row[0] <= row[2]:
+            return None
+        np.clip(row[4:], 0, 100, out=row[4:])
+
+        columns = cached.columns.get_indexer(price_cols + INDICATOR_COLUMNS)
+        cached.iloc[-1, columns] = np.concatenate([prices, row])
+        return self._attach_arrays(cached)
+
+    def invalidate(self, timeframe: Optional[str] = None, symbol: Optional[str] = None):
+        """Drop cached indicator results so the next call recomputes.
+
+        Args:
+            timeframe: Only drop entries for this timeframe (all if None)
+            symbol: Only drop entries for this symbol (all if None)
+        """
+        for key in list(self._cached):
+            if (symbol is None or key[0] == symbol) and (
+                timeframe is None or key[1] == timeframe
+            ):
+                self._cached.pop(key, None)
+
+    def close(self):
+        """Shut down the thread pool used to compute timeframes concurrently."""
+        self._pool.shutdown()
+
     @handle_strategy_errors(notify=True)
     def calculate_indicators(self, df: pd.DataFrame, symbol: str = "", timeframe: str = "") -> pd.DataFrame:
         """Calculate all technical indicators for the strategy.
@@ -96,6 +299,24 @@ class BollStochStrategy:
             )
             return df
 
+        # Skip recomputation while only the in-progress candle changes
+        cache_key = (symbol, timeframe)
+        closed_ts = None
+        if symbol and timeframe:
+            closed_ts = self._last_closed_ts(df, timeframe)
+            cached = self._cached.get(cache_key)
+            if closed_ts is not None and cached is not None and cached[0] == closed_ts:
+                refreshed = self._refresh_last_row(cached, df)
+                if refreshed is not None:
+                    self._cached.move_to_end(cache_key)
+                    logger.debug(
+                        "Reusing indicators computed for the last closed candle",
+                        symbol=symbol,
+                        timeframe=timeframe,
+                        closed_ts=str(closed_ts),
+                    )
+                    return refreshed
+
         # Validate and clean price data first
         try:
             df = self._validate_price_data(df)
@@ -172,116 +393,68 @@ class BollStochStrategy:
                 valid_ratio=valid_data_ratio
             )
 
+        # Preallocate one float64 buffer for all indicator columns and
+        # assign it to the frame in a single vectorized set
+        close = df["close"]
+        close_arr = close.to_numpy(dtype=np.float64)
+        n = len(df)
+        out = np.empty((n, len(INDICATOR_COLUMNS)), dtype=np.float64)
+
         # Calculate indicators with error handling
         try:
-            # Bollinger Bands with NaN handling
-            bb = BollingerBands(
-                close=df["close"],
-                window=self.boll_window,
-                window_dev=self.boll_std,
-            )
-
-            # Calculate bands with error handling
-            df["bb_middle"] = bb.bollinger_mavg()
-            df["bb_upper"] = bb.bollinger_hband()
-            df["bb_lower"] = bb.bollinger_lband()
-
-            # EMA with error handling
-            try:
-                ema = EMAIndicator(close=df["close"], window=self.ema_window)
-                df["ema"] = ema.ema_indicator()
-            except Exception as e:
-                logger.error(f"Error calculating EMA: {e}")
-                df["ema"] = df["close"].rolling(window=self.ema_window, min_periods=1).mean()
-
-            # Stochastic RSI with error handling
-            try:
-                stoch = StochRSIIndicator(
-                    close=df["close"],
-                    window=self.stoch_window,
-                    smooth1=self.stoch_smooth_k,
-                    smooth2=self.stoch_smooth_d,
-                )
-                df["stoch_k"] = stoch.stochrsi_k()
-                df["stoch_d"] = stoch.stochrsi_d()
-            except Exception as e:
-                logger.error(f"Error calculating Stochastic RSI: {e}")
-                # Fallback to simple RSI if Stochastic fails
-                from ta.momentum import RSIIndicator
-                rsi = RSIIndicator(close=df["close"], window=self.stoch_window)
-                df["stoch_k"] = df["stoch_d"] = rsi.rsi()
+            # Bollinger Bands, EMA and Stochastic RSI in one compiled call
+            compute_indicators(close_arr, out, *self._kernel_params())
         except Exception as e:
             logger.critical(f"Critical error in indicator calculation: {e}")
             # If all else fails, use simple moving averages
-            df["bb_middle"] = df["close"].rolling(window=self.boll_window, min_periods=1).mean()
-            df["bb_upper"] = df["bb_middle"] + df["close"].rolling(window=self.boll_window, min_periods=1).std() * self.boll_std
-            df["bb_lower"] = df["bb_middle"] - df["close"].rolling(window=self.boll_window, min_periods=1).std() * self.boll_std
-            df["ema"] = df["close"].ewm(span=self.ema_window, min_periods=1).mean()
+            rolling = close.rolling(window=self.boll_window, min_periods=1)
+            middle = rolling.mean().to_numpy()
+            band = rolling.std().to_numpy() * self.boll_std
+            out[:, 0] = middle + band
+            out[:, 1] = middle
+            out[:, 2] = middle - band
+            out[:, 3] = close.ewm(span=self.ema_window, min_periods=1).mean().to_numpy()
 
             # Simple RSI as fallback
-            delta = df["close"].diff()
+            delta = close.diff()
             gain = (delta.where(delta > 0, 0)).rolling(window=self.stoch_window).mean()
             loss = (-delta.where(delta < 0, 0)).rolling(window=self.stoch_window).mean()
             rs = gain / loss
             rsi = 100 - (100 / (1 + rs))
-            df["stoch_k"] = df["stoch_d"] = rsi
-
-        # Define indicator columns for validation
-        indicator_columns = ["bb_upper", "bb_middle", "bb_lower", "ema", "stoch_k", "stoch_d"]
-
-        # Handle NaN values in each indicator column
-        for col in indicator_columns:
-            if col not in df.columns:
-                # If column is missing, create it with close price as fallback
-                df[col] = df["close"]
-                logger.warning(f"Missing indicator column: {col}, using close price as fallback")
-                continue
-
-            # Replace infinite values
-            df[col] = df[col].replace([np.inf, -np.inf], np.nan)
-
-            # Count NaN values before filling
-            nan_count = df[col].isna().sum()
-            if nan_count > 0:
-                logger.debug(
-                    f"Filling {nan_count} NaN values in {col}",
-                    column=col,
-                    nan_count=nan_count
-                )
-
-                # Special handling for different indicator types
-                if col in ["bb_upper", "bb_lower"]:
-                    # For Bollinger Bands, use a percentage of close price
-                    multiplier = 1.02 if col == "bb_upper" else 0.98
-                    df[col] = df[col].fillna(df["close"] * multiplier)
-                elif col == "bb_middle":
-                    # For middle band, use close price or SMA
-                    df[col] = df[col].fillna(df["close"].rolling(window=self.boll_window, min_periods=1).mean())
-                elif col == "ema":
-                    # For EMA, use close price or SMA
-                    df[col] = df[col].fillna(df["close"].ewm(span=self.ema_window, min_periods=1).mean())
-                elif col in ["stoch_k", "stoch_d"]:
-                    # For oscillators, use 50 as neutral value
-                    df[col] = df[col].fillna(50)
-
-        # Final validation - ensure no NaN values remain
-        remaining_nan = {col: df[col].isna().sum() for col in indicator_columns}
-        if any(remaining_nan.values()):
+            out[:, 4] = out[:, 5] = rsi.to_numpy()
+
+        # Seed the warmup rows directly in the buffer instead of NaN-filling
+        # each column afterwards; later gaps are caught by the final check
+        boll_warmup = min(self.boll_window - 1, n)
+        ema_warmup = min(self.ema_window - 1, n)
+        stoch_k_warmup = min(2 * (self.stoch_window - 1) + self.stoch_smooth_k - 1, n)
+        stoch_d_warmup = min(stoch_k_warmup + self.stoch_smooth_d - 1, n)
+        out[:boll_warmup, 0] = close_arr[:boll_warmup] * 1.02
+        out[:boll_warmup, 1] = close_arr[:boll_warmup]
+        out[:boll_warmup, 2] = close_arr[:boll_warmup] * 0.98
+        out[:ema_warmup, 3] = close_arr[:ema_warmup]
+        out[:stoch_k_warmup, 4] = 50.0
+        out[:stoch_d_warmup, 5] = 50.0
+        out[np.isinf(out)] = np.nan
+
+        # Final validation - ensure no NaN values remain, using one pass
+        # over the buffer instead of an isna() scan per column
+        nan_any = np.isnan(out).any(axis=0)
+        if nan_any.any():
+            nan_columns = [col for col, has_nan in zip(INDICATOR_COLUMNS, nan_any) if has_nan]
             logger.warning(
-                f"Remaining NaN values after filling: {remaining_nan}",
-                remaining_nan=remaining_nan
+                f"Remaining NaN values after filling in: {nan_columns}",
+                nan_columns=nan_columns
             )
             # Last resort: fill with close price or 50 for oscillators
-            for col in indicator_columns:
-                if df[col].isna().any():
-                    if col in ["stoch_k", "stoch_d"]:
-                        df[col] = df[col].fillna(50)
-                    else:
-                        df[col] = df[col].fillna(df["close"])
+            for idx in np.flatnonzero(nan_any):
+                gaps = np.isnan(out[:, idx])
+                out[gaps, idx] = 50.0 if INDICATOR_COLUMNS[idx].startswith("stoch") else close_arr[gaps]
 
         # Ensure all indicators are within valid ranges
-        df["stoch_k"] = df["stoch_k"].clip(0, 100)
-        df["stoch_d"] = df["stoch_d"].clip(0, 100)
+        np.clip(out[:, 4:], 0, 100, out=out[:, 4:])
+
+        df[INDICATOR_COLUMNS] = out
 
         # Ensure Bollinger Bands make logical sense
         mask = df["bb_upper"] <= df["bb_lower"]
@@ -293,16 +466,24 @@ class BollStochStrategy:
             df.loc[mask, "bb_upper"] = df.loc[mask, "bb_middle"] + (df.loc[mask, "bb_middle"] - df.loc[mask, "bb_lower"])
 
             # Final check
-            final_nan = {col: df[col].isna().sum() for col in indicator_columns}
-            if sum(final_nan.values()) > 0:
+            final_nan = np.isnan(df[INDICATOR_COLUMNS].to_numpy()).sum(axis=0)
+            if final_nan.any():
                 logger.critical(
                     "CRITICAL: Still have NaN values after aggressive filling",
-                    final_nan=final_nan
+                    final_nan=dict(zip(INDICATOR_COLUMNS, final_nan.tolist()))
                 )
                 # As absolute last resort, drop rows, but log this as a critical issue
-                df = df.dropna(subset=indicator_columns)
+                df = df.dropna(subset=INDICATOR_COLUMNS)
                 logger.warning(f"Dropped rows with NaN values, {len(df)} rows remaining")
 
+        self._attach_arrays(df)
+
+        if closed_ts is not None:
+            self._cached[cache_key] = [closed_ts, df, None]
+            self._cached.move_to_end(cache_key)
+            while len(self._cached) > self.MAX_CACHED:
+                self._cached.popitem(last=False)
+
         # Save indicators to Redis if symbol and timeframe are provided
         if symbol and timeframe:
             try:
@@ -322,7 +503,97 @@ class BollStochStrategy:
 
         return df
 
+    def _kernel_params(self) -> Tuple[int, float, int, int, int, int]:
+        """Indicator settings in the argument order the kernels expect."""
+        return (
+            int(self.boll_window),
+            float(self.boll_std),
+            int(self.ema_window),
+            int(self.stoch_window),
+            int(self.stoch_smooth_k),
+            int(self.stoch_smooth_d),
+        )
+
+    def calculate_indicators_multi(
+        self, closes: Union[np.ndarray, List[np.ndarray]]
+    ) -> np.ndarray:
+        """Calculate indicators for many symbols in one parallel kernel call.
+
+        Args:
+            closes: Close price histories, either a (N, T) array or a list
+                of 1-D arrays. Shorter histories are left-padded with NaN.
+
+        Returns:
+            Array of shape (N, T, 6) with columns in INDICATOR_COLUMNS
+            order; padded and warmup bars are NaN.
+        """
+        if isinstance(closes, np.ndarray) and closes.ndim == 2:
+            stacked = np.ascontiguousarray(closes, dtype=np.float64)
+        else:
+            length = max((len(c) for c in closes), default=0)
+            stacked = np.full((len(closes), length), np.nan)
+            for i, c in enumerate(closes):
+                if len(c):
+                    stacked[i, length - len(c):] = c
+
+        out = np.empty(stacked.shape + (len(INDICATOR_COLUMNS),), dtype=np.float64)
+        indicator_kernels.indicators_batch(stacked, out, *self._kernel_params())
+        return out
+
+    def calculate_indicators_batch(
+        self, tf_data: Dict[str, pd.DataFrame], symbol: str = ""
+    ) -> Dict[str, pd.DataFrame]:
+        """Calculate indicators for several timeframes concurrently.
+
+        Args:
+            tf_data: Mapping of timeframe to OHLCV DataFrame
+            symbol: Trading pair symbol (for Redis caching)
+
+        Returns:
+            Mapping of timeframe to DataFrame with indicators added.
+            Timeframes whose calculation failed are omitted.
+        """
+        futures = {
+            self._pool.submit(self.calculate_indicators, df, symbol, tf): tf
+            for tf, df in tf_data.items()
+        }
+
+        results = {}
+        for future in as_completed(futures):
+            tf = futures[future]
+            try:
+                results[tf] = future.result()
+            except Exception as e:
+                logger.error(
+                    f"Error calculating indicators for {symbol} {tf}: {e}",
+                    symbol=symbol,
+                    timeframe=tf,
+                )
+
+        # Preserve the caller's timeframe order
+        return {tf: results[tf] for tf in tf_data if tf in results}
+
     @handle_strategy_errors(notify=False)
+    def _buy_conditions(self, row: np.ndarray) -> Dict[str, bool]:
+        """Long-entry conditions of a SIGNAL_COLUMNS row, by name, for logging."""
+        price, _, bb_lower, _, ema, stoch_k, stoch_d = row
+        return {
+            "price_below_bb_lower": price < bb_lower,
+            "price_above_ema": price > ema,
+            "stoch_oversold": stoch_k < self.stoch_oversold,
+            "stoch_crossover": stoch_k > stoch_d
+        }
+
+    def _sell_conditions(self, row: np.ndarray) -> Dict[str, bool]:
+        """Short/exit conditions of a SIGNAL_COLUMNS row, by name, for logging."""
+        price, bb_upper, _, _, ema, stoch_k, stoch_d = row
+        return {
+            "price_above_bb_upper": price > bb_upper,
+            "price_below_ema": price < ema,
+            "stoch_overbought": stoch_k > self.stoch_overbought,
+            "stoch_crossunder": stoch_k < stoch_d
+        }
+
     def analyze_signals(
         self, timeframe_data: Dict[str, pd.DataFrame]
     ) -> Tuple[str, float, Dict[str, float]]:
@@ -338,14 +609,19 @@ class BollStochStrategy:
             logger.warning("No timeframe data available for signal analysis")
             return "neutral", 0.0, {"stop_loss": 0.0, "take_profit": 0.0}
 
-        logger.debug(
-            f"Analyzing signals across {len(available_timeframes)} available timeframes",
-            timeframes=available_timeframes,
-        )
+        # Skip building debug messages when DEBUG logging is off
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"Analyzing signals across {len(available_timeframes)} available timeframes",
+                timeframes=available_timeframes,
+            )
 
         # Track conditions for each timeframe for better debugging
         timeframe_conditions = {}
 
+        # Collect the latest indicator row of every usable timeframe
+        latest_rows = {}
         for tf in available_timeframes:
             if tf not in timeframe_data:
                 continue
@@ -359,14 +635,30 @@ class BollStochStrategy:
                 )
                 continue
 
-            # Get latest values
-            current_price = df["close"].iloc[-1]
-            bb_upper = df["bb_upper"].iloc[-1]
-            bb_lower = df["bb_lower"].iloc[-1]
-            bb_middle = df["bb_middle"].iloc[-1]  # Added for reference
-            ema = df["ema"].iloc[-1]
-            stoch_k = df["stoch_k"].iloc[-1]
-            stoch_d = df["stoch_d"].iloc[-1]
+            # Get latest values in a single numpy read
+            latest_rows[tf] = df[SIGNAL_COLUMNS].to_numpy()[-1]
+
+        # Count met buy/sell conditions for all timeframes in one call each
+        if latest_rows:
+            latest = np.array(list(latest_rows.values()), dtype=np.float64)
+            prices, uppers, lowers, _, emas, ks, ds = latest.T
+            buy_counts = indicator_kernels.buy_conditions_met(
+                prices, lowers, emas, ks, ds, float(self.stoch_oversold)
+            )
+            sell_counts = indicator_kernels.sell_conditions_met(
+                prices, uppers, emas, ks, ds, float(self.stoch_overbought)
+            )
+
+        for i, (tf, row) in enumerate(latest_rows.items()):
+            (
+                current_price,
+                bb_upper,
+                bb_lower,
+                bb_middle,
+                ema,
+                stoch_k,
+                stoch_d,
+            ) = row
 
             # Calculate distances and percentages for better context
             bb_upper_distance = ((bb_upper - current_price) / current_price) * 100
@@ -397,32 +689,17 @@ class BollStochStrategy:
                 "price_below_ema": current_price < ema,
             }
 
-            logger.debug(
-                f"Indicators for {tf}",
-                timeframe=tf,
-                **timeframe_conditions[tf]
-            )
-
-            # Signal conditions
-            # Long signal
-            buy_conditions = {
-                "price_below_bb_lower": current_price < bb_lower,
-                "price_above_ema": current_price > ema,
-                "stoch_oversold": stoch_k < self.stoch_oversold,
-                "stoch_crossover": stoch_k > stoch_d
-            }
-
-            # Short signal
-            sell_conditions = {
-                "price_above_bb_upper": current_price > bb_upper,
-                "price_below_ema": current_price < ema,
-                "stoch_overbought": stoch_k > self.stoch_overbought,
-                "stoch_crossunder": stoch_k < stoch_d
-            }
+            if debug:
+                logger.debug(
+                    f"Indicators for {tf}",
+                    timeframe=tf,
+                    **timeframe_conditions[tf]
+                )
 
-            # Check if at least 3 of 4 buy conditions are met (more flexible approach)
-            buy_conditions_met = sum(buy_conditions.values())
-            sell_conditions_met = sum(sell_conditions.values())
+            # Check if at least 3 of 4 buy conditions are met (more flexible approach).
+            # The per-condition dicts are only built for the logs that show them
+            buy_conditions_met = int(buy_counts[i])
+            sell_conditions_met = int(sell_counts[i])
 
             if buy_conditions_met >= 3:  # At least 3 of 4 conditions
                 tf_weight = self._get_timeframe_weight(tf)
@@ -435,7 +712,7 @@ class BollStochStrategy:
                     weight=adjusted_weight,
                     original_weight=tf_weight,
                     conditions_met=buy_conditions_met,
-                    conditions=buy_conditions,
+                    conditions=self._buy_conditions(row),
                     price=current_price,
                     bb_lower=bb_lower,
                     stoch_k=stoch_k,
@@ -453,28 +730,30 @@ class BollStochStrategy:
                     weight=adjusted_weight,
                     original_weight=tf_weight,
                     conditions_met=sell_conditions_met,
-                    conditions=sell_conditions,
+                    conditions=self._sell_conditions(row),
                     price=current_price,
                     bb_upper=bb_upper,
                     stoch_k=stoch_k,
                     stoch_d=stoch_d
                 )
-            else:
+            elif debug:
                 # Log which conditions were not met for debugging
-                if any(buy_conditions.values()):
+                if buy_conditions_met:
+                    buy_conditions = self._buy_conditions(row)
                     met_buy = {k: v for k, v in buy_conditions.items() if v}
                     failed_buy = {k: v for k, v in buy_conditions.items() if not v}
                     logger.debug(
-                        f"Insufficient buy conditions in {tf} ({sum(buy_conditions.values())}/4 met)",
+                        f"Insufficient buy conditions in {tf} ({buy_conditions_met}/4 met)",
                         timeframe=tf,
                         met_conditions=met_buy,
                         failed_conditions=failed_buy
                     )
-                if any(sell_conditions.values()):
+                if sell_conditions_met:
+                    sell_conditions = self._sell_conditions(row)
                     met_sell = {k: v for k, v in sell_conditions.items() if v}
                     failed_sell = {k: v for k, v in sell_conditions.items() if not v}
                     logger.debug(
-                        f"Insufficient sell conditions in {tf} ({sum(sell_conditions.values())}/4 met)",
+                        f"Insufficient sell conditions in {tf} ({sell_conditions_met}/4 met)",
                         timeframe=tf,
                         met_conditions=met_sell,
                         failed_conditions=failed_sell
@@ -523,27 +802,54 @@ class BollStochStrategy:
         levels = self._calculate_risk_levels(
             signal,
             # Use the shortest available timeframe's data for levels, or handle missing data
-            timeframe_data.get(min(available_timeframes, key=lambda x: pd.Timedelta(x)), pd.DataFrame()),
+            timeframe_data.get(
+                min(available_timeframes, key=self._timeframe_minutes), pd.DataFrame()
+            ),
             confidence,
         )
 
         return signal, confidence, levels
 
+    @staticmethod
+    def _attach_arrays(df: pd.DataFrame) -> pd.DataFrame:
+        """Cache numpy views of close/high/low in ``df.attrs``.
+
+        Called once per freshly calculated frame so the risk-level step
+        can read scalars without pandas indexing.
+        """
+        df.attrs["_arrays"] = {
+            col: df[col].to_numpy() for col in ("close", "high", "low") if col in df.columns
+        }
+        return df
+
+    def _timeframe_minutes(self, timeframe: str) -> float:
+        """Get timeframe duration in minutes, parsing unknown strings."""
+        minutes = self._tf_minutes.get(timeframe)
+        if minutes is None:
+            minutes = pd.Timedelta(timeframe).total_seconds() / 60
+        return minutes
+
     def _get_timeframe_weight(self, timeframe: str) -> float:
         """Get weight for timeframe importance."""
         weights = {"15m": 0.1, "1h": 0.3, "4h": 0.3, "1d": 0.3}
         weight = weights.get(timeframe, 0.1)  # Default to 0.1 for unknown timeframes
-        logger.debug(f"Timeframe weight for {timeframe}: {weight}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Timeframe weight for {timeframe}: {weight}")
         return weight
 
     def _calculate_risk_levels(
         self, signal: str, df: pd.DataFrame, confidence: float
     ) -> Dict[str, float]:
         """Calculate stop loss and take profit levels."""
-        current_price = df["close"].iloc[-1]
-        atr = (
-            df["high"].iloc[-1] - df["low"].iloc[-1]
-        )  # Simple volatility measure
+        arrays = df.attrs.get("_arrays")
+        if arrays is not None and len(arrays["close"]) == len(df):
+            current_price = arrays["close"][-1]
+            atr = arrays["high"][-1] - arrays["low"][-1]  # Simple volatility measure
+        else:
+            current_price = df["close"].iloc[-1]
+            atr = (
+                df["high"].iloc[-1] - df["low"].iloc[-1]
+            )  # Simple volatility measure
 
         if signal == "buy":
             stop_loss = current_price - (atr * 2)
@@ -554,6 +860,8 @@ class BollStochStrategy:
         else:
             stop_loss = take_profit = 0.0
 
+        return {"stop_loss": float(stop_loss), "take_profit": float(take_profit)}
+
     @handle_strategy_errors(notify=False)
     def should_sell(self, df: pd.DataFrame) -> Tuple[bool, float]:
         """
@@ -582,20 +890,10 @@ class BollStochStrategy:
                 else:
                     return False, 0.0
 
-            # Get the latest values with fallbacks
-            latest = df.iloc[-1]
-            prev = df.iloc[-2]
-
-            # Get indicator values with fallbacks
-            close = latest['close']
-            bb_upper = latest.get('bb_upper', close * 1.02)  # Default 2% above
-            ema = latest.get('ema', close)  # Fallback to close price
-            stoch_k = latest.get('stoch_k', 50)  # Neutral value if missing
-            stoch_d = latest.get('stoch_d', 50)  # Neutral value if missing
-
-            # Safely get previous values
-            prev_stoch_k = prev.get('stoch_k', stoch_k)
-            prev_stoch_d = prev.get('stoch_d', stoch_d)
+            # Get the latest two rows in a single numpy read
+            prev, latest = df[SELL_COLUMNS].to_numpy()[-2:]
+            close, bb_upper, ema, stoch_k, stoch_d = latest
+            prev_stoch_k, prev_stoch_d = prev[3], prev[4]
 
             # Check sell conditions
             conditions = [
@@ -609,16 +907,17 @@ class BollStochStrategy:
             # Calculate confidence based on conditions met
             confidence = sum(conditions) / len(conditions) if conditions else 0.0
 
-            logger.debug(
-                "Sell conditions check",
-                close=close,
-                bb_upper=bb_upper,
-                ema=ema,
-                stoch_k=stoch_k,
-                stoch_d=stoch_d,
-                conditions_met=sum(conditions),
-                confidence=confidence
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Sell conditions check",
+                    close=close,
+                    bb_upper=bb_upper,
+                    ema=ema,
+                    stoch_k=stoch_k,
+                    stoch_d=stoch_d,
+                    conditions_met=sum(conditions),
+                    confidence=confidence
+                )
 
             return any(conditions), confidence
 
@@ -626,8 +925,8 @@ class BollStochStrategy:
             logger.error(f"Error in should_sell: {e}", exc_info=True)
             return False, 0.0
 
-    @handle_strategy_errors(notify=False)
-    def calculate_pnl(self, entry_price: float, current_price: float) -> float:
+    @staticmethod
+    def calculate_pnl(entry_price: float, current_price: float) -> float:
         """Calculate profit/loss for a trade
 
         Args:
@@ -636,33 +935,34 @@ class BollStochStrategy:
 
         Returns:
             float: Profit/loss percentage
+
+        Raises:
+            StrategyError: If either price is not positive
         """
-        if not current_price or not entry_price:
-            logger.warning(
-                "Invalid prices for PnL calculation",
-                entry_price=entry_price,
-                current_price=current_price,
+        if entry_price <= 0.0 or current_price <= 0.0:
+            raise StrategyError(
+                f"Invalid prices for PnL calculation: entry={entry_price}, "
+                f"current={current_price}"
             )
-            return 0.0
 
-        pnl = ((current_price - entry_price) / entry_price) * 100
+        pnl = (current_price - entry_price) / entry_price * 100
 
-        logger.debug(
-            "PnL calculated",
-            entry_price=entry_price,
-            current_price=current_price,
-            pnl=f"{pnl:.2f}%",
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "PnL calculated",
+                entry_price=entry_price,
+                current_price=current_price,
+                pnl=f"{pnl:.2f}%",
+            )
 
         return pnl
 
-    @handle_strategy_errors(notify=False)
+    @staticmethod
     def calculate_position_size(
-        self,
         balance: float,
         current_price: float,
         pair_config: Dict[str, Any],
-        trading_config: Dict[str, Any],
+        trading_config: Union[AllocationPolicy, Dict[str, Any]],
     ) -> Tuple[float, Dict[str, Any]]:
         """Calculate position size based on balance and allocation settings
 
@@ -670,37 +970,38 @@ class BollStochStrategy:
             balance (float): Available balance in USDT
             current_price (float): Current price of the asset
             pair_config (Dict[str, Any]): Trading pair configuration
-            trading_config (Dict[str, Any]): Trading configuration
+            trading_config (AllocationPolicy): Resolved allocation policy;
+                a raw trading config dict is resolved on the fly
 
         Returns:
             Tuple[float, Dict[str, Any]]: (quantity, allocation_info)
+
+        Raises:
+            StrategyError: If the current price is not positive
         """
-        # Get allocation settings
-        allocation_pct = trading_config.get(
-            "allocation_per_trade", 0.2
-        )  # Default 20%
-        min_allocation = trading_config.get(
-            "min_allocation_usdt", 10
-        )  # Default 10 USDT
-        max_allocation = trading_config.get(
-            "max_allocation_usdt", 100
-        )  # Default 100 USDT
+        if current_price <= 0.0:
+            raise StrategyError(f"Invalid price for position sizing: {current_price}")
 
-        logger.debug(
-            "Calculating position size",
-            balance=balance,
-            price=current_price,
-            allocation_pct=allocation_pct,
-            min_allocation=min_allocation,
-            max_allocation=max_allocation,
-        )
+        policy = trading_config
+        if not isinstance(policy, AllocationPolicy):
+            policy = AllocationPolicy.from_dict(policy)
+        allocation_pct = policy.allocation_pct
+        max_allocation = policy.max_allocation
 
-        # Calculate allocation amount
-        allocation = balance * allocation_pct
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Calculating position size",
+                balance=balance,
+                price=current_price,
+                allocation_pct=allocation_pct,
+                min_allocation=policy.min_allocation,
+                max_allocation=max_allocation,
+            )
 
-        # Apply min/max limits
-        original_allocation = allocation
-        allocation = max(min(allocation, max_allocation), min_allocation)
+        # Calculate allocation amount and apply min/max limits
+        original_allocation = balance * allocation_pct
+        allocation = max(min(original_allocation, max_allocation), policy.min_allocation)
 
         if allocation != original_allocation:
             logger.info(
@@ -710,14 +1011,12 @@ class BollStochStrategy:
                 reason="min_max_limits",
             )
 
-        # Calculate quantity
+        # Calculate quantity and round to required precision
         quantity = allocation / current_price
-
-        # Round to required precision
         precision = pair_config["quantity_precision"]
         rounded_quantity = round(quantity, precision)
 
-        if rounded_quantity != quantity:
+        if debug and rounded_quantity != quantity:
             logger.debug(
                 "Rounded quantity to required precision",
                 original=quantity,
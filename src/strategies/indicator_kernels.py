@@ -0,0 +1,378 @@
+"""
+Numba-compiled kernels for the strategy indicators
+"""
+
+import numpy as np
+from numba import njit, prange, vectorize
+
+
+@njit(cache=True, nogil=True)
+def ema(close: np.ndarray, window: int, out: np.ndarray) -> None:
+    """Exponential moving average written into ``out``.
+
+    Uses the recursive form ``y[i] = a * x[i] + (1 - a) * y[i - 1]``
+    seeded with ``close[0]``, matching pandas ``ewm(adjust=False)``.
+
+    Args:
+        close: Close prices
+        window: EMA span
+        out: Output array with the same length as ``close``
+    """
+    n = close.shape[0]
+    if n == 0:
+        return
+
+    alpha = 2.0 / (window + 1)
+    prev = close[0]
+    out[0] = prev
+    for i in range(1, n):
+        prev = alpha * close[i] + (1.0 - alpha) * prev
+        out[i] = prev
+
+
+@njit(cache=True, nogil=True)
+def rolling_min_max(
+    values: np.ndarray, window: int, out_min: np.ndarray, out_max: np.ndarray
+) -> None:
+    """Rolling minimum and maximum using monotonic deques.
+
+    Each deque is a ring buffer of indices holding at most ``window``
+    entries, giving amortised O(1) work per value. Outputs are NaN
+    until ``window`` consecutive non-NaN values have been seen, like
+    pandas ``rolling(window).min()`` / ``.max()``.
+
+    Args:
+        values: Input series
+        window: Rolling window length
+        out_min: Output array for the rolling minimum
+        out_max: Output array for the rolling maximum
+    """
+    n = values.shape[0]
+    min_q = np.empty(window, dtype=np.int64)
+    max_q = np.empty(window, dtype=np.int64)
+    min_head = 0
+    min_len = 0
+    max_head = 0
+    max_len = 0
+    valid = 0
+
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            # Restart the window after a gap
+            min_len = 0
+            max_len = 0
+            valid = 0
+            out_min[i] = np.nan
+            out_max[i] = np.nan
+            continue
+        valid += 1
+
+        # Drop the index that slid out of the window
+        if min_len > 0 and min_q[min_head] <= i - window:
+            min_head = (min_head + 1) % window
+            min_len -= 1
+        if max_len > 0 and max_q[max_head] <= i - window:
+            max_head = (max_head + 1) % window
+            max_len -= 1
+
+        # Drop values dominated by the new one, then push it
+        while min_len > 0 and values[min_q[(min_head + min_len - 1) % window]] >= x:
+            min_len -= 1
+        min_q[(min_head + min_len) % window] = i
+        min_len += 1
+
+        while max_len > 0 and values[max_q[(max_head + max_len - 1) % window]] <= x:
+            max_len -= 1
+        max_q[(max_head + max_len) % window] = i
+        max_len += 1
+
+        if valid >= window:
+            out_min[i] = values[min_q[min_head]]
+            out_max[i] = values[max_q[max_head]]
+        else:
+            out_min[i] = np.nan
+            out_max[i] = np.nan
+
+
+@njit(cache=True, nogil=True)
+def bollinger(
+    close: np.ndarray, window: int, num_std: float, out_upper: np.ndarray,
+    out_middle: np.ndarray, out_lower: np.ndarray
+) -> None:
+    """Bollinger Bands (SMA +/- population std), NaN during warmup.
+
+    Mean and sum of squared deviations are updated in O(1) per bar by
+    adding the newest close and removing the one that left the window
+    (Welford's update), so the cost does not depend on ``window``. The
+    window restarts after a NaN close.
+
+    Args:
+        close: Close prices
+        window: Moving average window
+        num_std: Band width in standard deviations
+        out_upper: Output array for the upper band
+        out_middle: Output array for the middle band
+        out_lower: Output array for the lower band
+    """
+    n = close.shape[0]
+    valid = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = close[i]
+        if np.isnan(x):
+            valid = 0
+            mean = 0.0
+            m2 = 0.0
+            out_upper[i] = np.nan
+            out_middle[i] = np.nan
+            out_lower[i] = np.nan
+            continue
+
+        if valid < window:
+            valid += 1
+            delta = x - mean
+            mean += delta / valid
+            m2 += delta * (x - mean)
+        else:
+            old = close[i - window]
+            new_mean = mean + (x - old) / window
+            m2 += (x - old) * (x - new_mean + old - mean)
+            mean = new_mean
+
+        if valid < window:
+            out_upper[i] = np.nan
+            out_middle[i] = np.nan
+            out_lower[i] = np.nan
+            continue
+        band = num_std * np.sqrt(max(m2 / window, 0.0))
+        out_upper[i] = mean + band
+        out_middle[i] = mean
+        out_lower[i] = mean - band
+
+
+@njit(cache=True, nogil=True)
+def stoch_rsi(
+    close: np.ndarray, window: int, smooth_k: int, smooth_d: int,
+    out_k: np.ndarray, out_d: np.ndarray
+) -> None:
+    """Stochastic RSI %K/%D (0-100) in a single fused pass.
+
+    RSI uses Wilder smoothing like ``ta``'s RSIIndicator (gains and
+    losses smoothed with ``ewm(alpha=1/window, adjust=False)`` from a
+    zero change on the first bar). Its rolling min/max come from
+    monotonic deques over a ring of the last ``window`` RSI values, and
+    %K/%D are moving averages over two more small rings, so
+    no full-length intermediate series is allocated. Warmup bars and flat
+    RSI windows are NaN.
+
+    Args:
+        close: Close prices
+        window: RSI and stochastic window
+        smooth_k: %K smoothing window
+        smooth_d: %D smoothing window
+        out_k: Output array for %K
+        out_d: Output array for %D
+    """
+    n = close.shape[0]
+    alpha = 1.0 / window
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    rsi_ring = np.empty(window)
+    min_q = np.empty(window, dtype=np.int64)
+    max_q = np.empty(window, dtype=np.int64)
+    min_head = 0
+    min_len = 0
+    max_head = 0
+    max_len = 0
+
+    k_ring = np.full(smooth_k, np.nan)
+    d_ring = np.full(smooth_d, np.nan)
+    k_nan = smooth_k
+    d_nan = smooth_d
+
+    for i in range(n):
+        if i > 0:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+
+        stoch = np.nan
+        if i >= window - 1:
+            if avg_loss == 0.0:
+                rsi = 100.0
+            else:
+                rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+            # Expire the index that slid out before reusing its ring slot
+            if min_len > 0 and min_q[min_head] <= i - window:
+                min_head = (min_head + 1) % window
+                min_len -= 1
+            if max_len > 0 and max_q[max_head] <= i - window:
+                max_head = (max_head + 1) % window
+                max_len -= 1
+            rsi_ring[i % window] = rsi
+
+            while (
+                min_len > 0
+                and rsi_ring[min_q[(min_head + min_len - 1) % window] % window] >= rsi
+            ):
+                min_len -= 1
+            min_q[(min_head + min_len) % window] = i
+            min_len += 1
+
+            while (
+                max_len > 0
+                and rsi_ring[max_q[(max_head + max_len - 1) % window] % window] <= rsi
+            ):
+                max_len -= 1
+            max_q[(max_head + max_len) % window] = i
+            max_len += 1
+
+            if i >= 2 * (window - 1):
+                lowest = rsi_ring[min_q[min_head] % window]
+                spread = rsi_ring[max_q[max_head] % window] - lowest
+                if spread > 0.0:
+                    stoch = 100.0 * (rsi - lowest) / spread
+
+        # Moving averages over each smoothing ring, NaN while any NaN is
+        # still inside the window. The rings are a few bars long, so each
+        # average is summed afresh: running add/subtract sums drift and
+        # leave e.g. -4e-14 where the value is exactly 0
+        slot = i % smooth_k
+        if np.isnan(k_ring[slot]):
+            k_nan -= 1
+        k_ring[slot] = stoch
+        if np.isnan(stoch):
+            k_nan += 1
+        k = np.sum(k_ring) / smooth_k if k_nan == 0 else np.nan
+        out_k[i] = k
+
+        slot = i % smooth_d
+        if np.isnan(d_ring[slot]):
+            d_nan -= 1
+        d_ring[slot] = k
+        if np.isnan(k):
+            d_nan += 1
+        out_d[i] = np.sum(d_ring) / smooth_d if d_nan == 0 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def wilder_rsi(close: np.ndarray, window: int, out: np.ndarray):
+    """Wilder RSI as computed inside ``stoch_rsi``, NaN before bar window - 1.
+
+    Args:
+        close: Close prices
+        window: RSI window
+        out: Output array with the same length as ``close``
+
+    Returns:
+        The smoothed average gain and loss after the last bar, the state
+        needed to extend the series by one more close
+    """
+    n = close.shape[0]
+    alpha = 1.0 / window
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(n):
+        if i > 0:
+            change = close[i] - close[i - 1]
+            gain = change if change > 0.0 else 0.0
+            loss = -change if change < 0.0 else 0.0
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+
+        if i < window - 1:
+            out[i] = np.nan
+        elif avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return avg_gain, avg_loss
+
+
+@njit(cache=True, nogil=True)
+def indicators(
+    close: np.ndarray, out: np.ndarray, boll_window: int, boll_std: float,
+    ema_window: int, stoch_window: int, smooth_k: int, smooth_d: int
+) -> None:
+    """Compute all strategy indicators for one close series.
+
+    Columns of ``out`` follow ``INDICATOR_COLUMNS``: bb_upper,
+    bb_middle, bb_lower, ema, stoch_k, stoch_d. Warmup rows are NaN.
+
+    Args:
+        close: Close prices, shape (T,)
+        out: Output buffer, shape (T, 6)
+        boll_window: Bollinger Bands window
+        boll_std: Bollinger Bands width in standard deviations
+        ema_window: EMA span
+        stoch_window: RSI and stochastic window
+        smooth_k: %K smoothing window
+        smooth_d: %D smoothing window
+    """
+    bollinger(close, boll_window, boll_std, out[:, 0], out[:, 1], out[:, 2])
+    ema(close, ema_window, out[:, 3])
+
+    stoch_rsi(close, stoch_window, smooth_k, smooth_d, out[:, 4], out[:, 5])
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def indicators_batch(
+    closes: np.ndarray, out: np.ndarray, boll_window: int, boll_std: float,
+    ema_window: int, stoch_window: int, smooth_k: int, smooth_d: int
+) -> None:
+    """Compute indicators for many symbols in parallel.
+
+    Rows of ``closes`` may be left-padded with NaN when histories have
+    different lengths; padded bars get NaN indicators.
+
+    Args:
+        closes: Close prices, shape (N, T)
+        out: Output buffer, shape (N, T, 6)
+        (remaining arguments as in ``indicators``)
+    """
+    for row in prange(closes.shape[0]):
+        start = 0
+        while start < closes.shape[1] and np.isnan(closes[row, start]):
+            start += 1
+        out[row, :start, :] = np.nan
+        if start < closes.shape[1]:
+            indicators(
+                closes[row, start:], out[row, start:, :], boll_window, boll_std,
+                ema_window, stoch_window, smooth_k, smooth_d
+            )
+
+
+@vectorize(["i8(f8, f8, f8, f8, f8, f8)"], nopython=True, cache=True)
+def buy_conditions_met(price, bb_lower, ema, stoch_k, stoch_d, oversold):
+    """Count how many of the four long-entry conditions hold.
+
+    Vectorized over timeframes: price below the lower band, price above
+    EMA, stochastic oversold and stochastic %K above %D.
+    """
+    return (
+        int(price < bb_lower)
+        + int(price > ema)
+        + int(stoch_k < oversold)
+        + int(stoch_k > stoch_d)
+    )
+
+
+@vectorize(["i8(f8, f8, f8, f8, f8, f8)"], nopython=True, cache=True)
+def sell_conditions_met(price, bb_upper, ema, stoch_k, stoch_d, overbought):
+    """Count how many of the four short/exit conditions hold.
+
+    Vectorized over timeframes: price above the upper band, price below
+    EMA, stochastic overbought and stochastic %K below %D.
+    """
+    return (
+        int(price > bb_upper)
+        + int(price < ema)
+        + int(stoch_k > overbought)
+        + int(stoch_k < stoch_d)
+    )
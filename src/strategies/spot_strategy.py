@@ -2,13 +2,102 @@
 Spot market trading strategy using Bollinger Bands, EMA, and Stochastic RSI
 """
 
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Any
-from ta.volatility import BollingerBands
-from ta.momentum import StochRSIIndicator
-from ta.trend import EMAIndicator
+from typing import Dict, Tuple, Any, Optional
 import logging
 
+from src.strategies.boll_stoch_strategy import INDICATOR_COLUMNS, compute_indicators
+
+# Indicators read by should_buy/should_sell and their INDICATOR_COLUMNS positions
+BUY_COLUMNS = ("bb_lower", "ema", "stoch_k", "stoch_d")
+SELL_COLUMNS = ("bb_upper", "ema", "stoch_k", "stoch_d")
+_BUY_IDX = [INDICATOR_COLUMNS.index(col) for col in BUY_COLUMNS]
+_SELL_IDX = [INDICATOR_COLUMNS.index(col) for col in SELL_COLUMNS]
+
+# Columns guaranteed by the calculate_indicators error fallback
+_FALLBACK_COLUMNS = ("bb_upper", "bb_lower", "ema", "stoch_k", "stoch_d")
+
+# Position sizing tiers by balance (USDT): a balance below the n-th
+# threshold uses the n-th policy of
+# (max allocation, max positions, min profit, stop loss)
+_BALANCE_THRESHOLDS = [100, 500, 1000]
+_BALANCE_POLICIES = [
+    (0.3, 1, 0.03, 0.02),  # < 100 USDT
+    (0.25, 2, 0.025, 0.018),  # 100-500 USDT
+    (0.2, 2, 0.02, 0.015),  # 500-1000 USDT
+    (0.15, 3, 0.018, 0.012),  # 1000+ USDT
+]
+
+# Quantity precision by base asset, 0.01 for others
+_SYMBOL_DECIMALS = {"BTC": 5, "ETH": 4}
+
+
+@lru_cache(maxsize=128)
+def _quantity_decimals(symbol: str) -> int:
+    """Decimals used to round order quantities for ``symbol``"""
+    return next((d for k, d in _SYMBOL_DECIMALS.items() if k in symbol), 2)
+
+
+class CachedBuffer:
+    """Fixed-size ring of indicator rows for one (symbol, timeframe).
+
+    Holds at most ``max_bars`` rows of raw indicator values (NaN during
+    warmup) together with the incremental state that produced the newest
+    row, so a frame that advanced by one bar costs a single row write.
+    """
+
+    # Newest bars compared to tell a continuation from revised history
+    TAIL_BARS = 5
+
+    def __init__(self, max_bars: int, width: int):
+        self.values = np.full((max_bars, width), np.nan)
+        self.head = 0  # Slot the next row is written to
+        self.count = 0
+        # Index labels and closes of the newest TAIL_BARS bars
+        self.tail_index: Optional[pd.Index] = None
+        self.tail_close: Optional[np.ndarray] = None
+        self.state: Optional[Dict[str, Any]] = None
+        # Filled indicator rows of the last frame returned, if any
+        self.filled: Optional[np.ndarray] = None
+
+    def matches(self, index: pd.Index, close: np.ndarray) -> bool:
+        """Whether the newest bars of a frame are the cached tail bars"""
+        return (
+            self.tail_index is not None
+            and index.equals(self.tail_index)
+            and np.array_equal(close, self.tail_close)
+        )
+
+    def set_tail(self, index: pd.Index, close: np.ndarray) -> None:
+        self.tail_index = index[-self.TAIL_BARS:]
+        self.tail_close = close[-self.TAIL_BARS:].copy()
+
+    def push(self, row) -> None:
+        """Append one row, overwriting the oldest when full"""
+        self.values[self.head] = row
+        self.head = (self.head + 1) % len(self.values)
+        self.count = min(self.count + 1, len(self.values))
+
+    def prefill_until(self, out: np.ndarray, idx: int) -> None:
+        """Replace the contents with the rows of ``out`` before ``idx``"""
+        rows = out[max(0, idx - len(self.values)):idx]
+        self.values[:len(rows)] = rows
+        self.head = len(rows) % len(self.values)
+        self.count = len(rows)
+
+    def last(self) -> np.ndarray:
+        """Return a view of the newest row"""
+        return self.values[(self.head - 1) % len(self.values)]
+
+    def tail(self, n: int) -> np.ndarray:
+        """Return the newest ``n`` rows in chronological order"""
+        slots = (self.head - n + np.arange(n)) % len(self.values)
+        return self.values[slots]
+
 
 class SpotStrategy:
     def __init__(
@@ -22,6 +111,7 @@ class SpotStrategy:
         min_profit: float = 0.02,    # 2% minimum profit
         stop_loss: float = 0.015,    # 1.5% stop loss
         max_allocation_pct: float = 0.3,  # 30% maximum allocation
+        max_bars: int = 1000,  # Indicator rows kept per symbol/timeframe
     ):
         self.max_allocation_pct = max_allocation_pct
         self.boll_window = boll_window
@@ -32,66 +122,230 @@ class SpotStrategy:
         self.stoch_smooth_d = stoch_smooth_d
         self.min_profit = min_profit
         self.stop_loss = stop_loss
+        # Exit levels as price multipliers, fixed per instance
+        self._take_profit_mult = 1.0 + min_profit
+        self._stop_loss_mult = 1.0 - stop_loss
+        self._neg_stop_loss = -stop_loss
+        self.max_bars = max_bars
+        # Indicator history and incremental state per (symbol, timeframe)
+        self._cache: Dict[Tuple[str, str], CachedBuffer] = {}
+
+    def _raw_indicators(self, close: np.ndarray) -> np.ndarray:
+        """Run the indicator kernel, leaving warmup rows as NaN"""
+        out = np.empty((len(close), len(INDICATOR_COLUMNS)))
+        compute_indicators(
+            close,
+            out,
+            self.boll_window,
+            float(self.boll_std),
+            self.ema_window,
+            self.stoch_window,
+            self.stoch_smooth_k,
+            self.stoch_smooth_d,
+        )
+        return out
+
+    def _bootstrap_state(self, df: pd.DataFrame, out: np.ndarray) -> Dict[str, Any]:
+        """Build the incremental state from a full close history.
+
+        The rolling windows (Bollinger closes, RSI values, stochastic and
+        %K values) are kept in bounded deques so that ``update`` only has
+        to push one bar. ``warm`` is False while any indicator is still in
+        its warmup period; such states are rebuilt on the next call.
+        """
+        close = df["close"].to_numpy(dtype=np.float64)
+        last = out[-1]
+        state: Dict[str, Any] = {
+            "index": df.index[-1],
+            "close": float(close[-1]),
+            "warm": bool(np.isfinite(last).all() and np.isfinite(close).all()),
+        }
+        state.update(zip(INDICATOR_COLUMNS, map(float, last)))
+        if not state["warm"]:
+            return state
+
+        window = close[-self.boll_window:]
+        state["bb_closes"] = deque(window, maxlen=self.boll_window)
+        state["bb_mean"] = float(window.mean())
+        state["bb_m2"] = float(((window - window.mean()) ** 2).sum())
+
+        # Wilder averages, seeded like the kernel with a zero first change
+        change = pd.Series(np.diff(close, prepend=close[0]))
+        alpha = 1.0 / self.stoch_window
+        avg_gain = change.clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+        avg_loss = (-change).clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi[avg_loss == 0.0] = 100.0
+        lowest = rsi.rolling(self.stoch_window).min()
+        spread = rsi.rolling(self.stoch_window).max() - lowest
+        stoch = (100.0 * (rsi - lowest) / spread).where(spread > 0.0)
+
+        state["avg_gain"] = float(avg_gain.iloc[-1])
+        state["avg_loss"] = float(avg_loss.iloc[-1])
+        state["rsi"] = deque(rsi.iloc[-self.stoch_window:], maxlen=self.stoch_window)
+        state["stoch"] = deque(
+            stoch.iloc[-self.stoch_smooth_k:], maxlen=self.stoch_smooth_k
+        )
+        state["k"] = deque(out[-self.stoch_smooth_d:, 4], maxlen=self.stoch_smooth_d)
+        return state
+
+    def _advance_state(self, state: Dict[str, Any], index: Any, price: float) -> None:
+        """Apply one new close to a warm state in place"""
+        # Bollinger: slide the running mean and sum of squared deviations
+        closes = state["bb_closes"]
+        w = self.boll_window
+        old = closes[0]
+        mean = state["bb_mean"]
+        new_mean = mean + (price - old) / w
+        state["bb_m2"] += (price - old) * (price - new_mean + old - mean)
+        state["bb_mean"] = new_mean
+        closes.append(price)
+        band = self.boll_std * np.sqrt(max(state["bb_m2"] / w, 0.0))
+        state["bb_upper"] = new_mean + band
+        state["bb_middle"] = new_mean
+        state["bb_lower"] = new_mean - band
+
+        state["ema"] += 2.0 / (self.ema_window + 1) * (price - state["ema"])
+
+        # Wilder RSI, then stochastic and %K/%D smoothing
+        change = price - state["close"]
+        alpha = 1.0 / self.stoch_window
+        state["avg_gain"] += alpha * (max(change, 0.0) - state["avg_gain"])
+        state["avg_loss"] += alpha * (max(-change, 0.0) - state["avg_loss"])
+        if state["avg_loss"] == 0.0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + state["avg_gain"] / state["avg_loss"])
+        state["rsi"].append(rsi)
+        lowest = min(state["rsi"])
+        spread = max(state["rsi"]) - lowest
+        state["stoch"].append(100.0 * (rsi - lowest) / spread if spread > 0.0 else np.nan)
+        stoch_k = sum(state["stoch"]) / self.stoch_smooth_k
+        state["k"].append(stoch_k)
+        state["stoch_k"] = stoch_k
+        state["stoch_d"] = sum(state["k"]) / self.stoch_smooth_d
+
+        state["index"] = index
+        state["close"] = price
+        state["warm"] = bool(
+            np.isfinite([state[col] for col in INDICATOR_COLUMNS]).all()
+        )
+
+    def _sync(
+        self, df: pd.DataFrame, key: Tuple[str, str]
+    ) -> Tuple[CachedBuffer, Optional[np.ndarray]]:
+        """Bring the cached buffer for ``key`` up to the last bar of ``df``.
+
+        The buffer is left untouched when the newest bars (index labels
+        and closes) are unchanged. When ``df`` extends them by exactly one
+        bar only that bar is processed, in O(1). Any other change,
+        including a revised recent bar, recomputes the full frame.
+
+        Returns:
+            The buffer and, after a full recompute, the raw indicator rows
+        """
+        close = df["close"].to_numpy(dtype=np.float64)
+        index = df.index
+        tail = CachedBuffer.TAIL_BARS
+        buf = self._cache.get(key)
+        if buf is not None and buf.matches(index[-tail:], close[-tail:]):
+            return buf, None
+
+        out = None
+        if (
+            buf is not None
+            and buf.state["warm"]
+            and len(df) > tail
+            and buf.matches(index[-tail - 1:-1], close[-tail - 1:-1])
+            and np.isfinite(close[-1])
+        ):
+            self._advance_state(buf.state, index[-1], float(close[-1]))
+            buf.push([buf.state[col] for col in INDICATOR_COLUMNS])
+        else:
+            if buf is None:
+                buf = CachedBuffer(self.max_bars, len(INDICATOR_COLUMNS))
+                self._cache[key] = buf
+            out = self._raw_indicators(close)
+            buf.prefill_until(out, len(out))
+            buf.state = self._bootstrap_state(df, out)
+        buf.set_tail(index, close)
+        buf.filled = None
+        return buf, out
+
+    def _latest(self, df: pd.DataFrame, symbol: str, timeframe: str) -> Tuple[float, np.ndarray]:
+        """Newest close and raw indicator row, cached only per symbol/timeframe"""
+        if symbol and timeframe:
+            buf, _ = self._sync(df, (symbol, timeframe))
+            return buf.state["close"], buf.last()
+        close = df["close"].to_numpy(dtype=np.float64)
+        return float(close[-1]), self._raw_indicators(close)[-1]
+
+    def update(
+        self, df: pd.DataFrame, symbol: str = "", timeframe: str = ""
+    ) -> Dict[str, Any]:
+        """Bring the incremental indicator state up to the last bar of ``df``.
+
+        Returns:
+            State dict with the latest ``close`` and indicator values
+        """
+        buf, _ = self._sync(df, (symbol, timeframe))
+        return buf.state
 
-    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+    def calculate_indicators(
+        self, df: pd.DataFrame, symbol: str = "", timeframe: str = ""
+    ) -> pd.DataFrame:
         """
         Calculate technical indicators with fallback for missing/NaN columns.
+
+        With ``symbol`` and ``timeframe`` the rows come from the cached
+        ring buffer: unchanged bars reuse the previous rows and a one-bar
+        advance computes only the new row.
         """
+        # Too short for every indicator to warm up: the columns still in
+        # warmup would fall back to the close price, so skip the
+        # computation. %D needs 2 * (window - 1) bars of RSI and its own
+        # stochastic window, then both smoothing windows
+        min_bars = max(
+            self.boll_window,
+            self.ema_window,
+            2 * (self.stoch_window - 1) + self.stoch_smooth_k + self.stoch_smooth_d - 1,
+        )
+        if len(df) < min_bars:
+            close = df["close"]
+            for col in INDICATOR_COLUMNS:
+                df[col] = close
+            return df
+
         try:
-            # Bollinger Bands
-            bb = BollingerBands(
-                close=df["close"],
-                window=self.boll_window,
-                window_dev=self.boll_std
-            )
-            df["bb_upper"] = bb.bollinger_hband()
-            df["bb_middle"] = bb.bollinger_mavg()
-            df["bb_lower"] = bb.bollinger_lband()
-
-            # EMA
-            ema = EMAIndicator(close=df["close"], window=self.ema_window)
-            df["ema"] = ema.ema_indicator()
-
-            # Stochastic RSI
-            stoch = StochRSIIndicator(
-                close=df["close"],
-                window=self.stoch_window,
-                smooth1=self.stoch_smooth_k,
-                smooth2=self.stoch_smooth_d,
-            )
-            df["stoch_k"] = stoch.stochrsi_k()
-            df["stoch_d"] = stoch.stochrsi_d()
-
-            # Fallback: pastikan semua kolom indikator utama ada dan isi NaN
-            # dengan harga close
-            required_cols = [
-                "bb_upper",
-                "bb_middle",
-                "bb_lower",
-                "ema",
-                "stoch_k",
-                "stoch_d",
-            ]
-            for col in required_cols:
-                if col not in df.columns:
-                    df[col] = df["close"]
-                else:
-                    df[col] = df[col].fillna(df["close"])
+            close = df["close"].to_numpy(dtype=np.float64)
+            if symbol and timeframe:
+                buf, out = self._sync(df, (symbol, timeframe))
+                if buf.filled is not None and len(buf.filled) == len(df):
+                    df[INDICATOR_COLUMNS] = buf.filled
+                    return df
+                if out is None:
+                    if buf.count >= len(df):
+                        out = buf.tail(len(df))
+                    else:
+                        out = self._raw_indicators(close)
+            else:
+                # All six indicators in one compiled pass over the close array
+                out = self._raw_indicators(close)
 
+            # Fallback: isi NaN (warmup) dengan harga close di numpy, lalu
+            # assign semua kolom indikator sekaligus
+            filled = np.where(np.isnan(out), close[:, None], out)
+            df[INDICATOR_COLUMNS] = filled
+
+            if symbol and timeframe:
+                buf.filled = filled
             return df
 
         except Exception as e:
             logging.error(f"Error calculating indicators: {e}")
             # Fallback: jika error,
             # pastikan semua kolom minimal diisi harga close
-            required_cols = [
-                "bb_upper",
-                "bb_lower",
-                "ema",
-                "stoch_k",
-                "stoch_d",
-            ]
-            for col in required_cols:
+            for col in _FALLBACK_COLUMNS:
                 if col not in df.columns:
                     df[col] = df["close"]
                 else:
@@ -99,11 +353,12 @@ class SpotStrategy:
             return df
 
     def should_buy(
-        self, df: pd.DataFrame
+        self, df: pd.DataFrame, symbol: str = "", timeframe: str = ""
     ) -> Tuple[bool, float, Dict[str, float]]:
         """
         Check if we should buy based on our strategy. Safe with fallback for
-        missing/NaN columns.
+        missing/NaN columns. Indicator state is cached only when ``symbol``
+        and ``timeframe`` are given.
         Returns:
             (should_buy, confidence, levels)
         """
@@ -111,27 +366,16 @@ class SpotStrategy:
             if len(df) < 2:
                 return False, 0, {}
 
-            # Kolom indikator utama
-            required_cols = [
-                "bb_lower",
-                "bb_middle",
-                "ema",
-                "stoch_k",
-                "stoch_d",
-            ]
-            for col in required_cols:
-                if col not in df.columns or pd.isna(df[col].iloc[-1]):
-                    logging.warning(
-                        f"{col} not found or NaN in should_buy, "
-                        f"fallback to close value"
-                    )
-                    df[col] = df["close"]
-            current_price = df["close"].iloc[-1]
-            bb_lower = df["bb_lower"].iloc[-1]
-            # # bb_middle = df["bb_middle"].iloc[-1]  # Unused variable (F841)  # noqa: E501
-            ema = df["ema"].iloc[-1]
-            stoch_k = df["stoch_k"].iloc[-1]
-            stoch_d = df["stoch_d"].iloc[-1]
+            # Newest indicator row
+            current_price, row = self._latest(df, symbol, timeframe)
+            row = row[_BUY_IDX]
+            missing = np.isnan(row)
+            if missing.any():
+                logging.warning(
+                    "NaN indicators in should_buy, fallback to close value"
+                )
+                row = np.where(missing, current_price, row)
+            bb_lower, ema, stoch_k, stoch_d = row
 
             # Buy conditions
             conditions = [
@@ -145,8 +389,8 @@ class SpotStrategy:
 
             if confidence >= 0.75:  # At least 3 out of 4 conditions
                 # Calculate take profit and stop loss
-                take_profit = current_price * (1 + self.min_profit)
-                stop_loss = current_price * (1 - self.stop_loss)
+                take_profit = current_price * self._take_profit_mult
+                stop_loss = current_price * self._stop_loss_mult
 
                 return True, confidence, {
                     "entry": current_price,
@@ -161,11 +405,13 @@ class SpotStrategy:
             return False, 0, {}
 
     def should_sell(
-        self, df: pd.DataFrame, buy_price: float = None
+        self, df: pd.DataFrame, buy_price: float = None,
+        symbol: str = "", timeframe: str = ""
     ) -> Tuple[bool, float]:
         """
         Check if we should sell based on our strategy. Safe with fallback for
-        missing/NaN columns.
+        missing/NaN columns. Indicator state is cached only when ``symbol``
+        and ``timeframe`` are given.
         Returns:
             (should_sell, confidence)
         """
@@ -173,38 +419,28 @@ class SpotStrategy:
             if len(df) < 2:
                 return False, 0
 
-            # Kolom indikator utama
-            required_cols = [
-                "bb_upper",
-                "bb_middle",
-                "ema",
-                "stoch_k",
-                "stoch_d",
-            ]
-            for col in required_cols:
-                if col not in df.columns or pd.isna(df[col].iloc[-1]):
-                    logging.warning(
-                        f"{col} not found or NaN in should_sell, "
-                        f"fallback to close value"
-                    )
-                    df[col] = df["close"]
-            current_price = df["close"].iloc[-1]
-            bb_upper = df["bb_upper"].iloc[-1]
-            # # bb_middle = df["bb_middle"].iloc[-1]  # Unused variable (F841)  # noqa: E501
-            ema = df["ema"].iloc[-1]
-            stoch_k = df["stoch_k"].iloc[-1]
-            stoch_d = df["stoch_d"].iloc[-1]
-
-            # If we have a buy price, check stop loss and take profit
+            # If we have a buy price, check stop loss and take profit first;
+            # they only need the price, not the indicators
             if buy_price:
-                profit_pct = (current_price - buy_price) / buy_price
-                if profit_pct <= -self.stop_loss:
+                profit_pct = (df["close"].iat[-1] - buy_price) / buy_price
+                if profit_pct <= self._neg_stop_loss:
                     return True, 1.0
 
                 # Take profit hit
                 if profit_pct >= self.min_profit:
                     return True, 1.0
 
+            # Newest indicator row
+            current_price, row = self._latest(df, symbol, timeframe)
+            row = row[_SELL_IDX]
+            missing = np.isnan(row)
+            if missing.any():
+                logging.warning(
+                    "NaN indicators in should_sell, fallback to close value"
+                )
+                row = np.where(missing, current_price, row)
+            bb_upper, ema, stoch_k, stoch_d = row
+
             # Regular sell conditions
             conditions = [
                 current_price > bb_upper,  # Price above upper BB
@@ -228,26 +464,9 @@ class SpotStrategy:
         with smart allocation"""
         try:
             # Maximum allocation per trade based on total balance
-            if balance < 100:  # Less than 100 USDT
-                max_allocation = 0.3  # 30% max per trade
-                max_positions = 1
-                min_profit = 0.03  # 3% min profit
-                stop_loss = 0.02  # 2% stop loss
-            elif balance < 500:  # 100-500 USDT
-                max_allocation = 0.25  # 25% max per trade
-                max_positions = 2
-                min_profit = 0.025  # 2.5% min profit
-                stop_loss = 0.018  # 1.8% stop loss
-            elif balance < 1000:  # 500-1000 USDT
-                max_allocation = 0.2  # 20% max per trade
-                max_positions = 2
-                min_profit = 0.02  # 2% min profit
-                stop_loss = 0.015  # 1.5% stop loss
-            else:  # 1000+ USDT
-                max_allocation = 0.15  # 15% max per trade
-                max_positions = 3
-                min_profit = 0.018  # 1.8% min profit
-                stop_loss = 0.012  # 1.2% stop loss
+            max_allocation, max_positions, min_profit, stop_loss = (
+                _BALANCE_POLICIES[bisect_right(_BALANCE_THRESHOLDS, balance)]
+            )
 
             # Never exceed configured maximum allocation
             max_allocation = min(max_allocation, self.max_allocation_pct)
@@ -272,12 +491,7 @@ class SpotStrategy:
             quantity = usable_usdt / current_price
 
             # Round to appropriate decimals based on symbol
-            if 'BTC' in symbol:
-                quantity = round(quantity, 5)  # 0.00001 BTC precision
-            elif 'ETH' in symbol:
-                quantity = round(quantity, 4)  # 0.0001 ETH precision
-            else:
-                quantity = round(quantity, 2)  # 0.01 precision for others
+            quantity = round(quantity, _quantity_decimals(symbol))
 
             # Log the position size
             logging.info(
@@ -1,9 +1,67 @@
 import logging
+import re
+import time
 import psutil
 from typing import Dict, Any, Optional
 import pandas as pd
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+# Reads closer together than this reuse the previous CPU sample, since
+# a non-blocking read over a very short interval is mostly noise
+CPU_SAMPLE_MIN_INTERVAL = 0.25
+
+# Prime psutil's counter so the first non-blocking read has a baseline
+psutil.cpu_percent(interval=None)
+_last_cpu_sample = (time.monotonic(), 0.0)
+
+# Error message keywords, scanned once per message. Each match is
+# tagged with its group name; the branches below are then chosen by
+# priority from the set of tags found, as the old if/elif chain did.
+_RECOVERY_RE = re.compile(
+    r"(?P<rate>rate limit)|(?P<network>network|timeout|connection)"
+    r"|(?P<maintenance>maintenance)|(?P<funds>insufficient)"
+    r"|(?P<key>key)|(?P<invalid>invalid|expired)",
+    re.IGNORECASE,
+)
+_EXCHANGE_RE = re.compile(
+    r"(?P<order>order)|(?P<position>position)|(?P<balance>balance)"
+    r"|(?P<not_found>not found)|(?P<canceled>canceled)",
+    re.IGNORECASE,
+)
+
+# Recovery branches in priority order: (log level, log message,
+# recoverable, result message)
+_RECOVERY_ACTIONS = [
+    ("rate", logging.WARNING, "Rate limit hit, waiting 60 seconds",
+     True, "Rate limit error - waiting"),
+    ("network", logging.WARNING, "Network error detected, will retry",
+     True, "Network error - will retry"),
+    ("maintenance", logging.WARNING, "Exchange maintenance, waiting 5 minutes",
+     True, "Exchange maintenance - waiting"),
+    ("funds", logging.ERROR, "Insufficient funds",
+     False, "Insufficient funds - cannot continue"),
+    ("credentials", logging.ERROR, "Invalid API credentials",
+     False, "Invalid API credentials - cannot continue"),
+]
+
+
+def _error_tags(pattern: re.Pattern, error: Exception) -> set:
+    """Names of the keyword groups found in the error message"""
+    return {m.lastgroup for m in pattern.finditer(str(error))}
+
+
+def _cpu_percent() -> float:
+    """CPU usage since the previous sample, without blocking"""
+    global _last_cpu_sample
+    sampled_at, value = _last_cpu_sample
+    now = time.monotonic()
+    if now - sampled_at >= CPU_SAMPLE_MIN_INTERVAL:
+        value = psutil.cpu_percent(interval=None)
+        _last_cpu_sample = (now, value)
+    return value
+
 
 def check_system_health() -> Dict[str, Any]:
     """
@@ -14,7 +72,7 @@ def check_system_health() -> Dict[str, Any]:
     """
     try:
         # Check CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = _cpu_percent()
 
         # Check memory usage
         memory = psutil.virtual_memory()
@@ -48,7 +106,7 @@ def check_system_health() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logging.error(f"Error checking system health: {e}")
+        logger.error("Error checking system health: %s", e)
         return {"overall_healthy": False, "error": str(e)}
 
 
@@ -66,42 +124,21 @@ def recover_from_error(
         Tuple of (success, message)
     """
     try:
-        error_str = str(error).lower()
-
-        # Handle rate limit errors
-        if "rate limit" in error_str:
-            logging.warning("Rate limit hit, waiting 60 seconds")
-            return True, "Rate limit error - waiting"
-
-        # Handle network errors
-        elif any(x in error_str for x in ["network", "timeout", "connection"]):
-            logging.warning("Network error detected, will retry")
-            return True, "Network error - will retry"
-
-        # Handle exchange maintenance
-        elif "maintenance" in error_str:
-            logging.warning("Exchange maintenance, waiting 5 minutes")
-            return True, "Exchange maintenance - waiting"
-
-        # Handle insufficient funds
-        elif "insufficient" in error_str:
-            logging.error("Insufficient funds")
-            return False, "Insufficient funds - cannot continue"
-
-        # Handle invalid API keys
-        elif "key" in error_str and (
-            "invalid" in error_str or "expired" in error_str
-        ):
-            logging.error("Invalid API credentials")
-            return False, "Invalid API credentials - cannot continue"
+        tags = _error_tags(_RECOVERY_RE, error)
+        if "key" in tags and "invalid" in tags:
+            tags.add("credentials")
+
+        for tag, level, log_message, recoverable, result in _RECOVERY_ACTIONS:
+            if tag in tags:
+                logger.log(level, log_message)
+                return recoverable, result
 
         # Unknown errors
-        else:
-            logging.error(f"Unknown error: {error}")
-            return False, f"Unknown error - {str(error)}"
+        logger.error("Unknown error: %s", error)
+        return False, f"Unknown error - {str(error)}"
 
     except Exception as e:
-        logging.error(f"Error in recovery function: {e}")
+        logger.error("Error in recovery function: %s", e)
         return False, f"Recovery error - {str(e)}"
 
 
@@ -116,26 +153,26 @@ def handle_exchange_error(error: Exception) -> tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        error_str = str(error).lower()
+        tags = _error_tags(_EXCHANGE_RE, error)
 
         # Handle order errors
-        if "order" in error_str:
-            if "not found" in error_str:
+        if "order" in tags:
+            if "not_found" in tags:
                 return True, "Order not found - will retry"
-            elif "canceled" in error_str:
+            elif "canceled" in tags:
                 return True, "Order was canceled - will retry"
             else:
                 return False, f"Order error - {error}"
 
         # Handle position errors
-        elif "position" in error_str:
-            if "not found" in error_str:
+        elif "position" in tags:
+            if "not_found" in tags:
                 return True, "Position not found - will retry"
             else:
                 return False, f"Position error - {error}"
 
         # Handle balance errors
-        elif "balance" in error_str:
+        elif "balance" in tags:
             return False, f"Balance error - {error}"
 
         # Other exchange errors
@@ -143,7 +180,7 @@ def handle_exchange_error(error: Exception) -> tuple[bool, str]:
             return True, "Exchange error - will retry"
 
     except Exception as e:
-        logging.error(f"Error handling exchange error: {e}")
+        logger.error("Error handling exchange error: %s", e)
         return False, f"Error handler failed - {str(e)}"
 
 
@@ -158,21 +195,25 @@ def log_market_conditions(
         conditions: Dictionary of market conditions
         market_data: Dictionary of current market data
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     try:
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row = df.iloc[-1]
 
-        logging.info(
+        logger.info(
             f"""
 Market Update [{current_time}]
 Price: {market_data['current_price']:.2f}
 Trend: {conditions['trend']}
-RSI: {df['rsi'].iloc[-1]:.2f}
-Volatility: {df['volatility'].iloc[-1]:.4f}
-Volume: {df['volume'].iloc[-1]:.2f}
-MACD: {df['macd'].iloc[-1]:.4f}
-Signal: {df['macd_signal'].iloc[-1]:.4f}
+RSI: {row['rsi']:.2f}
+Volatility: {row['volatility']:.4f}
+Volume: {row['volume']:.2f}
+MACD: {row['macd']:.4f}
+Signal: {row['macd_signal']:.4f}
         """.strip()
         )
 
     except Exception as e:
-        logging.error(f"Error logging market conditions: {e}")
+        logger.error("Error logging market conditions: %s", e)
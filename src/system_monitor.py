@@ -1,9 +1,34 @@
 import os
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 import requests
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts for Telegram API calls
+TELEGRAM_TIMEOUT = (3.05, 10)
+
+# Shared session so notifications reuse the keep-alive connection to
+# api.telegram.org instead of a new TCP/TLS handshake each time
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# Pending notifications, sent in order by a single background worker
+_notification_queue: "queue.Queue[str]" = queue.Queue(maxsize=1000)
+_worker_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+# Identical messages repeated within this many seconds are sent once
+DUPLICATE_WINDOW = 1.0
 
 
 @dataclass
@@ -20,12 +45,18 @@ class TelegramConfig:
         )
 
 
-def send_telegram_notification(message: str) -> bool:
-    """Send notification via Telegram."""
+@lru_cache(maxsize=1)
+def get_telegram_config() -> TelegramConfig:
+    """Telegram configuration read from the environment once per process."""
+    return TelegramConfig.from_env()
+
+
+def _post_telegram(message: str) -> bool:
+    """Send one message to the Telegram API, blocking until it returns."""
     try:
-        config = TelegramConfig.from_env()
+        config = get_telegram_config()
         if not config.bot_token or not config.chat_id:
-            logging.error("Telegram configuration missing")
+            logger.error("Telegram configuration missing")
             return False
 
         url = f"https://api.telegram.org/bot{config.bot_token}/sendMessage"
@@ -35,38 +66,107 @@ def send_telegram_notification(message: str) -> bool:
             "parse_mode": "HTML",
         }
 
-        response = requests.post(url, json=payload)
+        response = _session.post(url, json=payload, timeout=TELEGRAM_TIMEOUT)
         if response.status_code == 200:
-            logging.info(f"Telegram notification sent: {message}")
+            logger.info("Telegram notification sent: %s", message)
             return True
         else:
-            logging.error(
-                f"Failed to send Telegram notification: {response.text}"
+            logger.error(
+                "Failed to send Telegram notification: %s", response.text
             )
             return False
 
     except Exception as e:
-        logging.error(f"Error sending Telegram notification: {e}")
+        logger.error("Error sending Telegram notification: %s", e)
+        return False
+
+
+def _notification_worker() -> None:
+    """Drain the notification queue, dropping quick duplicates."""
+    last_message, last_sent = None, 0.0
+    while True:
+        message = _notification_queue.get()
+        try:
+            now = time.monotonic()
+            if message == last_message and now - last_sent < DUPLICATE_WINDOW:
+                continue
+            _post_telegram(message)
+            last_message, last_sent = message, now
+        finally:
+            _notification_queue.task_done()
+
+
+def _ensure_worker() -> None:
+    """Start the notification worker thread if it is not running."""
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_notification_worker,
+                name="telegram-notifier",
+                daemon=True,
+            )
+            _worker.start()
+
+
+def send_telegram_notification(message: str) -> bool:
+    """Queue a Telegram notification without waiting for it to be sent.
+
+    Returns:
+        True if the message was queued, False if the queue is full
+    """
+    _ensure_worker()
+    try:
+        _notification_queue.put_nowait(message)
+        return True
+    except queue.Full:
+        logger.warning("Telegram notification queue full, dropping: %s", message)
         return False
 
 
+def flush(timeout: float = 10.0) -> bool:
+    """Wait for queued notifications to be sent, e.g. before shutdown.
+
+    Returns:
+        True if the queue drained within ``timeout`` seconds
+    """
+    deadline = time.monotonic() + timeout
+    with _notification_queue.all_tasks_done:
+        while _notification_queue.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _notification_queue.all_tasks_done.wait(remaining)
+    return True
+
+
 class SystemMonitor:
     def __init__(self, exchange: Any, config: Dict[str, Any]):
         self.exchange = exchange
         self.config = config
-        self.telegram_config = TelegramConfig.from_env()
-        self.last_health_check = datetime.now()
+        self.telegram_config = get_telegram_config()
+        # time.monotonic() of the last health check, immune to clock changes
+        self.last_health_check = time.monotonic()
         self.health_check_interval = 300  # 5 minutes
 
+        # Pool for issuing the health check's exchange requests concurrently
+        self._pool = ThreadPoolExecutor(max_workers=3)
+
+    def close(self) -> None:
+        """Shut down the pool used by the health check."""
+        self._pool.shutdown()
+
     def check_exchange_health(self) -> bool:
         """Check if exchange is healthy and responding."""
         try:
             self.exchange.load_markets()
-            self.last_health_check = datetime.now()
-            logging.info("Exchange health check: OK")
+            self.last_health_check = time.monotonic()
+            logger.info("Exchange health check: OK")
             return True
         except Exception as e:
-            logging.critical(f"Exchange health check failed: {e}")
+            logger.critical("Exchange health check failed: %s", e)
             self.send_notification(
                 f"🚨 CRITICAL: Exchange health check failed: {e}"
             )
@@ -76,36 +176,45 @@ class SystemMonitor:
         """Send notification using Telegram."""
         return send_telegram_notification(message)
 
-    def fetch_position_details(self) -> Dict[str, Any]:
-        """Fetch current position details."""
+    def fetch_position_details(
+        self, positions_future: Optional[Future] = None
+    ) -> Dict[str, Any]:
+        """Fetch current position details.
+
+        Args:
+            positions_future: Pending ``fetch_positions`` call to use
+                instead of issuing a new one
+        """
         try:
-            positions = self.exchange.fetch_positions([self.config["symbol"]])
+            if positions_future is None:
+                positions = self.exchange.fetch_positions([self.config["symbol"]])
+            else:
+                positions = positions_future.result()
+            sizes = np.fromiter(
+                (float(p["contracts"]) for p in positions),
+                dtype=np.float64,
+                count=len(positions),
+            )
+            pnls = np.fromiter(
+                (float(p.get("unrealizedPnl") or 0) for p in positions),
+                dtype=np.float64,
+                count=len(positions),
+            )
+            buy_mask = sizes > 0
+            sell_mask = sizes < 0
+
+            # Flat positions (size 0) do not count towards PnL
             position_details = {
-                "buy": 0,
-                "sell": 0,
-                "total_buy": 0.0,
-                "total_sell": 0.0,
-                "unrealized_pnl": 0.0,
+                "buy": int(buy_mask.sum()),
+                "sell": int(sell_mask.sum()),
+                "total_buy": float(sizes[buy_mask].sum()),
+                "total_sell": float(-sizes[sell_mask].sum()),
+                "unrealized_pnl": float(pnls[buy_mask | sell_mask].sum()),
             }
 
-            for position in positions:
-                position_size = float(position["contracts"])
-                if position_size > 0:
-                    position_details["buy"] += 1
-                    position_details["total_buy"] += position_size
-                    position_details["unrealized_pnl"] += float(
-                        position.get("unrealizedPnl", 0)
-                    )
-                elif position_size < 0:
-                    position_details["sell"] += 1
-                    position_details["total_sell"] += abs(position_size)
-                    position_details["unrealized_pnl"] += float(
-                        position.get("unrealizedPnl", 0)
-                    )
-
             return position_details
         except Exception as e:
-            logging.error(f"Error fetching position details: {e}")
+            logger.error("Error fetching position details: %s", e)
             return {
                 "buy": 0,
                 "sell": 0,
@@ -114,22 +223,35 @@ class SystemMonitor:
                 "unrealized_pnl": 0.0,
             }
 
-    def cleanup_old_orders(self) -> None:
-        """Cancel old pending orders."""
+    def cleanup_old_orders(self, orders_future: Optional[Future] = None) -> None:
+        """Cancel old pending orders.
+
+        Args:
+            orders_future: Pending ``fetch_open_orders`` call to use
+                instead of issuing a new one
+        """
         try:
-            open_orders = self.exchange.fetch_open_orders(
-                symbol=self.config["symbol"]
-            )
+            if orders_future is None:
+                open_orders = self.exchange.fetch_open_orders(
+                    symbol=self.config["symbol"]
+                )
+            else:
+                open_orders = orders_future.result()
             current_time = self.exchange.milliseconds()
 
-            for order in open_orders:
-                order_age = current_time - order["timestamp"]
-                # Cancel orders older than 1 hour
-                if order_age > 3600000:  # 1 hour in milliseconds
-                    self.exchange.cancel_order(order["id"])
-                    logging.info(f"Cancelled old order {order['id']}")
+            timestamps = np.fromiter(
+                (order["timestamp"] for order in open_orders),
+                dtype=np.int64,
+                count=len(open_orders),
+            )
+            # Cancel orders older than 1 hour (in milliseconds)
+            stale = np.flatnonzero(current_time - timestamps > 3600000)
+            for i in stale:
+                order = open_orders[i]
+                self.exchange.cancel_order(order["id"])
+                logger.info("Cancelled old order %s", order["id"])
         except Exception as e:
-            logging.error(f"Error cleaning up old orders: {e}")
+            logger.error("Error cleaning up old orders: %s", e)
 
     def emergency_stop(self, reason: str) -> bool:
         """Emergency stop: close all positions and cancel all orders."""
@@ -147,23 +269,35 @@ class SystemMonitor:
             )
             return True
         except Exception as e:
-            logging.critical(f"Emergency stop failed: {e}")
+            logger.critical("Emergency stop failed: %s", e)
             self.send_notification(f"🚨 EMERGENCY STOP FAILED: {e}")
             return False
 
     def monitor_system_health(self) -> bool:
         """Periodic system health check."""
         try:
-            current_time = datetime.now()
-            if (
-                current_time - self.last_health_check
-            ).total_seconds() >= self.health_check_interval:
-                # Check exchange connectivity
+            current_time = time.monotonic()
+            if current_time - self.last_health_check >= self.health_check_interval:
+                # Check exchange connectivity first: the other requests are
+                # pointless without it, and must not run alongside
+                # load_markets on the same ccxt instance, as they may call
+                # it lazily themselves
                 if not self.check_exchange_health():
                     return False
 
+                # Issue the remaining requests at once, then consume the
+                # results in the same order as before
+                symbol = self.config["symbol"]
+                balance = self._pool.submit(self.exchange.fetch_balance)
+                positions = self._pool.submit(
+                    self.exchange.fetch_positions, [symbol]
+                )
+                open_orders = self._pool.submit(
+                    self.exchange.fetch_open_orders, symbol=symbol
+                )
+
                 # Check balance
-                balance = self.exchange.fetch_balance()
+                balance = balance.result()
                 usdt_balance = balance["USDT"]["free"]
                 if usdt_balance < self.config["min_balance"]:
                     self.send_notification(
@@ -171,7 +305,7 @@ class SystemMonitor:
                     )
 
                 # Check position health
-                position_details = self.fetch_position_details()
+                position_details = self.fetch_position_details(positions)
                 if (
                     abs(position_details["unrealized_pnl"])
                     > usdt_balance * 0.2
@@ -179,12 +313,12 @@ class SystemMonitor:
                     self.send_notification("⚠️ Large unrealized PnL detected")
 
                 # Cleanup old orders
-                self.cleanup_old_orders()
+                self.cleanup_old_orders(open_orders)
 
                 self.last_health_check = current_time
 
             return True
 
         except Exception as e:
-            logging.error(f"System health monitoring failed: {e}")
+            logger.error("System health monitoring failed: %s", e)
             return False
@@ -9,7 +9,12 @@ from .rate_limiter import (
     RateLimiter,
     CircuitBreaker,
 )
-from .telegram_utils import setup_telegram, send_telegram_message
+from .telegram_utils import (
+    setup_telegram,
+    send_telegram_message,
+    enqueue_telegram_message,
+    flush_telegram,
+)
 
 __all__ = [
     "BotStatusMonitor",
@@ -19,4 +24,6 @@ __all__ = [
     "CircuitBreaker",
     "setup_telegram",
     "send_telegram_message",
+    "enqueue_telegram_message",
+    "flush_telegram",
 ]
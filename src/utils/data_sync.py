@@ -6,14 +6,64 @@ import json
 import logging
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, Optional
 
-from src.utils.redis_manager import RedisManager
+# orjson parses large OHLCV payloads several times faster; fall back to
+# the stdlib parser when it is not installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+import numpy as np
+import pandas as pd
+
+from src.utils.redis_manager import RedisManager, _decode_frame
 from src.utils.postgres_manager import PostgresManager
 from src.utils.status_monitor import BotStatusMonitor
 
 logger = logging.getLogger(__name__)
 
+# Redis key holding the newest signal timestamp already stored in PostgreSQL
+SIGNAL_WATERMARK_KEY = "last_sync:signals"
+
+# Numeric fields copied from Redis/status-file records into PostgreSQL rows
+_ACTIVE_FLOAT_KEYS = ('entry_price', 'quantity', 'stop_loss', 'take_profit', 'confidence')
+_UPDATE_FLOAT_KEYS = ('current_price', 'pnl')
+_SIGNAL_FLOAT_KEYS = ('confidence', 'price')
+_CLOSED_FLOAT_KEYS = (
+    'entry_price', 'exit_price', 'quantity', 'profit_pct', 'stop_loss', 'take_profit'
+)
+
+
+_OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def _ohlcv_rows(data: bytes) -> Optional[list]:
+    """[timestamp ms, open, high, low, close, volume] rows of a cached frame
+    
+    Returns None when the entry is empty or not an OHLCV frame.
+    """
+    df = _decode_frame(data)
+    if (
+        df.empty
+        or not isinstance(df.index, pd.DatetimeIndex)
+        or not set(_OHLCV_COLUMNS).issubset(df.columns)
+    ):
+        return None
+    
+    rows = np.empty((len(df), 6))
+    # Exchange candles are indexed by naive UTC times
+    rows[:, 0] = df.index.asi8 // 1_000_000
+    rows[:, 1:] = df[_OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+    return rows.tolist()
+
+
+def _floats(record: Dict[str, Any], keys: tuple) -> Dict[str, float]:
+    """Read keys from record as floats, with missing or null values as 0.0"""
+    return {key: float(record.get(key) or 0) for key in keys}
+
+
 class DataSyncManager:
     """
     Manages synchronization of data between Redis and PostgreSQL
@@ -25,6 +75,34 @@ class DataSyncManager:
         self.postgres = PostgresManager()
         self.monitor = BotStatusMonitor()
         self.last_sync = datetime.now()
+        
+        # Non-blocking Redis client so concurrent syncs yield on I/O, plus
+        # one returning bytes for the binary OHLCV cache
+        self._redis = self.redis.async_client()
+        self._redis_bin = self.redis.async_client(decode_responses=False)
+        # psycopg2 calls block: run them in worker threads, each on its own
+        # pooled connection, at most as many at once as the pool holds
+        # since an exhausted pool raises instead of waiting. Created on
+        # first use so it belongs to the running loop (Python 3.9 binds
+        # semaphores at construction).
+        self._pg_slots: Optional[asyncio.Semaphore] = None
+    
+    async def _pg(self, method: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking PostgresManager method off the event loop"""
+        if self._pg_slots is None:
+            self._pg_slots = asyncio.Semaphore(
+                self.postgres.config.get('max_connections', 10)
+            )
+        async with self._pg_slots:
+            return await asyncio.to_thread(method, *args, **kwargs)
+    
+    async def _connected(self) -> bool:
+        """Check that both Redis and PostgreSQL are reachable"""
+        try:
+            await self._redis.ping()
+        except Exception:
+            return False
+        return await self._pg(self.postgres.is_connected)
     
     async def sync_active_trades(self) -> bool:
         """
@@ -33,19 +111,19 @@ class DataSyncManager:
         Returns:
             bool: Success status
         """
-        if not self.redis.is_connected() or not self.postgres.is_connected():
+        if not await self._connected():
             logger.error("Cannot sync trades: Database connections not available")
             return False
         
         try:
             # Get active trades from Redis
-            redis_trades_data = self.redis.redis.get("active_trades")
+            redis_trades_data = await self._redis.get("active_trades")
             if not redis_trades_data:
                 logger.info("No active trades found in Redis to sync")
                 return True
             
             try:
-                active_trades = json.loads(redis_trades_data)
+                active_trades = json_loads(redis_trades_data)
                 if not active_trades:
                     return True
                     
@@ -60,53 +138,53 @@ class DataSyncManager:
                             trades_list.append(trade_info)
                     active_trades = trades_list
             except json.JSONDecodeError:
-                logger.error(f"Error decoding active trades JSON from Redis: {redis_trades_data}")
+                logger.error("Error decoding active trades JSON from Redis: %s", redis_trades_data)
                 return False
             
+            # Nothing to sync without a symbol, so skip the PostgreSQL lookup
+            active_trades = [t for t in active_trades if t.get('symbol')]
+            if not active_trades:
+                return True
+            
             # Get existing trades from PostgreSQL to avoid duplicates
-            existing_trades = self.postgres.get_trades(status="open")
+            existing_trades = await self._pg(self.postgres.get_trades, status="open")
             existing_symbols = {t['symbol']: t['id'] for t in existing_trades}
             
             synced_count = 0
+            new_trades = []
+            updates = []
+            now = datetime.now().isoformat()
             for trade in active_trades:
-                symbol = trade.get('symbol')
-                if not symbol:
-                    continue
+                symbol = trade['symbol']
                 
                 # Prepare trade data for PostgreSQL
                 trade_data = {
+                    **_floats(trade, _ACTIVE_FLOAT_KEYS),
                     'symbol': symbol,
-                    'entry_price': float(trade.get('entry_price', 0)),
-                    'quantity': float(trade.get('quantity', 0)),
-                    'entry_time': trade.get('entry_time', datetime.now().isoformat()),
-                    'stop_loss': float(trade.get('stop_loss', 0)),
-                    'take_profit': float(trade.get('take_profit', 0)),
+                    'entry_time': trade.get('entry_time', now),
                     'status': 'open',
                     'strategy': trade.get('strategy', 'default'),
                     'timeframe': trade.get('timeframe', '1h'),
-                    'confidence': float(trade.get('confidence', 0))
                 }
                 
                 # Update or insert trade
                 if symbol in existing_symbols:
-                    # Update existing trade
+                    # Update existing trades in one batch below
                     trade_id = existing_symbols[symbol]
-                    update_data = {
-                        'current_price': float(trade.get('current_price', 0)),
-                        'pnl': float(trade.get('pnl', 0))
-                    }
-                    self.postgres.update_trade(trade_id, update_data)
+                    updates.append((trade_id, _floats(trade, _UPDATE_FLOAT_KEYS)))
                 else:
-                    # Insert new trade
-                    self.postgres.save_trade(trade_data)
+                    # Insert new trades in one batch below
+                    new_trades.append(trade_data)
                 
                 synced_count += 1
             
-            logger.info(f"Synced {synced_count} active trades from Redis to PostgreSQL")
+            await self._pg(self.postgres.update_trades_bulk, updates)
+            await self._pg(self.postgres.save_trades_bulk, new_trades)
+            logger.info("Synced %s active trades from Redis to PostgreSQL", synced_count)
             return True
         
         except Exception as e:
-            logger.error(f"Error syncing active trades: {e}")
+            logger.error("Error syncing active trades: %s", e)
             return False
     
     async def sync_signals(self) -> bool:
@@ -116,48 +194,71 @@ class DataSyncManager:
         Returns:
             bool: Success status
         """
-        if not self.redis.is_connected() or not self.postgres.is_connected():
+        if not await self._connected():
             logger.error("Cannot sync signals: Database connections not available")
             return False
         
         try:
-            # Get all signal keys from Redis
-            signal_keys = self.redis.redis.keys("signal:*")
+            # Get all signal keys from Redis (SCAN does not block the server
+            # like KEYS), then fetch every value in one MGET round trip
+            signal_keys = [key async for key in self._redis.scan_iter(match="signal:*", count=500)]
             if not signal_keys:
                 logger.info("No signals found in Redis to sync")
                 return True
             
-            synced_count = 0
-            for key in signal_keys:
-                signal_data = self.redis.redis.get(key)
+            # signal:{symbol} holds the latest signal and is read by the bot,
+            # so keys stay in place; a timestamp watermark skips the ones
+            # already persisted by an earlier sync
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.get(SIGNAL_WATERMARK_KEY)
+            pipe.mget(signal_keys)
+            watermark, signal_values = await pipe.execute()
+            
+            pg_signals = []
+            newest = watermark
+            now = datetime.now().isoformat()
+            for key, signal_data in zip(signal_keys, signal_values):
                 if not signal_data:
                     continue
                 
-                signal_dict = json.loads(signal_data)
+                signal_dict = json_loads(signal_data)
                 symbol = signal_dict.get("symbol")
                 if not symbol:
                     continue
                 
+                timestamp = signal_dict.get('timestamp')
+                if timestamp:
+                    if watermark and timestamp <= watermark:
+                        continue
+                    newest = max(newest or timestamp, timestamp)
+                
                 # Prepare signal data for PostgreSQL
                 pg_signal_data = {
+                    **_floats(signal_dict, _SIGNAL_FLOAT_KEYS),
                     'symbol': symbol,
                     'signal_type': signal_dict.get('signal', 'neutral'),
-                    'confidence': float(signal_dict.get('confidence', 0)),
-                    'price': float(signal_dict.get('price', 0)),
                     'timeframes': signal_dict.get('timeframes', []),
                     'indicators': signal_dict.get('indicators', {}),
-                    'timestamp': signal_dict.get('timestamp', datetime.now().isoformat())
+                    'timestamp': timestamp or now
                 }
                 
-                # Save signal to PostgreSQL
-                self.postgres.save_signal(pg_signal_data)
-                synced_count += 1
+                pg_signals.append(pg_signal_data)
+            
+            if not pg_signals:
+                logger.info("No new signals in Redis to sync")
+                return True
             
-            logger.info(f"Synced {synced_count} signals from Redis to PostgreSQL")
+            # Save all signals to PostgreSQL in one batch, then advance the
+            # watermark (ISO timestamps sort chronologically as strings)
+            if await self._pg(self.postgres.save_signals_bulk, pg_signals) < 0:
+                return False
+            if newest:
+                await self._redis.set(SIGNAL_WATERMARK_KEY, newest)
+            logger.info("Synced %s signals from Redis to PostgreSQL", len(pg_signals))
             return True
         
         except Exception as e:
-            logger.error(f"Error syncing signals: {e}")
+            logger.error("Error syncing signals: %s", e)
             return False
     
     async def sync_market_data(self) -> bool:
@@ -167,47 +268,60 @@ class DataSyncManager:
         Returns:
             bool: Success status
         """
-        if not self.redis.is_connected() or not self.postgres.is_connected():
+        if not await self._connected():
             logger.error("Cannot sync market data: Database connections not available")
             return False
         
         try:
-            # Get all OHLCV keys from Redis
-            ohlcv_keys = self.redis.redis.keys("ohlcv:*")
+            # Stream OHLCV keys from Redis (str, as the client decodes
+            # responses) and keep the ones naming a symbol and timeframe
+            # Format: ohlcv:{symbol}:{timeframe}
+            ohlcv_keys = []
+            targets = []
+            async for key in self._redis.scan_iter(match="ohlcv:*", count=1000):
+                parts = key.split(':')
+                # Skip companion keys such as ohlcv:{symbol}:{timeframe}:close
+                if len(parts) != 3:
+                    continue
+                ohlcv_keys.append(key)
+                targets.append((parts[1], parts[2]))
             if not ohlcv_keys:
                 logger.info("No OHLCV data found in Redis to sync")
                 return True
             
-            synced_count = 0
-            for key in ohlcv_keys:
-                # Parse key to get symbol and timeframe
-                # Format: ohlcv:{symbol}:{timeframe}
-                parts = key.decode('utf-8').split(':')
-                if len(parts) < 3:
-                    continue
-                
-                symbol = parts[1]
-                timeframe = parts[2]
-                
-                # Get OHLCV data from Redis
-                ohlcv_data = self.redis.redis.get(key)
-                if not ohlcv_data:
-                    continue
-                
-                # Parse OHLCV data
-                ohlcv_list = json.loads(ohlcv_data)
-                if not ohlcv_list:
-                    continue
-                
-                # Save to PostgreSQL
-                self.postgres.save_market_data(symbol, timeframe, ohlcv_list)
-                synced_count += 1
+            # Fetch all datasets in one MGET, as bytes
+            # since the frames are cached in Arrow format
+            ohlcv_values = await self._redis_bin.mget(ohlcv_keys)
+            
+            def parse() -> list:
+                datasets = []
+                for (symbol, timeframe), data in zip(targets, ohlcv_values):
+                    if not data:
+                        continue
+                    try:
+                        ohlcv_list = _ohlcv_rows(data)
+                    except Exception as e:
+                        logger.warning(
+                            "Skipping unreadable OHLCV data for %s %s: %s", symbol, timeframe, e
+                        )
+                        continue
+                    if ohlcv_list:
+                        datasets.append((symbol, timeframe, ohlcv_list))
+                return datasets
+            
+            # Decoding frames is CPU work, keep it off the event loop
+            datasets = await asyncio.to_thread(parse)
+            
+            # Save every dataset to PostgreSQL in one upsert, which falls
+            # back to one per dataset if any of them fails
+            if await self._pg(self.postgres.save_market_data_bulk, datasets) < 0:
+                return False
             
-            logger.info(f"Synced {synced_count} OHLCV datasets from Redis to PostgreSQL")
+            logger.info("Synced %s OHLCV datasets from Redis to PostgreSQL", len(datasets))
             return True
         
         except Exception as e:
-            logger.error(f"Error syncing market data: {e}")
+            logger.error("Error syncing market data: %s", e)
             return False
     
     async def sync_confidence_levels(self) -> bool:
@@ -217,26 +331,27 @@ class DataSyncManager:
         Returns:
             bool: Success status
         """
-        if not self.redis.is_connected() or not self.postgres.is_connected():
+        if not await self._connected():
             logger.error("Cannot sync confidence levels: Database connections not available")
             return False
         
         try:
             # Get confidence levels from Redis
-            redis_conf_data = self.redis.redis.get("confidence_levels")
+            redis_conf_data = await self._redis.get("confidence_levels")
             if not redis_conf_data:
                 logger.info("No confidence levels found in Redis to sync")
                 return True
             
-            confidence_data = json.loads(redis_conf_data)
-            synced_count = 0
+            confidence_data = json_loads(redis_conf_data)
+            pg_signals = []
+            now = datetime.now().isoformat()
             
             for symbol, data in confidence_data.items():
                 if symbol == "last_updated" or not isinstance(data, dict):
                     continue
                 
                 confidence = data.get("confidence", 0)
-                timestamp = data.get("timestamp", datetime.now().isoformat())
+                timestamp = data.get("timestamp", now)
                 timeframes = data.get("analyzed_timeframes", [])
                 
                 # Determine signal type based on confidence
@@ -251,15 +366,15 @@ class DataSyncManager:
                     'timestamp': timestamp
                 }
                 
-                # Save as signal to PostgreSQL
-                self.postgres.save_signal(pg_signal_data)
-                synced_count += 1
+                pg_signals.append(pg_signal_data)
             
-            logger.info(f"Synced {synced_count} confidence levels from Redis to PostgreSQL")
+            # Save as signals to PostgreSQL in one batch
+            await self._pg(self.postgres.save_signals_bulk, pg_signals)
+            logger.info("Synced %s confidence levels from Redis to PostgreSQL", len(pg_signals))
             return True
         
         except Exception as e:
-            logger.error(f"Error syncing confidence levels: {e}")
+            logger.error("Error syncing confidence levels: %s", e)
             return False
     
     async def sync_closed_trades(self) -> bool:
@@ -271,24 +386,31 @@ class DataSyncManager:
         """
         try:
             # Get closed trades from status file
-            closed_trades = self.monitor.get_closed_trades()
+            closed_trades = await asyncio.to_thread(self.monitor.get_closed_trades)
+            # Only trades with a symbol and entry time can be matched
+            closed_trades = [
+                t for t in closed_trades
+                if t.get('symbol') and t.get('entry_time')
+            ]
             if not closed_trades:
                 logger.info("No closed trades found in status file to sync")
                 return True
             
-            # Get existing trades from PostgreSQL to avoid duplicates
-            existing_trades = self.postgres.get_trades(status="closed")
+            # Get existing trades from PostgreSQL to avoid duplicates, keyed
+            # by (symbol, entry time ISO string)
+            existing_trades = await self._pg(self.postgres.get_trades, status="closed")
             existing_entries = {
-                f"{t['symbol']}_{t['entry_time'].isoformat()}": t['id'] 
+                (t['symbol'], t['entry_time'].isoformat()): t['id']
                 for t in existing_trades
             }
             
             synced_count = 0
+            new_trades = []
+            updates = []
+            now = datetime.now().isoformat()
             for trade in closed_trades:
-                symbol = trade.get('symbol')
-                entry_time = trade.get('entry_time')
-                if not symbol or not entry_time:
-                    continue
+                symbol = trade['symbol']
+                entry_time = trade['entry_time']
                 
                 # Create a unique key for this trade
                 if isinstance(entry_time, str):
@@ -296,19 +418,14 @@ class DataSyncManager:
                 else:
                     entry_time_str = entry_time.isoformat()
                 
-                trade_key = f"{symbol}_{entry_time_str}"
+                trade_key = (symbol, entry_time_str)
                 
                 # Prepare trade data for PostgreSQL
                 trade_data = {
+                    **_floats(trade, _CLOSED_FLOAT_KEYS),
                     'symbol': symbol,
-                    'entry_price': float(trade.get('entry_price', 0)),
-                    'exit_price': float(trade.get('exit_price', 0)),
-                    'quantity': float(trade.get('quantity', 0)),
                     'entry_time': entry_time_str,
-                    'exit_time': trade.get('exit_time', datetime.now().isoformat()),
-                    'profit_pct': float(trade.get('profit_pct', 0)),
-                    'stop_loss': float(trade.get('stop_loss', 0)),
-                    'take_profit': float(trade.get('take_profit', 0)),
+                    'exit_time': trade.get('exit_time', now),
                     'status': 'closed',
                     'strategy': trade.get('strategy', 'default'),
                     'timeframe': trade.get('timeframe', '1h')
@@ -316,20 +433,22 @@ class DataSyncManager:
                 
                 # Update or insert trade
                 if trade_key in existing_entries:
-                    # Update existing trade
+                    # Update existing trades in one batch below
                     trade_id = existing_entries[trade_key]
-                    self.postgres.update_trade(trade_id, trade_data)
+                    updates.append((trade_id, trade_data))
                 else:
-                    # Insert new trade
-                    self.postgres.save_trade(trade_data)
+                    # Insert new trades in one batch below
+                    new_trades.append(trade_data)
                 
                 synced_count += 1
             
-            logger.info(f"Synced {synced_count} closed trades from status file to PostgreSQL")
+            await self._pg(self.postgres.update_trades_bulk, updates)
+            await self._pg(self.postgres.save_trades_bulk, new_trades)
+            logger.info("Synced %s closed trades from status file to PostgreSQL", synced_count)
             return True
         
         except Exception as e:
-            logger.error(f"Error syncing closed trades: {e}")
+            logger.error("Error syncing closed trades: %s", e)
             return False
     
     async def sync_all(self) -> Dict[str, bool]:
@@ -339,16 +458,25 @@ class DataSyncManager:
         Returns:
             Dict[str, bool]: Results of each sync operation
         """
-        results = {
-            "active_trades": await self.sync_active_trades(),
-            "signals": await self.sync_signals(),
-            "market_data": await self.sync_market_data(),
-            "confidence_levels": await self.sync_confidence_levels(),
-            "closed_trades": await self.sync_closed_trades()
+        # The syncs touch independent data, so run them concurrently
+        operations = {
+            "active_trades": self.sync_active_trades(),
+            "signals": self.sync_signals(),
+            "market_data": self.sync_market_data(),
+            "confidence_levels": self.sync_confidence_levels(),
+            "closed_trades": self.sync_closed_trades()
         }
+        outcomes = await asyncio.gather(*operations.values(), return_exceptions=True)
+        
+        results = {}
+        for name, outcome in zip(operations, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Error in %s sync: %s", name, outcome)
+                outcome = False
+            results[name] = outcome
         
         self.last_sync = datetime.now()
-        logger.info(f"Completed full data sync at {self.last_sync.isoformat()}")
+        logger.info("Completed full data sync at %s", self.last_sync.isoformat())
         
         return results
 
@@ -371,5 +499,13 @@ async def run_sync():
 
 
 if __name__ == "__main__":
+    # uvloop cuts per-await overhead for the Redis/PostgreSQL I/O; use the
+    # default loop where it is not installed (e.g. Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run sync as standalone script
     asyncio.run(run_sync())
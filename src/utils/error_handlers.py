@@ -3,13 +3,15 @@ Error handling decorators and utilities for standardized error management.
 """
 
 import functools
-import traceback
-from typing import Optional, Dict, Any
+import random
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
 import ccxt
 import asyncio
 
 from config.settings import TELEGRAM_CONFIG
-from src.utils.telegram_utils import send_telegram_message
+from src.utils.telegram_utils import enqueue_telegram_message
 from src.utils.structured_logger import get_logger
 
 logger = get_logger(__name__)
@@ -63,6 +65,60 @@ class StrategyError(Exception):
     pass
 
 
+# ccxt error -> (raised wrapper, message label), checked in order, so
+# subclasses come first: ccxt's InvalidOrder subclasses its ExchangeError.
+# Its NetworkError subclasses OperationFailed, not ExchangeError
+_EXCHANGE_ERROR_MAP = (
+    (ccxt.InvalidOrder, OrderError, "Invalid order"),
+    (ccxt.NetworkError, NetworkError, "Network error"),
+    (ccxt.ExchangeError, ExchangeError, "Exchange error"),
+)
+
+
+def _exchange_error(e: Exception, fn_name: str, templates: tuple, unexpected: str):
+    """Log e and return (message, exception to raise or None to re-raise)"""
+    for ccxt_error, wrapper, template in templates:
+        if isinstance(e, ccxt_error):
+            error_msg = template.format(e)
+            logger.error(error_msg)
+            return error_msg, wrapper(error_msg, e, {"function": fn_name})
+
+    error_msg = unexpected.format(e)
+    logger.error(error_msg, exc_info=True)
+    return error_msg, None
+
+
+# Identical error notifications are sent at most once per this many seconds
+_NOTIFY_TTL = 60.0
+# Prune expired entries once this many distinct errors have been seen
+_NOTIFY_MAX_KEYS = 1024
+_last_notified: Dict[Tuple[str, str, str], float] = {}
+# Decorated methods also fail on worker threads, which must not prune
+# _last_notified while another thread iterates it
+_notify_lock = threading.Lock()
+
+
+def _should_notify(fn_name: str, e: Exception) -> bool:
+    """Whether to send a notification for e, suppressing recent duplicates"""
+    key = (fn_name, type(e).__name__, str(e)[:80])
+    with _notify_lock:
+        now = time.monotonic()
+        last = _last_notified.get(key)
+        if last is not None and now - last < _NOTIFY_TTL:
+            return False
+
+        if len(_last_notified) >= _NOTIFY_MAX_KEYS:
+            expired = [
+                k for k, t in _last_notified.items() if now - t >= _NOTIFY_TTL
+            ]
+            for k in expired:
+                del _last_notified[k]
+            if len(_last_notified) >= _NOTIFY_MAX_KEYS:
+                _last_notified.clear()
+        _last_notified[key] = now
+        return True
+
+
 def handle_exchange_errors(notify: bool = True):
     """
     Decorator for handling exchange-related errors in a consistent way
@@ -72,94 +128,46 @@ def handle_exchange_errors(notify: bool = True):
     """
 
     def decorator(func):
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except ccxt.NetworkError as e:  # noqa: F841
-                error_msg = f"Network error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if notify and TELEGRAM_CONFIG["enabled"]:
-                    await send_telegram_message(f"🔴 {error_msg}")
-                raise NetworkError(error_msg, e, {"function": func.__name__})
-            except ccxt.ExchangeError as e:  # noqa: F841
-                error_msg = f"Exchange error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if notify and TELEGRAM_CONFIG["enabled"]:
-                    await send_telegram_message(f"🔴 {error_msg}")
-                raise ExchangeError(error_msg, e, {"function": func.__name__})
-            except ccxt.InvalidOrder as e:  # noqa: F841
-                error_msg = f"Invalid order in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if notify and TELEGRAM_CONFIG["enabled"]:
-                    await send_telegram_message(f"🔴 {error_msg}")
-                raise OrderError(error_msg, e, {"function": func.__name__})
-            except Exception as e:  # noqa: F841
-                error_msg = f"Unexpected error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                if notify and TELEGRAM_CONFIG["enabled"]:
-                    await send_telegram_message(f"🔴 {error_msg}")
-                raise
+        fn_name = func.__name__
+        notify_enabled = notify and TELEGRAM_CONFIG["enabled"]
+        # Messages for this function, leaving only the error to fill in
+        templates = tuple(
+            (ccxt_error, wrapper, f"{label} in {fn_name}: {{}}")
+            for ccxt_error, wrapper, label in _EXCHANGE_ERROR_MAP
+        )
+        unexpected = f"Unexpected error in {fn_name}: {{}}"
+
+        def exchange_error(e: Exception):
+            error_msg, error = _exchange_error(e, fn_name, templates, unexpected)
+            if notify_enabled and _should_notify(fn_name, e):
+                enqueue_telegram_message(f"🔴 {error_msg}")
+            return error
+
+        # Build only the wrapper matching the decorated function
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    error = exchange_error(e)
+                    if error is None:
+                        raise
+                    raise error from e
+
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except ccxt.NetworkError as e:  # noqa: F841
-                error_msg = f"Network error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if (
-                    notify
-                    and TELEGRAM_CONFIG["enabled"]
-                    and asyncio.get_event_loop().is_running()
-                ):
-                    asyncio.create_task(
-                        send_telegram_message(f"🔴 {error_msg}")
-                    )
-                raise NetworkError(error_msg, e, {"function": func.__name__})
-            except ccxt.ExchangeError as e:  # noqa: F841
-                error_msg = f"Exchange error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if (
-                    notify
-                    and TELEGRAM_CONFIG["enabled"]
-                    and asyncio.get_event_loop().is_running()
-                ):
-                    asyncio.create_task(
-                        send_telegram_message(f"🔴 {error_msg}")
-                    )
-                raise ExchangeError(error_msg, e, {"function": func.__name__})
-            except ccxt.InvalidOrder as e:  # noqa: F841
-                error_msg = f"Invalid order in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                if (
-                    notify
-                    and TELEGRAM_CONFIG["enabled"]
-                    and asyncio.get_event_loop().is_running()
-                ):
-                    asyncio.create_task(
-                        send_telegram_message(f"🔴 {error_msg}")
-                    )
-                raise OrderError(error_msg, e, {"function": func.__name__})
-            except Exception as e:  # noqa: F841
-                error_msg = f"Unexpected error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                if (
-                    notify
-                    and TELEGRAM_CONFIG["enabled"]
-                    and asyncio.get_event_loop().is_running()
-                ):
-                    asyncio.create_task(
-                        send_telegram_message(f"🔴 {error_msg}")
-                    )
-                raise
-
-        # Return appropriate wrapper based on whether the decorated function is async
+            except Exception as e:
+                error = exchange_error(e)
+                if error is None:
+                    raise
+                raise error from e
 
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
@@ -174,40 +182,36 @@ def handle_strategy_errors(notify: bool = False):
     """
 
     def decorator(func):
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:  # noqa: F841
-                error_msg = f"Strategy error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                if notify and TELEGRAM_CONFIG["enabled"]:
-                    await send_telegram_message(f"🟠 {error_msg}")
-                raise StrategyError(error_msg)
+        fn_name = func.__name__
+        notify_enabled = notify and TELEGRAM_CONFIG["enabled"]
+
+        def strategy_error(e: Exception) -> StrategyError:
+            error_msg = f"Strategy error in {fn_name}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            if notify_enabled and _should_notify(fn_name, e):
+                enqueue_telegram_message(f"🟠 {error_msg}")
+            return StrategyError(error_msg)
+
+        # Build only the wrapper matching the decorated function; the async
+        # one awaits func directly with no other await on the success path
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    raise strategy_error(e) from e
+
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except Exception as e:  # noqa: F841
-                error_msg = f"Strategy error in {func.__name__}: {str(e)}"
-                logger.error(error_msg)
-                logger.error(traceback.format_exc())
-                if (
-                    notify
-                    and TELEGRAM_CONFIG["enabled"]
-                    and asyncio.get_event_loop().is_running()
-                ):
-                    asyncio.create_task(
-                        send_telegram_message(f"🟠 {error_msg}")
-                    )
-                raise StrategyError(error_msg)
+            except Exception as e:
+                raise strategy_error(e) from e
 
-        # Return appropriate wrapper based on whether the decorated function is async
-
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
 
     return decorator
@@ -218,6 +222,8 @@ def retry_with_backoff(
     initial_backoff: float = 1.0,
     backoff_factor: float = 2.0,
     exceptions_to_retry=(NetworkError, ConnectionError),
+    max_backoff: float = 60.0,
+    jitter: bool = True,
 ):
     """
     Decorator that retries a function with exponential backoff on specified
@@ -228,9 +234,27 @@ def retry_with_backoff(
         initial_backoff: Initial backoff time in seconds
         backoff_factor: Factor to increase backoff time with each retry
         exceptions_to_retry: Tuple of exceptions that should trigger a retry
+        max_backoff: Upper bound for the backoff time in seconds
+        jitter: Add a random delay of up to the backoff time, so callers
+            failing together do not retry together
     """
 
     def decorator(func):
+        fn_name = func.__name__
+
+        def next_delay(retries: int, backoff: float) -> Optional[float]:
+            """Delay before the next attempt, or None once retries run out"""
+            if retries > max_retries:
+                logger.error(
+                    f"Max retries ({max_retries}) exceeded for {fn_name}"
+                )
+                return None
+            delay = backoff + (random.uniform(0, backoff) if jitter else 0.0)
+            logger.warning(
+                f"Retrying {fn_name} after {delay:.2f}s (attempt {retries}/{max_retries})"  # noqa: E501
+            )
+            return delay
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             retries = 0
@@ -239,19 +263,13 @@ def retry_with_backoff(
             while True:
                 try:
                     return await func(*args, **kwargs)
-                except exceptions_to_retry as e:  # noqa: F841
+                except exceptions_to_retry:
                     retries += 1
-                    if retries > max_retries:
-                        logger.error(
-                            f"Max retries ({max_retries}) exceeded for {func.__name__}"
-                        )
+                    delay = next_delay(retries, backoff)
+                    if delay is None:
                         raise
-
-                    logger.warning(
-                        f"Retrying {func.__name__} after {backoff}s (attempt {retries}/{max_retries})"  # noqa: E501
-                    )
-                    await asyncio.sleep(backoff)
-                    backoff *= backoff_factor
+                    await asyncio.sleep(delay)
+                    backoff = min(backoff * backoff_factor, max_backoff)
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -261,20 +279,13 @@ def retry_with_backoff(
             while True:
                 try:
                     return func(*args, **kwargs)
-                except exceptions_to_retry as e:  # noqa: F841
+                except exceptions_to_retry:
                     retries += 1
-                    if retries > max_retries:
-                        logger.error(
-                            f"Max retries ({max_retries}) exceeded for {func.__name__}"
-                        )
+                    delay = next_delay(retries, backoff)
+                    if delay is None:
                         raise
-
-                    logger.warning(
-                        f"Retrying {func.__name__} after {backoff}s (attempt {retries}/{max_retries})"  # noqa: E501
-                    )
-                    import time
-                    time.sleep(backoff)
-                    backoff *= backoff_factor
+                    time.sleep(delay)
+                    backoff = min(backoff * backoff_factor, max_backoff)
 
         # Return appropriate wrapper based on whether the decorated function is async
 
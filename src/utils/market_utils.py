@@ -0,0 +1,182 @@
+"""
+Market data helpers: OHLCV fetch, order sizing and config checks
+
+pandas and ccxt are only needed by callers that already hold a DataFrame
+or an exchange, so they are imported lazily to keep ``src.utils`` light.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import ccxt
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Compile the market stats reduction when numba is available; otherwise
+# run it as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def fetch_ohlcv(
+    exchange: ccxt.Exchange,
+    symbol: str,
+    limit: int = 50,
+    timeframe: str = "1m",
+    return_raw: bool = False,
+) -> Union[pd.DataFrame, List[List[float]]]:
+    """Fetch OHLCV candles, as a DataFrame or the exchange's raw list.
+
+    Pass ``return_raw=True`` when the caller only forwards the candles
+    (e.g. to Redis as JSON) to skip building the DataFrame.
+    """
+    import pandas as pd
+
+    try:
+        # Fetch OHLCV data
+        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        if return_raw:
+            return ohlcv
+
+        # Convert to DataFrame from one float64 block (no per-cell type
+        # inference) and the timestamps as a datetime64[ms] view
+        values = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+        df = pd.DataFrame(
+            values,
+            columns=["timestamp", "open", "high", "low", "close", "volume"],
+        )
+        df["timestamp"] = pd.DatetimeIndex(
+            values[:, 0].astype(np.int64).astype("datetime64[ms]")
+        )
+
+        return df
+    except Exception as e:
+        logger.error("Error fetching OHLCV data: %s", e)
+        raise
+
+
+# Minimum order amount per (exchange id, symbol), stored with the markets
+# dict it was read from so a load_markets(reload=True) invalidates it
+_MARKET_CACHE: Dict[tuple, tuple] = {}
+
+
+def _min_amount(exchange: ccxt.Exchange, symbol: str) -> float:
+    key = (exchange.id, symbol)
+    markets = exchange.markets
+    cached = _MARKET_CACHE.get(key)
+    if cached is not None and markets is not None and cached[0] is markets:
+        return cached[1]
+
+    market = exchange.market(symbol)
+    min_amount = market["limits"]["amount"]["min"]
+    _MARKET_CACHE[key] = (exchange.markets, min_amount)
+    return min_amount
+
+
+def calculate_min_order_size(
+    exchange: ccxt.Exchange, symbol: str, market_price: float
+) -> float:
+    try:
+        # Get minimum amount from market limits
+        min_amount = _min_amount(exchange, symbol)
+
+        # Calculate minimum order size in quote currency
+        min_order_size = min_amount * market_price
+
+        # Apply a small buffer to ensure we're above minimum
+        return min_order_size * 1.01
+    except Exception as e:
+        logger.error("Error calculating minimum order size: %s", e)
+        raise
+
+
+@njit("UniTuple(float64, 4)(float64[:], float64[:])", cache=True)
+def _market_stats(close, volume):
+    """Last price/volume and their percent change from the previous bar.
+
+    A change is 0 when the previous value is 0.
+    """
+    prev_close = close[-2]
+    prev_volume = volume[-2]
+    price_change = 0.0
+    if prev_close != 0.0:
+        price_change = (close[-1] - prev_close) / prev_close * 100.0
+    volume_change = 0.0
+    if prev_volume != 0.0:
+        volume_change = (volume[-1] - prev_volume) / prev_volume * 100.0
+    return close[-1], volume[-1], price_change, volume_change
+
+
+def update_market_data(df: pd.DataFrame) -> Dict[str, Any]:
+    try:
+        if len(df) < 2:
+            raise IndexError("update_market_data needs at least two bars")
+
+        current_price, current_volume, price_change, volume_change = (
+            _market_stats(
+                df["close"].to_numpy(dtype=np.float64),
+                df["volume"].to_numpy(dtype=np.float64),
+            )
+        )
+
+        return {
+            "current_price": current_price,
+            "current_volume": current_volume,
+            "price_change_percent": price_change,
+            "volume_change_percent": volume_change,
+            "timestamp": datetime.now().isoformat(),
+        }
+    except Exception as e:
+        logger.error("Error updating market data: %s", e)
+        raise
+
+
+def validate_config() -> bool:
+    """
+    Validate the configuration settings
+    """
+    from config.settings import (
+        TRADING_CONFIG,
+        EXCHANGE_CONFIG,
+        TELEGRAM_CONFIG,
+    )
+
+    try:
+        # Validate trading config
+        if TRADING_CONFIG["max_open_trades"] < 1:
+            logger.error("max_open_trades must be at least 1")
+            return False
+
+        # Validate exchange config
+        if not EXCHANGE_CONFIG["api_key"] or not EXCHANGE_CONFIG["api_secret"]:
+            logger.error("Missing API credentials")
+            return False
+
+        # Validate Telegram config if enabled
+        if TELEGRAM_CONFIG["enabled"]:
+            if (
+                not TELEGRAM_CONFIG["bot_token"]
+                or not TELEGRAM_CONFIG["chat_id"]
+            ):
+                logger.error(
+                    "Telegram enabled but missing bot_token or chat_id"
+                )
+                return False
+
+        return True
+
+    except Exception as e:
+        logger.error("Error validating config: %s", e)
+        return False
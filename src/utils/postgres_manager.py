@@ -3,60 +3,210 @@ PostgreSQL Manager for Trading Bot
 Handles database connections and operations for storing trading data
 """
 import os
+import csv
+import io
 import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 
+import numpy as np
 import psycopg2
-from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.extensions import connection as _PgConnection
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 
 from config.settings import POSTGRES_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Columns written by the trade, market data and signal inserts
+TRADE_COLUMNS = [
+    'symbol', 'entry_price', 'exit_price', 'quantity',
+    'entry_time', 'exit_time', 'profit_pct', 'stop_loss',
+    'take_profit', 'status', 'strategy', 'timeframe', 'confidence'
+]
+MARKET_DATA_COLUMNS_SQL = (
+    'symbol, timeframe, open, high, low, close, volume, timestamp'
+)
+SIGNAL_COLUMNS = [
+    'symbol', 'signal_type', 'confidence', 'price',
+    'timeframes', 'indicators', 'timestamp'
+]
+
+
+def _trade_row(trade_data: Dict[str, Any]) -> List[Any]:
+    """Normalize trade data into a row of TRADE_COLUMNS values"""
+    # Ensure datetime objects for timestamps
+    if 'entry_time' in trade_data and isinstance(trade_data['entry_time'], str):
+        trade_data['entry_time'] = datetime.fromisoformat(trade_data['entry_time'])
+    
+    if 'exit_time' in trade_data and isinstance(trade_data['exit_time'], str):
+        trade_data['exit_time'] = datetime.fromisoformat(trade_data['exit_time'])
+    
+    return [trade_data.get(col) for col in TRADE_COLUMNS]
+
+
+def _update_trade_query(columns: Tuple[str, ...]) -> str:
+    """UPDATE for the given trade columns, with the trade id as last parameter"""
+    set_clause = ', '.join([f"{key} = %s" for key in columns])
+    return f"""
+        UPDATE trades
+        SET {set_clause}
+        WHERE id = %s
+    """
+
+
+def _signal_row(signal_data: Dict[str, Any]) -> List[Any]:
+    """Normalize signal data into a row of SIGNAL_COLUMNS values"""
+    # Convert lists/dicts to JSON for JSONB fields
+    if 'timeframes' in signal_data and not isinstance(signal_data['timeframes'], str):
+        signal_data['timeframes'] = json.dumps(signal_data['timeframes'])
+    
+    if 'indicators' in signal_data and not isinstance(signal_data['indicators'], str):
+        signal_data['indicators'] = json.dumps(signal_data['indicators'])
+    
+    # Ensure timestamp is a datetime object
+    if 'timestamp' in signal_data and isinstance(signal_data['timestamp'], str):
+        signal_data['timestamp'] = datetime.fromisoformat(signal_data['timestamp'])
+    elif 'timestamp' not in signal_data:
+        signal_data['timestamp'] = datetime.now()
+    
+    return [signal_data.get(col) for col in SIGNAL_COLUMNS]
+
+
+def _local_timestamps(ms: np.ndarray) -> List[str]:
+    """ISO local times for epoch milliseconds, as datetime.fromtimestamp gives
+    
+    When the UTC offset is the same at both ends of a span under 30 days
+    there is no DST change in between, so one offset converts the whole
+    array; otherwise each timestamp is converted on its own.
+    """
+    if not len(ms):
+        return []
+    
+    first, last = float(ms.min()) / 1000, float(ms.max()) / 1000
+    offsets = {
+        datetime.fromtimestamp(t) - datetime.fromtimestamp(t, timezone.utc).replace(tzinfo=None)
+        for t in (first, last)
+    }
+    if len(offsets) == 1 and last - first < 30 * 24 * 3600:
+        offset_ms = offsets.pop() // timedelta(milliseconds=1)
+        local = (ms.astype(np.int64) + offset_ms).astype('datetime64[ms]')
+        return np.datetime_as_string(local).tolist()
+    
+    return [datetime.fromtimestamp(t / 1000).isoformat() for t in ms.tolist()]
+
+
+class _PreparedConnection(_PgConnection):
+    """Connection that remembers the statements PREPAREd in its session"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Prepared statement names, keyed by query text
+        self.prepared: Dict[Any, str] = {}
+
+
 class PostgresManager:
     """
     Manages PostgreSQL database connections and operations
     for storing trading data for long-term analysis
     """
     def __init__(self, config: Dict[str, Any] = None):
-        """Initialize PostgreSQL connection"""
+        """Initialize PostgreSQL connection pool"""
         self.config = config or POSTGRES_CONFIG
-        self.conn = None
-        self.cursor = None
+        self.pool: Optional[ThreadedConnectionPool] = None
         self._initialize_connection()
         self._setup_tables()
     
     def _initialize_connection(self) -> None:
-        """Establish connection to PostgreSQL database"""
+        """Create the pool of connections to the PostgreSQL database"""
         try:
-            self.conn = psycopg2.connect(
+            self.pool = ThreadedConnectionPool(
+                minconn=self.config.get('min_connections', 2),
+                maxconn=self.config.get('max_connections', 10),
                 host=self.config.get('host', 'localhost'),
                 port=self.config.get('port', 5432),
                 database=self.config.get('database', 'trading_bot'),
                 user=self.config.get('user', 'postgres'),
-                password=self.config.get('password', '')
+                password=self.config.get('password', ''),
+                connection_factory=_PreparedConnection
             )
-            self.conn.autocommit = True
-            self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
             logger.info("Successfully connected to PostgreSQL database")
         except Exception as e:
             logger.error(f"Failed to connect to PostgreSQL: {e}")
-            self.conn = None
-            self.cursor = None
+            self.pool = None
     
     def is_connected(self) -> bool:
-        """Check if connection to PostgreSQL is active"""
-        if self.conn is None:
-            return False
+        """Check if the PostgreSQL connection pool is available"""
+        return self.pool is not None and not self.pool.closed
+    
+    @contextmanager
+    def _cursor(self, name: Optional[str] = None) -> Iterator[RealDictCursor]:
+        """Borrow a pooled connection and yield a cursor on it
+        
+        Connections run in autocommit mode as every operation is a single
+        statement. A connection that fails with a connection-level error is
+        discarded instead of returned, so the pool opens a fresh one.
+        
+        Args:
+            name: Open a server-side cursor of this name, which fetches rows
+                in batches of ``itersize``. It lives in a read-only
+                transaction that is rolled back when the block exits.
+        """
+        conn = self.pool.getconn()
+        broken = False
         try:
-            # Try a simple query to check connection
-            self.cursor.execute("SELECT 1")
-            return True
-        except Exception:
-            self._initialize_connection()
-            return self.conn is not None
+            if conn.closed:
+                # Dropped by the server while idle in the pool
+                self.pool.putconn(conn, close=True)
+                conn = self.pool.getconn()
+            # Named cursors only exist inside a transaction
+            autocommit = name is None
+            if conn.autocommit != autocommit:
+                conn.autocommit = autocommit
+            try:
+                with conn.cursor(name=name, cursor_factory=RealDictCursor) as cur:
+                    yield cur
+            finally:
+                if name is not None and not conn.closed:
+                    conn.rollback()
+                    conn.autocommit = True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self.pool.putconn(conn, close=broken or bool(conn.closed))
+    
+    @staticmethod
+    def _prepare(cur: RealDictCursor, query: str, param_count: int) -> str:
+        """Name of query as a prepared statement of the cursor's session
+        
+        The first call on a connection PREPAREs the query, with its %s
+        placeholders renumbered to $1..$n.
+        """
+        prepared = cur.connection.prepared
+        name = prepared.get(query)
+        if name is None:
+            name = f"stmt_{len(prepared)}"
+            numbered = tuple(f"${i}" for i in range(1, param_count + 1))
+            cur.execute(f"PREPARE {name} AS {query % numbered}")
+            prepared[query] = name
+        return name
+    
+    def _execute_prepared(self, cur: RealDictCursor, query: str, params: List[Any]) -> None:
+        """Execute query as a prepared statement of the cursor's session
+        
+        After the first call on a connection only EXECUTE is sent with the
+        parameters, so the server skips parsing and planning.
+        """
+        name = self._prepare(cur, query, len(params))
+        if params:
+            placeholders = ', '.join(['%s'] * len(params))
+            cur.execute(f"EXECUTE {name} ({placeholders})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
     
     def _setup_tables(self) -> None:
         """Create necessary tables if they don't exist"""
@@ -65,62 +215,78 @@ class PostgresManager:
             return
         
         try:
-            # Create trades table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    id SERIAL PRIMARY KEY,
-                    symbol VARCHAR(20) NOT NULL,
-                    entry_price NUMERIC NOT NULL,
-                    exit_price NUMERIC,
-                    current_price NUMERIC,
-                    quantity NUMERIC NOT NULL,
-                    entry_time TIMESTAMP NOT NULL,
-                    exit_time TIMESTAMP,
-                    profit_pct NUMERIC,
-                    pnl NUMERIC,
-                    stop_loss NUMERIC,
-                    take_profit NUMERIC,
-                    status VARCHAR(20) NOT NULL,
-                    strategy VARCHAR(50),
-                    timeframe VARCHAR(10),
-                    confidence NUMERIC,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create signals table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS signals (
-                    id SERIAL PRIMARY KEY,
-                    symbol VARCHAR(20) NOT NULL,
-                    signal_type VARCHAR(10) NOT NULL,
-                    confidence NUMERIC NOT NULL,
-                    price NUMERIC,
-                    timeframes JSONB,
-                    indicators JSONB,
-                    timestamp TIMESTAMP NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create market_data table for storing OHLCV
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS market_data (
-                    id SERIAL PRIMARY KEY,
-                    symbol VARCHAR(20) NOT NULL,
-                    timeframe VARCHAR(10) NOT NULL,
-                    open NUMERIC NOT NULL,
-                    high NUMERIC NOT NULL,
-                    low NUMERIC NOT NULL,
-                    close NUMERIC NOT NULL,
-                    volume NUMERIC NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(symbol, timeframe, timestamp)
-                )
-            """)
-            
-            logger.info("Database tables created successfully")
+            with self._cursor() as cur:
+                # Create trades table
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS trades (
+                        id SERIAL PRIMARY KEY,
+                        symbol VARCHAR(20) NOT NULL,
+                        entry_price NUMERIC NOT NULL,
+                        exit_price NUMERIC,
+                        current_price NUMERIC,
+                        quantity NUMERIC NOT NULL,
+                        entry_time TIMESTAMP NOT NULL,
+                        exit_time TIMESTAMP,
+                        profit_pct NUMERIC,
+                        pnl NUMERIC,
+                        stop_loss NUMERIC,
+                        take_profit NUMERIC,
+                        status VARCHAR(20) NOT NULL,
+                        strategy VARCHAR(50),
+                        timeframe VARCHAR(10),
+                        confidence NUMERIC,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # Create signals table
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS signals (
+                        id SERIAL PRIMARY KEY,
+                        symbol VARCHAR(20) NOT NULL,
+                        signal_type VARCHAR(10) NOT NULL,
+                        confidence NUMERIC NOT NULL,
+                        price NUMERIC,
+                        timeframes JSONB,
+                        indicators JSONB,
+                        timestamp TIMESTAMP NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                
+                # Create market_data table for storing OHLCV
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS market_data (
+                        id SERIAL PRIMARY KEY,
+                        symbol VARCHAR(20) NOT NULL,
+                        timeframe VARCHAR(10) NOT NULL,
+                        open NUMERIC NOT NULL,
+                        high NUMERIC NOT NULL,
+                        low NUMERIC NOT NULL,
+                        close NUMERIC NOT NULL,
+                        volume NUMERIC NOT NULL,
+                        timestamp TIMESTAMP NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(symbol, timeframe, timestamp)
+                    )
+                """)
+                
+                # Indexes for the get_* filters and their ORDER BY. The
+                # market_data UNIQUE constraint already indexes
+                # (symbol, timeframe, timestamp), which serves both the
+                # upsert and get_market_data's newest-first scan
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS ix_trades_status_entry_time
+                        ON trades (status, entry_time DESC);
+                    CREATE INDEX IF NOT EXISTS ix_trades_symbol_status
+                        ON trades (symbol, status);
+                    CREATE INDEX IF NOT EXISTS ix_signals_timestamp
+                        ON signals (timestamp DESC);
+                    CREATE INDEX IF NOT EXISTS ix_signals_symbol_timestamp
+                        ON signals (symbol, timestamp DESC)
+                """)
+                
+                logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Error setting up database tables: {e}")
     
@@ -139,35 +305,21 @@ class PostgresManager:
             return -1
         
         try:
-            # Prepare data for insertion
-            columns = [
-                'symbol', 'entry_price', 'exit_price', 'quantity', 
-                'entry_time', 'exit_time', 'profit_pct', 'stop_loss', 
-                'take_profit', 'status', 'strategy', 'timeframe', 'confidence'
-            ]
-            
-            # Ensure datetime objects for timestamps
-            if 'entry_time' in trade_data and isinstance(trade_data['entry_time'], str):
-                trade_data['entry_time'] = datetime.fromisoformat(trade_data['entry_time'])
-            
-            if 'exit_time' in trade_data and isinstance(trade_data['exit_time'], str):
-                trade_data['exit_time'] = datetime.fromisoformat(trade_data['exit_time'])
-            
-            # Build query
-            values = [trade_data.get(col) for col in columns]
-            placeholders = ', '.join(['%s'] * len(columns))
-            columns_str = ', '.join(columns)
-            
-            query = f"""
-                INSERT INTO trades ({columns_str})
-                VALUES ({placeholders})
-                RETURNING id
-            """
-            
-            self.cursor.execute(query, values)
-            trade_id = self.cursor.fetchone()['id']
-            logger.info(f"Saved trade to PostgreSQL with ID: {trade_id}")
-            return trade_id
+            with self._cursor() as cur:
+                values = _trade_row(trade_data)
+                placeholders = ', '.join(['%s'] * len(TRADE_COLUMNS))
+                columns_str = ', '.join(TRADE_COLUMNS)
+                
+                query = f"""
+                    INSERT INTO trades ({columns_str})
+                    VALUES ({placeholders})
+                    RETURNING id
+                """
+                
+                self._execute_prepared(cur, query, values)
+                trade_id = cur.fetchone()['id']
+                logger.info(f"Saved trade to PostgreSQL with ID: {trade_id}")
+                return trade_id
         
         except Exception as e:
             logger.error(f"Error saving trade to PostgreSQL: {e}")
@@ -189,26 +341,59 @@ class PostgresManager:
             return False
         
         try:
-            # Build SET clause
-            set_clause = ', '.join([f"{key} = %s" for key in update_data.keys()])
-            values = list(update_data.values())
-            values.append(trade_id)  # For WHERE clause
-            
-            query = f"""
-                UPDATE trades
-                SET {set_clause}
-                WHERE id = %s
-            """
-            
-            self.cursor.execute(query, values)
-            affected_rows = self.cursor.rowcount
-            logger.info(f"Updated trade {trade_id} in PostgreSQL, {affected_rows} rows affected")
-            return affected_rows > 0
+            with self._cursor() as cur:
+                values = list(update_data.values())
+                values.append(trade_id)  # For WHERE clause
+                
+                query = _update_trade_query(tuple(update_data.keys()))
+                self._execute_prepared(cur, query, values)
+                affected_rows = cur.rowcount
+                logger.info(f"Updated trade {trade_id} in PostgreSQL, {affected_rows} rows affected")
+                return affected_rows > 0
         
         except Exception as e:
             logger.error(f"Error updating trade in PostgreSQL: {e}")
             return False
     
+    def update_trades_bulk(self, updates: List[Tuple[int, Dict[str, Any]]]) -> int:
+        """
+        Apply many trade updates in one round trip per set of updated fields
+        
+        Args:
+            updates: List of (trade_id, update_data) tuples
+            
+        Returns:
+            int: Number of updates sent, or -1 on error
+        """
+        if not updates:
+            return 0
+        
+        if not self.is_connected():
+            logger.error("Cannot update trades: No database connection")
+            return -1
+        
+        try:
+            # Group updates touching the same columns under one statement
+            groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+            for trade_id, update_data in updates:
+                groups.setdefault(tuple(update_data.keys()), []).append(
+                    [*update_data.values(), trade_id]
+                )
+            
+            with self._cursor() as cur:
+                for columns, rows in groups.items():
+                    name = self._prepare(cur, _update_trade_query(columns), len(columns) + 1)
+                    placeholders = ', '.join(['%s'] * (len(columns) + 1))
+                    # execute_batch joins the EXECUTEs into one round trip per page
+                    execute_batch(cur, f"EXECUTE {name} ({placeholders})", rows, page_size=100)
+                
+                logger.info(f"Updated {len(updates)} trades in PostgreSQL")
+                return len(updates)
+        
+        except Exception as e:
+            logger.error(f"Error updating trades in PostgreSQL: {e}")
+            return -1
+    
     def save_signal(self, signal_data: Dict[str, Any]) -> int:
         """
         Save trading signal to PostgreSQL
@@ -224,43 +409,75 @@ class PostgresManager:
             return -1
         
         try:
-            # Prepare data for insertion
-            columns = [
-                'symbol', 'signal_type', 'confidence', 'price',
-                'timeframes', 'indicators', 'timestamp'
-            ]
-            
-            # Convert lists/dicts to JSON for JSONB fields
-            if 'timeframes' in signal_data and not isinstance(signal_data['timeframes'], str):
-                signal_data['timeframes'] = json.dumps(signal_data['timeframes'])
-            
-            if 'indicators' in signal_data and not isinstance(signal_data['indicators'], str):
-                signal_data['indicators'] = json.dumps(signal_data['indicators'])
-            
-            # Ensure timestamp is a datetime object
-            if 'timestamp' in signal_data and isinstance(signal_data['timestamp'], str):
-                signal_data['timestamp'] = datetime.fromisoformat(signal_data['timestamp'])
-            elif 'timestamp' not in signal_data:
-                signal_data['timestamp'] = datetime.now()
-            
-            # Build query
-            values = [signal_data.get(col) for col in columns]
-            placeholders = ', '.join(['%s'] * len(columns))
-            columns_str = ', '.join(columns)
+            with self._cursor() as cur:
+                values = _signal_row(signal_data)
+                placeholders = ', '.join(['%s'] * len(SIGNAL_COLUMNS))
+                columns_str = ', '.join(SIGNAL_COLUMNS)
+                
+                query = f"""
+                    INSERT INTO signals ({columns_str})
+                    VALUES ({placeholders})
+                    RETURNING id
+                """
+                
+                self._execute_prepared(cur, query, values)
+                signal_id = cur.fetchone()['id']
+                logger.info(f"Saved signal to PostgreSQL with ID: {signal_id}")
+                return signal_id
+        
+        except Exception as e:
+            logger.error(f"Error saving signal to PostgreSQL: {e}")
+            return -1
+    
+    def save_trades_bulk(self, trades: List[Dict[str, Any]]) -> int:
+        """
+        Insert many trades in a single statement
+        
+        Args:
+            trades: List of dictionaries containing trade information
             
-            query = f"""
-                INSERT INTO signals ({columns_str})
-                VALUES ({placeholders})
-                RETURNING id
-            """
+        Returns:
+            int: Number of inserted rows, or -1 on error
+        """
+        return self._insert_bulk("trades", TRADE_COLUMNS, trades, _trade_row)
+    
+    def save_signals_bulk(self, signals: List[Dict[str, Any]]) -> int:
+        """
+        Insert many trading signals in a single statement
+        
+        Args:
+            signals: List of dictionaries containing signal information
             
-            self.cursor.execute(query, values)
-            signal_id = self.cursor.fetchone()['id']
-            logger.info(f"Saved signal to PostgreSQL with ID: {signal_id}")
-            return signal_id
+        Returns:
+            int: Number of inserted rows, or -1 on error
+        """
+        return self._insert_bulk("signals", SIGNAL_COLUMNS, signals, _signal_row)
+    
+    def _insert_bulk(self, table: str, columns: List[str],
+                     records: List[Dict[str, Any]],
+                     to_row: Callable[[Dict[str, Any]], List[Any]]) -> int:
+        """Insert records into table with one execute_values call"""
+        if not records:
+            return 0
+        
+        if not self.is_connected():
+            logger.error(f"Cannot save {table}: No database connection")
+            return -1
+        
+        try:
+            with self._cursor() as cur:
+                rows = [to_row(record) for record in records]
+                execute_values(
+                    cur,
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s",
+                    rows,
+                    page_size=1000
+                )
+                logger.info(f"Saved {len(rows)} {table} rows to PostgreSQL")
+                return len(rows)
         
         except Exception as e:
-            logger.error(f"Error saving signal to PostgreSQL: {e}")
+            logger.error(f"Error saving {table} to PostgreSQL: {e}")
             return -1
     
     def save_market_data(self, symbol: str, timeframe: str, ohlcv_data: List[List[Any]]) -> bool:
@@ -275,34 +492,106 @@ class PostgresManager:
         Returns:
             bool: Success status
         """
+        return self.save_market_data_bulk([(symbol, timeframe, ohlcv_data)]) >= 0
+    
+    def save_market_data_bulk(self, datasets: List[Tuple[str, str, List[List[Any]]]]) -> int:
+        """
+        Upsert OHLCV data for many symbol/timeframe pairs with one COPY
+        
+        If the combined upsert fails, each dataset is retried on its own so
+        one bad dataset does not lose the others.
+        
+        Args:
+            datasets: List of (symbol, timeframe, ohlcv_data) tuples
+            
+        Returns:
+            int: Number of inserted or changed rows, or -1 if nothing was saved
+        """
+        if not datasets:
+            return 0
+        
         if not self.is_connected():
             logger.error("Cannot save market data: No database connection")
-            return False
+            return -1
         
         try:
-            # Prepare data for batch insertion
-            values = []
-            for candle in ohlcv_data:
-                # Standard OHLCV format: [timestamp, open, high, low, close, volume]
-                timestamp = datetime.fromtimestamp(candle[0] / 1000)  # Convert from milliseconds
-                values.append((
-                    symbol,
-                    timeframe,
-                    float(candle[1]),  # open
-                    float(candle[2]),  # high
-                    float(candle[3]),  # low
-                    float(candle[4]),  # close
-                    float(candle[5]),  # volume
-                    timestamp
-                ))
-            
-            # Use execute_values for efficient batch insert
-            execute_values(
-                self.cursor,
-                """
-                INSERT INTO market_data 
-                (symbol, timeframe, open, high, low, close, volume, timestamp)
-                VALUES %s
+            count = self._upsert_market_data(datasets)
+            logger.info(
+                f"Saved {count} new or changed OHLCV records for {len(datasets)} datasets "
+                f"to PostgreSQL"
+            )
+            return count
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            # The connection failed, retrying per dataset would too
+            logger.error(f"Error saving market data to PostgreSQL: {e}")
+            return -1
+        except Exception as e:
+            if len(datasets) == 1:
+                logger.error(f"Error saving market data to PostgreSQL: {e}")
+                return -1
+            logger.warning(f"Bulk market data save failed, saving datasets one by one: {e}")
+        
+        count = 0
+        saved = 0
+        for symbol, timeframe, ohlcv_data in datasets:
+            try:
+                count += self._upsert_market_data([(symbol, timeframe, ohlcv_data)])
+                saved += 1
+            except Exception as e:
+                logger.error(
+                    f"Error saving market data for {symbol} {timeframe} to PostgreSQL: {e}"
+                )
+        
+        if not saved:
+            return -1
+        logger.info(
+            f"Saved {count} new or changed OHLCV records for {saved} of {len(datasets)} "
+            f"datasets to PostgreSQL"
+        )
+        return count
+    
+    def _upsert_market_data(self, datasets: List[Tuple[str, str, List[List[Any]]]]) -> int:
+        """Stage datasets with COPY and upsert them, raising on any error"""
+        # Standard OHLCV format: [timestamp, open, high, low, close, volume]
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for symbol, timeframe, ohlcv_data in datasets:
+            if not ohlcv_data:
+                continue
+            candles = np.asarray(ohlcv_data, dtype=np.float64).reshape(-1, 6)
+            # open, high, low, close, volume columns, then the timestamps
+            writer.writerows(zip(
+                repeat(symbol),
+                repeat(timeframe),
+                *candles[:, 1:6].T.tolist(),
+                _local_timestamps(candles[:, 0])
+            ))
+        buf.seek(0)
+        
+        with self._cursor() as cur:
+            # COPY streams the rows into a session-local staging table,
+            # then one INSERT ... SELECT applies the upsert. The TRUNCATE
+            # also clears rows left behind by a failed earlier call
+            cur.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS market_data_stage (
+                    symbol VARCHAR(20),
+                    timeframe VARCHAR(10),
+                    open NUMERIC,
+                    high NUMERIC,
+                    low NUMERIC,
+                    close NUMERIC,
+                    volume NUMERIC,
+                    timestamp TIMESTAMP
+                );
+                TRUNCATE market_data_stage
+            """)
+            cur.copy_expert(
+                f"COPY market_data_stage ({MARKET_DATA_COLUMNS_SQL}) FROM STDIN WITH CSV",
+                buf
+            )
+            cur.execute(f"""
+                INSERT INTO market_data ({MARKET_DATA_COLUMNS_SQL})
+                SELECT {MARKET_DATA_COLUMNS_SQL} FROM market_data_stage
                 ON CONFLICT (symbol, timeframe, timestamp) 
                 DO UPDATE SET
                     open = EXCLUDED.open,
@@ -310,16 +599,17 @@ class PostgresManager:
                     low = EXCLUDED.low,
                     close = EXCLUDED.close,
                     volume = EXCLUDED.volume
-                """,
-                values
-            )
-            
-            logger.info(f"Saved {len(values)} OHLCV records for {symbol} {timeframe} to PostgreSQL")
-            return True
-        
-        except Exception as e:
-            logger.error(f"Error saving market data to PostgreSQL: {e}")
-            return False
+                -- Closed candles come back unchanged on every sync; only
+                -- rewrite rows whose values moved (the still-forming bar)
+                WHERE (market_data.open, market_data.high, market_data.low,
+                       market_data.close, market_data.volume)
+                    IS DISTINCT FROM
+                      (EXCLUDED.open, EXCLUDED.high, EXCLUDED.low,
+                       EXCLUDED.close, EXCLUDED.volume)
+            """)
+            count = cur.rowcount
+            cur.execute("TRUNCATE market_data_stage")
+            return count
     
     def get_trades(self, 
                   symbol: Optional[str] = None, 
@@ -343,29 +633,30 @@ class PostgresManager:
             return []
         
         try:
-            conditions = []
-            params = []
-            
-            if symbol:
-                conditions.append("symbol = %s")
-                params.append(symbol)
-            
-            if status:
-                conditions.append("status = %s")
-                params.append(status)
-            
-            where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
-            
-            query = f"""
-                SELECT * FROM trades
-                {where_clause}
-                ORDER BY entry_time DESC
-                LIMIT %s OFFSET %s
-            """
-            
-            params.extend([limit, offset])
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            with self._cursor() as cur:
+                conditions = []
+                params = []
+                
+                if symbol:
+                    conditions.append("symbol = %s")
+                    params.append(symbol)
+                
+                if status:
+                    conditions.append("status = %s")
+                    params.append(status)
+                
+                where_clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+                
+                query = f"""
+                    SELECT * FROM trades
+                    {where_clause}
+                    ORDER BY entry_time DESC
+                    LIMIT %s OFFSET %s
+                """
+                
+                params.extend([limit, offset])
+                self._execute_prepared(cur, query, params)
+                return cur.fetchall()
         
         except Exception as e:
             logger.error(f"Error getting trades from PostgreSQL: {e}")
@@ -395,33 +686,36 @@ class PostgresManager:
             return []
         
         try:
-            conditions = ["timestamp > NOW() - INTERVAL '%s days'"]
-            params = [days]
-            
-            if symbol:
-                conditions.append("symbol = %s")
-                params.append(symbol)
-            
-            if signal_type:
-                conditions.append("signal_type = %s")
-                params.append(signal_type)
-            
-            if min_confidence > 0:
-                conditions.append("confidence >= %s")
-                params.append(min_confidence)
-            
-            where_clause = " WHERE " + " AND ".join(conditions)
-            
-            query = f"""
-                SELECT * FROM signals
-                {where_clause}
-                ORDER BY timestamp DESC
-                LIMIT %s
-            """
-            
-            params.append(limit)
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            with self._cursor() as cur:
+                # make_interval's days argument is an integer parameter, which
+                # keeps the prepared plan shared across look-back windows
+                conditions = ["timestamp > NOW() - make_interval(days => %s)"]
+                params = [int(days)]
+                
+                if symbol:
+                    conditions.append("symbol = %s")
+                    params.append(symbol)
+                
+                if signal_type:
+                    conditions.append("signal_type = %s")
+                    params.append(signal_type)
+                
+                if min_confidence > 0:
+                    conditions.append("confidence >= %s")
+                    params.append(min_confidence)
+                
+                where_clause = " WHERE " + " AND ".join(conditions)
+                
+                query = f"""
+                    SELECT * FROM signals
+                    {where_clause}
+                    ORDER BY timestamp DESC
+                    LIMIT %s
+                """
+                
+                params.append(limit)
+                self._execute_prepared(cur, query, params)
+                return cur.fetchall()
         
         except Exception as e:
             logger.error(f"Error getting signals from PostgreSQL: {e}")
@@ -447,30 +741,63 @@ class PostgresManager:
             return []
         
         try:
-            query = """
-                SELECT * FROM market_data
-                WHERE symbol = %s AND timeframe = %s
-                ORDER BY timestamp DESC
-                LIMIT %s
-            """
-            
-            self.cursor.execute(query, [symbol, timeframe, limit])
-            return self.cursor.fetchall()
+            with self._cursor() as cur:
+                query = """
+                    SELECT * FROM market_data
+                    WHERE symbol = %s AND timeframe = %s
+                    ORDER BY timestamp DESC
+                    LIMIT %s
+                """
+                
+                self._execute_prepared(cur, query, [symbol, timeframe, limit])
+                return cur.fetchall()
         
         except Exception as e:
             logger.error(f"Error getting market data from PostgreSQL: {e}")
             return []
     
+    def iter_market_data(self,
+                         symbol: str,
+                         timeframe: str,
+                         limit: int = 100,
+                         itersize: int = 2000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream OHLCV market data from PostgreSQL, newest first
+        
+        Rows come from a server-side cursor in batches of ``itersize``, so
+        long histories are never held in memory at once. The pooled
+        connection stays borrowed until the generator is exhausted or closed.
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe of the data
+            limit: Maximum number of records to yield
+            itersize: Number of rows fetched per round trip
+            
+        Yields:
+            OHLCV records
+        """
+        if not self.is_connected():
+            logger.error("Cannot get market data: No database connection")
+            return
+        
+        with self._cursor(name="market_data_iter") as cur:
+            cur.itersize = itersize
+            cur.execute("""
+                SELECT * FROM market_data
+                WHERE symbol = %s AND timeframe = %s
+                ORDER BY timestamp DESC
+                LIMIT %s
+            """, [symbol, timeframe, limit])
+            yield from cur
+    
     def close(self) -> None:
-        """Close database connection"""
-        if self.conn:
+        """Close all pooled database connections"""
+        if self.pool:
             try:
-                if self.cursor:
-                    self.cursor.close()
-                self.conn.close()
+                self.pool.closeall()
                 logger.info("PostgreSQL connection closed")
             except Exception as e:
                 logger.error(f"Error closing PostgreSQL connection: {e}")
             finally:
-                self.conn = None
-                self.cursor = None
+                self.pool = None
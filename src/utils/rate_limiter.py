@@ -4,10 +4,14 @@ Rate limiter and circuit breaker implementation
 
 import time
 import logging
+import random
+from array import array
 from collections import deque
-from datetime import datetime
 from functools import wraps
-from typing import Callable, Deque, Dict, Any
+from typing import Callable, Deque, Dict, Any, Optional
+
+from config.settings import SYSTEM_CONFIG, TELEGRAM_CONFIG
+from src.utils.telegram_utils import enqueue_telegram_message
 
 logger = logging.getLogger(__name__)
 
@@ -16,85 +20,182 @@ class RateLimiter:
     def __init__(self, max_requests: int, time_window: int):
         self.max_requests = max_requests
         self.time_window = time_window  # in seconds
-        self.requests: Deque[float] = deque()
+        # Monotonic times of the last max_requests requests, oldest at
+        # _idx; -inf marks slots not used yet
+        self._buf = array("d", [float("-inf")] * max_requests)
+        self._idx = 0
 
     def can_proceed(self) -> bool:
-        now = time.time()
-
-        # Remove old requests
-        while self.requests and now - self.requests[0] >= self.time_window:
-            self.requests.popleft()
+        now = time.monotonic()
 
-        # Check if we can make a new request
-        if len(self.requests) < self.max_requests:
-            self.requests.append(now)
+        # The window has room once the request max_requests ago left it
+        if now >= self._next_available():
+            self._take(now)
             return True
 
         return False
 
+    def _take(self, now: float):
+        """Record a request at now, replacing the oldest one"""
+        self._buf[self._idx] = now
+        self._idx = (self._idx + 1) % self.max_requests
+
+    def _next_available(self) -> float:
+        """Monotonic time at which the oldest request leaves the window"""
+        return self._buf[self._idx] + self.time_window
+
     def wait_if_needed(self):
+        # Sleep until the oldest slot frees up rather than polling for it
         while not self.can_proceed():
-            time.sleep(0.1)
+            time.sleep(max(0.0, self._next_available() - time.monotonic()))
         return True
 
 
 class CircuitBreaker:
-    def __init__(self, error_threshold: int, timeout: int):
+    """Closed/open/half-open breaker over a rolling window of call outcomes
+
+    While closed, the breaker trips after error_threshold consecutive
+    failures, or, if failure_ratio is set, once the last window_size calls
+    failed at that ratio. After timeout seconds open it lets
+    probe_limit calls through; a successful probe closes it, a failed one
+    opens it again with the timeout doubled, up to max_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        error_threshold: int,
+        timeout: int,
+        probe_limit: int = 1,
+        window_size: int = 20,
+        failure_ratio: Optional[float] = None,
+        max_timeout: Optional[float] = None,
+    ):
         self.error_threshold = error_threshold
+        self.base_timeout = timeout
         self.timeout = timeout
+        self.max_timeout = max_timeout if max_timeout is not None else timeout
+        self.probe_limit = probe_limit
+        self.failure_ratio = failure_ratio
+        # Recent outcomes while closed, True for an error, and their sum
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
         self.errors = 0
-        self.last_error_time = None
-        self.is_open = False
+        self.consecutive_errors = 0
+        self.state = self.CLOSED
+        self.opened_at = 0.0  # time.monotonic() when last opened
+        self.last_error_time = None  # time.monotonic() of the last error
+        self.probes_in_flight = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state != self.CLOSED
+
+    def _record(self, error: bool):
+        if len(self.outcomes) == self.outcomes.maxlen:
+            self.errors -= self.outcomes[0]
+        self.outcomes.append(error)
+        self.errors += error
+        self.consecutive_errors = self.consecutive_errors + 1 if error else 0
+
+    def _should_trip(self) -> bool:
+        if self.consecutive_errors >= self.error_threshold:
+            return True
+        return (
+            self.failure_ratio is not None
+            and len(self.outcomes) == self.outcomes.maxlen
+            and self.errors / len(self.outcomes) >= self.failure_ratio
+        )
 
-    def record_error(self):
-        now = datetime.now()
+    def _reset_window(self):
+        self.outcomes.clear()
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.probes_in_flight = 0
 
-        # Reset if we're past the timeout
-        if (
-            self.last_error_time
-            and (now - self.last_error_time).total_seconds() > self.timeout
-        ):
-            self.errors = 0
-            self.is_open = False
+    def _open(self, now: float):
+        self.state = self.OPEN
+        self.opened_at = now
+        self._reset_window()
 
-        self.errors += 1
+    def record_error(self):
+        now = time.monotonic()
         self.last_error_time = now
 
-        if self.errors >= self.error_threshold:
-            self.is_open = True
+        if self.state == self.HALF_OPEN:
+            # The probe failed, wait longer before the next one
+            self.timeout = min(self.timeout * 2, self.max_timeout)
+            self._open(now)
+        elif self.state == self.CLOSED:
+            self._record(True)
+            if self._should_trip():
+                self._open(now)
 
     def record_success(self):
-        self.errors = 0
-        self.is_open = False
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self.timeout = self.base_timeout
+            self._reset_window()
+        elif self.state == self.CLOSED:
+            self._record(False)
 
     def can_proceed(self) -> bool:
-        if not self.is_open:
+        if self.state == self.CLOSED:
             return True
 
-        # Check if we can retry
-        if (
-            self.last_error_time
-            and (datetime.now() - self.last_error_time).total_seconds()
-            > self.timeout
-        ):
-            self.is_open = False
-            self.errors = 0
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at <= self.timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self.probes_in_flight = 0
+
+        # Half open: let a limited number of probe calls through
+        if self.probes_in_flight < self.probe_limit:
+            self.probes_in_flight += 1
             return True
 
         return False
 
 
 class APIRateManager:
-    def __init__(self, config: Dict[str, Any]):
+    # Seconds to limit locally after the shared limiter fails
+    DISTRIBUTED_RETRY_DELAY = 30
+
+    def __init__(self, config: Dict[str, Any], redis_client=None):
         # Rate limiters
         self.minute_limiter = RateLimiter(
             config["max_requests_per_minute"], 60
         )
         self.order_limiter = RateLimiter(config["max_orders_per_second"], 1)
 
+        # Limits shared with other processes, enforced in Redis
+        self.distributed = None
+        self._distributed_retry_at = 0.0
+        if redis_client is not None:
+            from src.utils.redis_manager import DistributedRateLimiter
+
+            self.distributed = (
+                DistributedRateLimiter(
+                    redis_client,
+                    "minute",
+                    config["max_requests_per_minute"],
+                    60,
+                ),
+                DistributedRateLimiter(
+                    redis_client, "order", config["max_orders_per_second"], 1
+                ),
+            )
+
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker(
-            config["error_threshold"], config["circuit_timeout"]
+            config["error_threshold"],
+            config["circuit_timeout"],
+            probe_limit=config.get("circuit_probe_limit", 1),
+            window_size=config.get("circuit_window_size", 20),
+            failure_ratio=config.get("circuit_failure_ratio"),
+            max_timeout=config.get("circuit_max_timeout"),
         )
 
         # Backoff settings
@@ -103,6 +204,52 @@ class APIRateManager:
         self.backoff_factor = config["backoff_factor"]
         self.current_backoff = self.initial_backoff
 
+    def _wait_distributed(self, is_order: bool) -> bool:
+        """Wait on the shared limiters; False if Redis is unavailable"""
+        if (
+            self.distributed is None
+            or time.monotonic() < self._distributed_retry_at
+        ):
+            return False
+
+        limiters = self.distributed if is_order else self.distributed[:1]
+        try:
+            for limiter in limiters:
+                delay = limiter.acquire()
+                while delay > 0:
+                    time.sleep(delay)
+                    delay = limiter.acquire()
+            return True
+        except Exception as e:
+            logger.warning(
+                f"Shared rate limit unavailable, limiting locally: {e}"
+            )
+            self._distributed_retry_at = (
+                time.monotonic() + self.DISTRIBUTED_RETRY_DELAY
+            )
+            return False
+
+    def wait_if_needed(self, is_order: bool = False):
+        """Wait until every limiter that applies has room, then take a slot"""
+        if self._wait_distributed(is_order):
+            return True
+
+        limiters = (
+            (self.minute_limiter, self.order_limiter)
+            if is_order
+            else (self.minute_limiter,)
+        )
+        while True:
+            now = time.monotonic()
+            wake = max(limiter._next_available() for limiter in limiters)
+            if wake <= now:
+                # Take slots only once all have room, so a full order
+                # limiter does not use up a minute slot
+                for limiter in limiters:
+                    limiter._take(now)
+                return True
+            time.sleep(wake - now)
+
     def reset_backoff(self):
         self.current_backoff = self.initial_backoff
 
@@ -113,45 +260,60 @@ class APIRateManager:
 
     def wait_backoff(self):
         if self.current_backoff > self.initial_backoff:
-            logger.warning(
-                f"Backing off for {self.current_backoff} seconds"
-            )
-            time.sleep(self.current_backoff)
+            # Jitter the sleep, not current_backoff, so callers failing
+            # together do not retry in lockstep
+            delay = self.current_backoff * random.uniform(0.75, 1.25)
+            logger.warning(f"Backing off for {delay:.2f} seconds")
+            time.sleep(delay)
+
+
+# Rate managers shared by all instances of each decorated class, so short
+# lived objects cannot each start with a fresh limit
+_managers: Dict[type, APIRateManager] = {}
+
+
+def _get_manager(cls: type) -> APIRateManager:
+    manager = _managers.get(cls)
+    if manager is not None:
+        return manager
+
+    redis_client = None
+    if SYSTEM_CONFIG.get("shared_rate_limit"):
+        from src.utils.redis_manager import redis_manager
+
+        redis_client = redis_manager.redis
+    return _managers.setdefault(
+        cls, APIRateManager(SYSTEM_CONFIG, redis_client)
+    )
 
 
 def rate_limited_api(is_order: bool = False):
     """Decorator for rate-limited API calls"""
 
     def decorator(func: Callable):
+        max_retries = SYSTEM_CONFIG["max_api_retries"]
+        notify_enabled = TELEGRAM_CONFIG["enabled"]
+
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            from config.settings import SYSTEM_CONFIG, TELEGRAM_CONFIG
-            from src.utils import send_telegram_message
-
-            # Get rate manager instance
-            if not hasattr(self, "_rate_manager"):
-                self._rate_manager = APIRateManager(SYSTEM_CONFIG)
-
-            manager = self._rate_manager
+            manager = _get_manager(type(self))
 
             # Check circuit breaker
             if not manager.circuit_breaker.can_proceed():
                 msg = "Circuit breaker is open, waiting for timeout"
                 logger.error(msg)
-                if TELEGRAM_CONFIG["enabled"]:
-                    send_telegram_message(
+                if notify_enabled:
+                    enqueue_telegram_message(
                         f"🔴 {msg}"
                     )
                 time.sleep(1)
                 return None
 
             # Apply rate limiting
-            manager.minute_limiter.wait_if_needed()
-            if is_order:
-                manager.order_limiter.wait_if_needed()
+            manager.wait_if_needed(is_order)
 
             # Try the API call with backoff
-            for attempt in range(SYSTEM_CONFIG["max_api_retries"]):
+            for attempt in range(max_retries):
                 try:
                     result = func(self, *args, **kwargs)
 
@@ -166,13 +328,18 @@ def rate_limited_api(is_order: bool = False):
                     )
                     manager.circuit_breaker.record_error()
 
-                    if attempt < SYSTEM_CONFIG["max_api_retries"] - 1:
+                    # Give up early once this failure opened the breaker,
+                    # including a failed half-open probe re-opening it
+                    if (
+                        attempt < max_retries - 1
+                        and not manager.circuit_breaker.is_open
+                    ):
                         manager.increase_backoff()
                         manager.wait_backoff()
 
                     else:
-                        if TELEGRAM_CONFIG["enabled"]:
-                            send_telegram_message(
+                        if notify_enabled:
+                            enqueue_telegram_message(
                                 (
                                     (
                                         f"🔴 API call failed after {attempt + 1} attempts: {str(e)}"  # noqa: E501
@@ -2,19 +2,142 @@
 Redis manager for caching OHLCV data and indicators
 """
 
+import io
 import os
 import json
+import threading
+import time
+import uuid
+from itertools import count
+import numpy as np
 import pandas as pd
 import redis
-from typing import Dict, Any, Optional, List
+import redis.asyncio
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 from src.utils.structured_logger import get_logger
 
+# Use orjson for signal payloads when available (numpy scalars and
+# datetimes allowed), otherwise the stdlib json module
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> str:
+        # Datetimes as ISO 8601, matching orjson for naive values
+        return json.dumps(obj, default=datetime.isoformat)
+
+# Cache DataFrames as Arrow (Feather) when pyarrow is installed, otherwise
+# as JSON records. Readers accept either, recognising Arrow by its magic
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+_ARROW_MAGIC = b"ARROW1"
+
 logger = get_logger(__name__)
 
+
+def _encode_frame(df: pd.DataFrame) -> bytes:
+    """Serialize df, with its index as a column, for the Redis cache"""
+    df = df.reset_index()
+    if HAS_ARROW:
+        buf = io.BytesIO()
+        df.to_feather(buf)
+        return buf.getvalue()
+    return df.to_json(orient="records", date_format="iso").encode()
+
+
+def _decode_frame(data: bytes) -> pd.DataFrame:
+    """Inverse of _encode_frame, with timestamp restored as the index"""
+    if data.startswith(_ARROW_MAGIC):
+        df = pd.read_feather(io.BytesIO(data))
+    else:
+        df = pd.read_json(io.StringIO(data.decode()))
+    
+    # Set timestamp as index
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df.set_index("timestamp", inplace=True)
+    return df
+
+
+# Sliding-window rate limit: forget requests older than the window, then
+# admit this one if fewer than the limit remain. Returns 0 when admitted,
+# otherwise the milliseconds until the oldest request leaves the window
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+if redis.call('ZCARD', key) < tonumber(ARGV[3]) then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+
+
+class DistributedRateLimiter:
+    """Rate limit shared by every process using the same Redis server"""
+
+    def __init__(self, client: redis.Redis, name: str, max_requests: int, time_window: float):
+        """
+        Args:
+            client: Redis client to run the limit on
+            name: Limit name, stored under the key ``rl:{name}``
+            max_requests: Requests allowed per window
+            time_window: Window length in seconds
+        """
+        self.key = f"rl:{name}"
+        self.max_requests = max_requests
+        self._window_ms = int(time_window * 1000)
+        # Loaded once with SCRIPT LOAD, then run with EVALSHA
+        self._script = client.register_script(_SLIDING_WINDOW_LUA)
+        # Request members must be unique across processes
+        self._member_prefix = uuid.uuid4().hex
+        self._seq = count()
+
+    def acquire(self) -> float:
+        """Take a slot if one is free
+        
+        Returns:
+            0.0 if the request may proceed, otherwise the seconds until a
+            slot frees up
+            
+        Raises:
+            redis.RedisError: If Redis cannot be reached
+        """
+        # Wall clock, as timestamps are compared between processes
+        now_ms = int(time.time() * 1000)
+        member = f"{self._member_prefix}:{next(self._seq)}"
+        wait_ms = self._script(
+            keys=[self.key],
+            args=[now_ms, self._window_ms, self.max_requests, member],
+        )
+        return int(wait_ms) / 1000.0
+
+
 class RedisManager:
     """Redis manager for caching OHLCV data and indicators"""
+    
+    # Seconds a successful command vouches for the connection
+    HEALTH_TTL = 5.0
+    # Expiry of cached market data and of the latest signal, in seconds
+    TTL_WEEK = 7 * 24 * 60 * 60
+    TTL_DAY = 24 * 60 * 60
 
     def __init__(self, config=None):
         """Initialize Redis connection
@@ -33,6 +156,8 @@ class RedisManager:
             socket_connect_timeout = 5
             retry_on_timeout = True
             health_check_interval = 30
+            unix_socket_path = os.environ.get("REDIS_UNIX_SOCKET") or None
+            max_connections = int(os.environ.get("REDIS_MAX_CONNECTIONS", 32))
         else:
             # Use provided config
             redis_host = config.get("host", "localhost")
@@ -43,35 +168,108 @@ class RedisManager:
             socket_connect_timeout = config.get("socket_connect_timeout", 5)
             retry_on_timeout = config.get("retry_on_timeout", True)
             health_check_interval = config.get("health_check_interval", 30)
+            unix_socket_path = config.get("unix_socket_path") or None
+            max_connections = config.get("max_connections", 32)
         
-        # Initialize Redis client
-        self.redis = redis.Redis(
-            host=redis_host,
-            port=redis_port,
+        # Initialize Redis client, over a Unix socket when Redis runs on the
+        # same host
+        self._connection_kwargs = dict(
             password=redis_password,
             decode_responses=decode_responses,
             socket_timeout=socket_timeout,
-            socket_connect_timeout=socket_connect_timeout,
             retry_on_timeout=retry_on_timeout,
             health_check_interval=health_check_interval
         )
+        if unix_socket_path:
+            self._connection_kwargs["unix_socket_path"] = unix_socket_path
+        else:
+            self._connection_kwargs.update(
+                host=redis_host,
+                port=redis_port,
+                socket_connect_timeout=socket_connect_timeout
+            )
+        # max_connections caps both pools together: the binary client, only
+        # used for DataFrame entries, gets a quarter of it
+        self.max_connections = max_connections
+        bin_connections = max(1, max_connections // 4)
+        self.redis = self._client(decode_responses, max(1, max_connections - bin_connections))
+        # Client returning raw bytes, for the binary DataFrame cache
+        self.redis_bin = self._client(False, bin_connections)
+        # Monotonic time of the last successful command, 0 when unknown
+        self._last_ok = 0.0
         
         # Test connection
         try:
             self.redis.ping()
+            self._record_ok()
             logger.info("Connected to Redis server", host=redis_host, port=redis_port)
-        except redis.ConnectionError as e:
+        except redis.RedisError as e:
             logger.error(f"Failed to connect to Redis: {e}", host=redis_host, port=redis_port)
             # Continue without Redis - fallback to direct API calls
     
+    def _client(self, decode_responses: bool, max_connections: int) -> redis.Redis:
+        """Create a client on its own pool of up to max_connections sockets
+        
+        Callers beyond that wait for a free connection rather than failing.
+        """
+        kwargs = {**self._connection_kwargs, "decode_responses": decode_responses}
+        unix_socket_path = kwargs.pop("unix_socket_path", None)
+        if unix_socket_path:
+            kwargs.update(
+                connection_class=redis.UnixDomainSocketConnection,
+                path=unix_socket_path
+            )
+        pool = redis.BlockingConnectionPool(max_connections=max_connections, **kwargs)
+        return redis.Redis(connection_pool=pool)
+    
     def is_connected(self) -> bool:
-        """Check if Redis is connected"""
+        """Check if Redis is connected
+        
+        Skips the PING while a command succeeded within HEALTH_TTL seconds.
+        """
+        if time.monotonic() - self._last_ok < self.HEALTH_TTL:
+            return True
         try:
-            return self.redis.ping()
+            connected = self.redis.ping()
         except:
-            return False
+            connected = False
+        self._last_ok = time.monotonic() if connected else 0.0
+        return connected
+    
+    def _record_ok(self) -> None:
+        self._last_ok = time.monotonic()
+    
+    def _record_error(self, error: Exception) -> None:
+        # Make the next is_connected() ping again after a connection failure
+        if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            self._last_ok = 0.0
+    
+    def async_client(self, decode_responses: bool = True) -> "redis.asyncio.Redis":
+        """Create an asyncio Redis client with the same connection settings
+        
+        For use from coroutines, where the blocking ``self.redis`` client
+        would stall the event loop. Responses are decoded to ``str`` unless
+        decode_responses is False, as binary cache entries need.
+        """
+        return redis.asyncio.Redis(
+            **{**self._connection_kwargs, "decode_responses": decode_responses}
+        )
     
     # OHLCV Data Methods
+    def _pipe_ohlcv(self, pipe, symbol: str, timeframe: str, df: pd.DataFrame, now: str) -> None:
+        """Queue the writes caching df on pipe
+        
+        The frame is kept for 7 days, along with its close prices as raw
+        float64 bytes for readers that need nothing else, and the time of
+        the update.
+        """
+        key = f"ohlcv:{symbol}:{timeframe}"
+        pipe.set(key, _encode_frame(df), ex=self.TTL_WEEK)
+        if "close" in df.columns:
+            close = df["close"].to_numpy(dtype=np.float64)
+            pipe.set(f"{key}:close", close.tobytes(), ex=self.TTL_WEEK)
+        pipe.set(f"{key}:last_update", now)
+    
     def save_ohlcv(self, symbol: str, timeframe: str, df: pd.DataFrame) -> bool:
         """Save OHLCV data to Redis
         
@@ -83,23 +281,14 @@ class RedisManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.is_connected() or df.empty:
+        if df.empty:
             return False
         
         try:
-            # Convert DataFrame to JSON
-            json_data = df.reset_index().to_json(orient="records", date_format="iso")
-            
-            # Set key and save data
-            key = f"ohlcv:{symbol}:{timeframe}"
-            self.redis.set(key, json_data)
-            
-            # Set expiration (keep data for 7 days)
-            self.redis.expire(key, 60 * 60 * 24 * 7)
-            
-            # Save last update timestamp
-            update_key = f"ohlcv:{symbol}:{timeframe}:last_update"
-            self.redis.set(update_key, datetime.now().isoformat())
+            pipe = self.redis.pipeline(transaction=False)
+            self._pipe_ohlcv(pipe, symbol, timeframe, df, datetime.now().isoformat())
+            pipe.execute()
+            self._record_ok()
             
             logger.debug(
                 f"Saved OHLCV data to Redis",
@@ -109,6 +298,7 @@ class RedisManager:
             )
             return True
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error saving OHLCV data to Redis: {e}", symbol=symbol, timeframe=timeframe)
             return False
     
@@ -128,19 +318,13 @@ class RedisManager:
         try:
             # Get key
             key = f"ohlcv:{symbol}:{timeframe}"
-            json_data = self.redis.get(key)
+            data = self.redis_bin.get(key)
+            self._record_ok()
             
-            if not json_data:
+            if not data:
                 return None
             
-            # Convert JSON to DataFrame
-            from io import StringIO
-            df = pd.read_json(StringIO(json_data))
-            
-            # Set timestamp as index
-            if "timestamp" in df.columns:
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-                df.set_index("timestamp", inplace=True)
+            df = _decode_frame(data)
             
             logger.debug(
                 f"Retrieved OHLCV data from Redis",
@@ -150,9 +334,124 @@ class RedisManager:
             )
             return df
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error getting OHLCV data from Redis: {e}", symbol=symbol, timeframe=timeframe)
             return None
     
+    def save_ohlcv_bulk(self, frames: Dict[Tuple[str, str], pd.DataFrame]) -> bool:
+        """Save OHLCV data for many symbol/timeframe pairs in one round trip
+        
+        Args:
+            frames: DataFrames with OHLCV data, keyed by (symbol, timeframe)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        frames = {pair: df for pair, df in frames.items() if not df.empty}
+        if not frames:
+            return False
+        
+        try:
+            now = datetime.now().isoformat()
+            pipe = self.redis.pipeline(transaction=False)
+            for (symbol, timeframe), df in frames.items():
+                self._pipe_ohlcv(pipe, symbol, timeframe, df, now)
+            pipe.execute()
+            self._record_ok()
+            
+            logger.debug("Saved OHLCV data to Redis", datasets=len(frames))
+            return True
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Error saving OHLCV data to Redis: {e}", datasets=len(frames))
+            return False
+    
+    def get_close(self, symbol: str, timeframe: str) -> Optional[np.ndarray]:
+        """Get cached close prices without rebuilding the DataFrame
+        
+        Args:
+            symbol: Trading pair symbol
+            timeframe: Timeframe (e.g., '1h', '15m')
+            
+        Returns:
+            Read-only float64 array of close prices, oldest first, or None if
+            not found
+        """
+        return self.get_close_bulk([(symbol, timeframe)]).get((symbol, timeframe))
+    
+    def get_close_bulk(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], np.ndarray]:
+        """Get cached close prices for many symbol/timeframe pairs in one MGET
+        
+        Args:
+            pairs: (symbol, timeframe) pairs to look up
+            
+        Returns:
+            Read-only float64 arrays of close prices keyed by pair; pairs not
+            cached are left out
+        """
+        if not pairs or not self.is_connected():
+            return {}
+        
+        try:
+            keys = [f"ohlcv:{symbol}:{timeframe}:close" for symbol, timeframe in pairs]
+            values = self.redis_bin.mget(keys)
+            self._record_ok()
+            return {
+                pair: np.frombuffer(data, dtype=np.float64)
+                for pair, data in zip(pairs, values)
+                if data
+            }
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Error getting close prices from Redis: {e}", pairs=len(pairs))
+            return {}
+    
+    def _get_frames_bulk(
+        self, prefix: str, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """Cached DataFrames for the pairs found under prefix, in one MGET
+        
+        Entries that fail to decode are skipped, so one corrupt entry does
+        not lose the others.
+        """
+        if not pairs or not self.is_connected():
+            return {}
+        
+        keys = [f"{prefix}:{symbol}:{timeframe}" for symbol, timeframe in pairs]
+        values = self.redis_bin.mget(keys)
+        self._record_ok()
+        
+        frames = {}
+        for (symbol, timeframe), data in zip(pairs, values):
+            if not data:
+                continue
+            try:
+                frames[(symbol, timeframe)] = _decode_frame(data)
+            except Exception as e:
+                logger.warning(
+                    f"Skipping unreadable {prefix} data in Redis: {e}",
+                    symbol=symbol,
+                    timeframe=timeframe
+                )
+        return frames
+    
+    def get_ohlcv_bulk(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """Get OHLCV data for many symbol/timeframe pairs in one round trip
+        
+        Args:
+            pairs: (symbol, timeframe) pairs to look up
+            
+        Returns:
+            DataFrames with OHLCV data keyed by pair; pairs not cached are
+            left out
+        """
+        try:
+            return self._get_frames_bulk("ohlcv", pairs)
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Error getting OHLCV data from Redis: {e}", pairs=len(pairs))
+            return {}
+    
     # Indicator Methods
     def save_indicators(self, symbol: str, timeframe: str, df: pd.DataFrame) -> bool:
         """Save indicators to Redis
@@ -165,7 +464,7 @@ class RedisManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.is_connected() or df.empty:
+        if df.empty:
             return False
         
         try:
@@ -178,19 +477,17 @@ class RedisManager:
             # Create a DataFrame with only indicators
             indicators_df = df[indicator_columns].copy()
             
-            # Convert DataFrame to JSON
-            json_data = indicators_df.reset_index().to_json(orient="records", date_format="iso")
+            data = _encode_frame(indicators_df)
             
-            # Set key and save data
+            # Save data (kept for 7 days) and its last update timestamp in
+            # one round trip
             key = f"indicators:{symbol}:{timeframe}"
-            self.redis.set(key, json_data)
-            
-            # Set expiration (keep data for 7 days)
-            self.redis.expire(key, 60 * 60 * 24 * 7)
-            
-            # Save last update timestamp
             update_key = f"indicators:{symbol}:{timeframe}:last_update"
-            self.redis.set(update_key, datetime.now().isoformat())
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(key, data, ex=self.TTL_WEEK)
+            pipe.set(update_key, datetime.now().isoformat())
+            pipe.execute()
+            self._record_ok()
             
             logger.debug(
                 f"Saved indicators to Redis",
@@ -200,6 +497,7 @@ class RedisManager:
             )
             return True
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error saving indicators to Redis: {e}", symbol=symbol, timeframe=timeframe)
             return False
     
@@ -219,19 +517,13 @@ class RedisManager:
         try:
             # Get key
             key = f"indicators:{symbol}:{timeframe}"
-            json_data = self.redis.get(key)
+            data = self.redis_bin.get(key)
+            self._record_ok()
             
-            if not json_data:
+            if not data:
                 return None
             
-            # Convert JSON to DataFrame
-            from io import StringIO
-            df = pd.read_json(StringIO(json_data))
-            
-            # Set timestamp as index
-            if "timestamp" in df.columns:
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-                df.set_index("timestamp", inplace=True)
+            df = _decode_frame(data)
             
             logger.debug(
                 f"Retrieved indicators from Redis",
@@ -241,9 +533,29 @@ class RedisManager:
             )
             return df
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error getting indicators from Redis: {e}", symbol=symbol, timeframe=timeframe)
             return None
     
+    def get_indicators_bulk(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """Get indicators for many symbol/timeframe pairs in one round trip
+        
+        Args:
+            pairs: (symbol, timeframe) pairs to look up
+            
+        Returns:
+            DataFrames with indicators keyed by pair; pairs not cached are
+            left out
+        """
+        try:
+            return self._get_frames_bulk("indicators", pairs)
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Error getting indicators from Redis: {e}", pairs=len(pairs))
+            return {}
+    
     # Signal Methods
     def save_signal(self, symbol: str, signal: str, confidence: float, timeframes: List[str]) -> bool:
         """Save trading signal to Redis
@@ -257,9 +569,6 @@ class RedisManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.is_connected():
-            return False
-        
         try:
             # Create signal data
             signal_data = {
@@ -267,20 +576,21 @@ class RedisManager:
                 "signal": signal,
                 "confidence": confidence,
                 "timeframes": timeframes,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             }
             
-            # Set key and save data
+            # Save signal (kept for 1 day) and add it to the signal history
+            # in one MULTI/EXEC round trip, so no other writer sees the
+            # history between the push and the trim
+            payload = json_dumps(signal_data)
             key = f"signal:{symbol}"
-            self.redis.set(key, json.dumps(signal_data))
-            
-            # Set expiration (keep signal for 1 day)
-            self.redis.expire(key, 60 * 60 * 24)
-            
-            # Add to signal history
             history_key = f"signal_history:{symbol}"
-            self.redis.lpush(history_key, json.dumps(signal_data))
-            self.redis.ltrim(history_key, 0, 99)  # Keep last 100 signals
+            with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(key, payload, ex=self.TTL_DAY)
+                pipe.lpush(history_key, payload)
+                pipe.ltrim(history_key, 0, 99)  # Keep last 100 signals
+                pipe.execute()
+            self._record_ok()
             
             logger.debug(
                 f"Saved signal to Redis",
@@ -290,6 +600,7 @@ class RedisManager:
             )
             return True
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error saving signal to Redis: {e}", symbol=symbol)
             return False
     
@@ -309,12 +620,13 @@ class RedisManager:
             # Get key
             key = f"signal:{symbol}"
             json_data = self.redis.get(key)
+            self._record_ok()
             
             if not json_data:
                 return None
             
             # Convert JSON to dict
-            signal_data = json.loads(json_data)
+            signal_data = json_loads(json_data)
             
             logger.debug(
                 f"Retrieved signal from Redis",
@@ -324,9 +636,35 @@ class RedisManager:
             )
             return signal_data
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error getting signal from Redis: {e}", symbol=symbol)
             return None
     
+    def get_signal_bulk(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the latest trading signals for many symbols in one round trip
+        
+        Args:
+            symbols: Trading pair symbols
+            
+        Returns:
+            Signal data keyed by symbol; symbols without a signal are left out
+        """
+        if not symbols or not self.is_connected():
+            return {}
+        
+        try:
+            values = self.redis.mget([f"signal:{symbol}" for symbol in symbols])
+            self._record_ok()
+            return {
+                symbol: json_loads(json_data)
+                for symbol, json_data in zip(symbols, values)
+                if json_data
+            }
+        except Exception as e:
+            self._record_error(e)
+            logger.error(f"Error getting signals from Redis: {e}", symbols=len(symbols))
+            return {}
+    
     def get_signal_history(self, symbol: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get signal history from Redis
         
@@ -344,12 +682,13 @@ class RedisManager:
             # Get key
             key = f"signal_history:{symbol}"
             json_data_list = self.redis.lrange(key, 0, limit - 1)
+            self._record_ok()
             
             if not json_data_list:
                 return []
             
             # Convert JSON to dict
-            signal_history = [json.loads(json_data) for json_data in json_data_list]
+            signal_history = [json_loads(json_data) for json_data in json_data_list]
             
             logger.debug(
                 f"Retrieved signal history from Redis",
@@ -358,8 +697,33 @@ class RedisManager:
             )
             return signal_history
         except Exception as e:
+            self._record_error(e)
             logger.error(f"Error getting signal history from Redis: {e}", symbol=symbol)
             return []
 
-# Create singleton instance
-redis_manager = RedisManager()
+
+# Guards the lazy creation of the redis_manager singleton below
+_singleton_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the redis_manager singleton on first use, not at import
+    
+    Connecting pings Redis, which can block for the connect timeout when
+    the server is down. Threads racing on first use share one instance.
+    """
+    if name != "redis_manager":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    with _singleton_lock:
+        # Another thread may have created it while this one waited
+        instance = globals().get("redis_manager")
+        if instance is None:
+            try:
+                instance = RedisManager()
+            except Exception as e:
+                logger.error(f"Failed to create Redis manager: {e}")
+                raise
+            # Later lookups find the module attribute and skip this hook
+            globals()["redis_manager"] = instance
+    return instance
@@ -6,7 +6,6 @@ import logging
 import json
 import functools
 import inspect
-import traceback
 from typing import Dict, Any, Optional
 
 
@@ -59,34 +58,46 @@ class StructuredLogger:
         except Exception:
             return f"{msg} | Context: {str(context_dict)}"
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at this level would be emitted"""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, msg: str, **kwargs):
         """Log debug message with structured context"""
-        self.logger.debug(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(msg, kwargs))
 
     def info(self, msg: str, **kwargs):
         """Log info message with structured context"""
-        self.logger.info(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message(msg, kwargs))
 
     def warning(self, msg: str, **kwargs):
         """Log warning message with structured context"""
-        self.logger.warning(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message(msg, kwargs))
+
+    # Tracebacks go through the logging framework's exc_info, so they are
+    # only formatted when a handler emits the record
 
     def error(self, msg: str, exc_info: bool = False, **kwargs):
         """Log error message with structured context"""
-        if exc_info:
-            kwargs["traceback"] = traceback.format_exc()
-        self.logger.error(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(
+                self._format_message(msg, kwargs), exc_info=exc_info
+            )
 
     def critical(self, msg: str, exc_info: bool = False, **kwargs):
         """Log critical message with structured context"""
-        if exc_info:
-            kwargs["traceback"] = traceback.format_exc()
-        self.logger.critical(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(
+                self._format_message(msg, kwargs), exc_info=exc_info
+            )
 
     def exception(self, msg: str, **kwargs):
         """Log exception message with structured context"""
-        kwargs["traceback"] = traceback.format_exc()
-        self.logger.exception(self._format_message(msg, kwargs))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.exception(self._format_message(msg, kwargs))
 
 
 def get_logger(name: str) -> StructuredLogger:
@@ -2,37 +2,149 @@
 Telegram utilities for bot notifications
 """
 
+import asyncio
 import logging
+from typing import List, Optional
+
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
 logger = logging.getLogger(__name__)
 _bot = None
 
+# Pending messages, drained in order by one worker task. Both are created
+# inside the running loop (an asyncio.Queue binds to a loop on Python 3.9),
+# which is remembered so other threads can hand messages to it
+_queue: Optional[asyncio.Queue] = None
+_worker: Optional[asyncio.Task] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_QUEUE_SIZE = 1000
+
+# Messages arriving within this window are sent together, duplicates once
+_BATCH_WINDOW = 0.5
+# Telegram's limit for a single message text
+_MAX_MESSAGE_LENGTH = 4096
+
 
 async def setup_telegram(token: str, chat_id: str) -> None:
     """Initialize Telegram bot"""
     global _bot
     try:
-        _bot = Bot(token=token)
+        # Keep TCP+TLS connections alive across messages
+        request = HTTPXRequest(
+            connection_pool_size=8, connect_timeout=5.0, read_timeout=10.0
+        )
+        _bot = Bot(token=token, request=request)
         # Test the connection
         await _bot.get_me()
+        _ensure_worker()
         logger.info("Telegram bot initialized successfully")
     except TelegramError as e:
         logger.error(f"Failed to initialize Telegram bot: {e}")
         _bot = None
 
 
-async def send_telegram_message(message: str) -> None:
-    """Send message via Telegram"""
+async def _send(message: str) -> None:
     from config.settings import TELEGRAM_CONFIG
 
-    if not TELEGRAM_CONFIG["enabled"] or not _bot:
-        return
-
     try:
         await _bot.send_message(
             chat_id=TELEGRAM_CONFIG["chat_id"], text=message, parse_mode="HTML"
         )
     except TelegramError as e:
         logger.error(f"Failed to send Telegram message: {e}")
+
+
+def _coalesce(batch: List[str]) -> List[str]:
+    """Drop repeated messages and join the rest into as few texts as fit"""
+    texts: List[str] = []
+    for message in dict.fromkeys(batch):
+        if texts and len(texts[-1]) + 1 + len(message) <= _MAX_MESSAGE_LENGTH:
+            texts[-1] = f"{texts[-1]}\n{message}"
+        else:
+            texts.append(message)
+    return texts
+
+
+async def _drain(queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _BATCH_WINDOW
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            if _bot:
+                for text in _coalesce(batch):
+                    await _send(text)
+        except Exception as e:
+            logger.error(f"Failed to send Telegram message: {e}")
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+def _ensure_worker() -> asyncio.Queue:
+    global _queue, _worker, _loop
+    if _worker is None or _worker.done():
+        _loop = asyncio.get_running_loop()
+        _queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        _worker = _loop.create_task(_drain(_queue))
+    return _queue
+
+
+def _put(message: str) -> None:
+    """Add a message to the queue; must run on the worker's loop"""
+    try:
+        _ensure_worker().put_nowait(message)
+    except asyncio.QueueFull:
+        logger.warning("Telegram queue full, dropping message")
+
+
+def enqueue_telegram_message(message: str) -> None:
+    """Queue a message for Telegram from sync code or any thread"""
+    from config.settings import TELEGRAM_CONFIG
+
+    if not TELEGRAM_CONFIG["enabled"] or not _bot:
+        return
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is not None and (_loop is None or running is _loop):
+        _put(message)
+    elif _loop is not None and not _loop.is_closed():
+        _loop.call_soon_threadsafe(_put, message)
+    else:
+        logger.warning("No Telegram event loop running, dropping message")
+
+
+async def send_telegram_message(message: str) -> None:
+    """Queue a message for Telegram and return without waiting on the network"""
+    from config.settings import TELEGRAM_CONFIG
+
+    if not TELEGRAM_CONFIG["enabled"] or not _bot:
+        return
+
+    _put(message)
+
+
+async def flush_telegram(timeout: float = 10.0) -> bool:
+    """Wait for queued messages to be sent; False if the timeout expires"""
+    if _queue is None or _worker is None or _worker.done():
+        return True
+    try:
+        await asyncio.wait_for(_queue.join(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
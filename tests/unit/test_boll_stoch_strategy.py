@@ -6,7 +6,7 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from src.strategies.boll_stoch_strategy import BollStochStrategy
+from src.strategies.boll_stoch_strategy import INDICATOR_COLUMNS, BollStochStrategy
 
 
 @pytest.fixture
@@ -213,3 +213,48 @@ class TestBollStochStrategy:
             == trading_config["allocation_per_trade"] * 100
         )
         assert allocation_info["allocation_usdt"] == expected_allocation
+
+    def test_calculate_indicators_reuses_closed_candle(
+        self, strategy, sample_df, monkeypatch
+    ):
+        """Test only the in-progress candle is refreshed until a new one closes"""
+        from src.strategies import boll_stoch_strategy
+        from src.utils.redis_manager import redis_manager
+
+        monkeypatch.setattr(redis_manager, "get_indicators", lambda *args: None)
+        monkeypatch.setattr(redis_manager, "save_indicators", lambda *args: True)
+        kernel_calls = []
+        kernel = boll_stoch_strategy.compute_indicators
+
+        def counting_kernel(close, *args):
+            kernel_calls.append(len(close))
+            return kernel(close, *args)
+
+        monkeypatch.setattr(boll_stoch_strategy, "compute_indicators", counting_kernel)
+
+        np.random.seed(7)
+        df = sample_df.copy()
+        df["close"] = 35000 + np.random.normal(0, 100, len(df)).cumsum()
+        first = strategy.calculate_indicators(df, "BTC/USDT", "15m")
+        closed_rows = first.iloc[:-1].copy()
+        assert kernel_calls == [len(df)]
+
+        # A new price for the last candle reuses the closed rows
+        polled = df.copy()
+        polled.iloc[-1, polled.columns.get_loc("close")] += 150.0
+        refreshed = strategy.calculate_indicators(polled, "BTC/USDT", "15m")
+        assert kernel_calls == [len(df)]
+        pd.testing.assert_frame_equal(refreshed.iloc[:-1], closed_rows)
+        assert refreshed["close"].iloc[-1] == polled["close"].iloc[-1]
+
+        # Its last row matches a full recomputation
+        strategy.invalidate("15m")
+        full = strategy.calculate_indicators(polled, "BTC/USDT", "15m")
+        assert kernel_calls == [len(df), len(df)]
+        assert full is not refreshed
+        np.testing.assert_allclose(
+            refreshed[INDICATOR_COLUMNS].iloc[-1].to_numpy(),
+            full[INDICATOR_COLUMNS].iloc[-1].to_numpy(),
+            rtol=1e-9,
+            atol=1e-6,
+        )
@@ -0,0 +1,120 @@
+"""
+Unit tests for the numba indicator kernels
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from ta.volatility import BollingerBands
+from ta.momentum import RSIIndicator, StochRSIIndicator
+
+from src.strategies import indicator_kernels
+
+
+@pytest.fixture
+def close_prices():
+    """Create a random walk of close prices"""
+    np.random.seed(42)  # For reproducibility
+    return 35000 + np.random.normal(0, 100, 200).cumsum()
+
+
+class TestIndicatorKernels:
+    """Test numba indicator kernels"""
+
+    def test_ema_matches_pandas(self, close_prices):
+        """Test EMA kernel against pandas ewm(adjust=False)"""
+        out = np.empty_like(close_prices)
+        indicator_kernels.ema(close_prices, 20, out)
+
+        expected = (
+            pd.Series(close_prices).ewm(span=20, adjust=False).mean().to_numpy()
+        )
+        np.testing.assert_allclose(out, expected)
+
+    def test_rolling_min_max_matches_pandas(self, close_prices):
+        """Test monotonic-deque min/max against pandas rolling"""
+        values = close_prices.copy()
+        values[:5] = np.nan  # Leading warmup gap like RSI output
+        out_min = np.empty_like(values)
+        out_max = np.empty_like(values)
+        indicator_kernels.rolling_min_max(values, 14, out_min, out_max)
+
+        series = pd.Series(values)
+        np.testing.assert_allclose(out_min, series.rolling(14).min().to_numpy())
+        np.testing.assert_allclose(out_max, series.rolling(14).max().to_numpy())
+
+    def test_bollinger_running_sums_match_pandas(self):
+        """Test O(1) Bollinger update over a long series with a gap"""
+        np.random.seed(3)
+        values = 35000 + np.random.normal(0, 100, 5000).cumsum()
+        values[2500] = np.nan
+        upper = np.empty_like(values)
+        middle = np.empty_like(values)
+        lower = np.empty_like(values)
+        indicator_kernels.bollinger(values, 20, 2.0, upper, middle, lower)
+
+        rolling = pd.Series(values).rolling(20)
+        mean = rolling.mean().to_numpy()
+        std = rolling.std(ddof=0).to_numpy()
+        np.testing.assert_allclose(middle, mean)
+        np.testing.assert_allclose(upper, mean + 2.0 * std, rtol=1e-9)
+        np.testing.assert_allclose(lower, mean - 2.0 * std, rtol=1e-9)
+
+    def test_condition_counts_vectorized(self):
+        """Test buy/sell condition counts across several timeframes"""
+        price = np.array([90.0, 110.0, 100.0])
+        bb_lower = np.array([95.0, 95.0, 95.0])
+        bb_upper = np.array([105.0, 105.0, 105.0])
+        ema = np.array([85.0, 115.0, 100.0])
+        stoch_k = np.array([15.0, 85.0, 50.0])
+        stoch_d = np.array([10.0, 90.0, 50.0])
+
+        buy = indicator_kernels.buy_conditions_met(
+            price, bb_lower, ema, stoch_k, stoch_d, 20.0
+        )
+        sell = indicator_kernels.sell_conditions_met(
+            price, bb_upper, ema, stoch_k, stoch_d, 80.0
+        )
+
+        assert buy.tolist() == [4, 0, 0]
+        assert sell.tolist() == [0, 4, 0]
+
+    def test_indicators_match_ta(self, close_prices):
+        """Test the combined kernel against the ta library indicators"""
+        out = np.empty((len(close_prices), 6))
+        indicator_kernels.indicators(close_prices, out, 20, 2.0, 50, 14, 3, 3)
+
+        close = pd.Series(close_prices)
+        bb = BollingerBands(close=close, window=20, window_dev=2.0)
+        stoch = StochRSIIndicator(close=close, window=14, smooth1=3, smooth2=3)
+        np.testing.assert_allclose(out[:, 0], bb.bollinger_hband().to_numpy())
+        np.testing.assert_allclose(out[:, 1], bb.bollinger_mavg().to_numpy())
+        np.testing.assert_allclose(out[:, 2], bb.bollinger_lband().to_numpy())
+        # ta scales StochRSI to 0-1, the kernel to 0-100
+        np.testing.assert_allclose(out[:, 4], stoch.stochrsi_k().to_numpy() * 100)
+        np.testing.assert_allclose(out[:, 5], stoch.stochrsi_d().to_numpy() * 100)
+
+    def test_wilder_rsi_matches_ta(self, close_prices):
+        """Test the RSI kernel and its returned state against ta"""
+        out = np.empty_like(close_prices)
+        avg_gain, avg_loss = indicator_kernels.wilder_rsi(close_prices, 14, out)
+
+        expected = RSIIndicator(close=pd.Series(close_prices), window=14).rsi()
+        np.testing.assert_allclose(out, expected.to_numpy())
+        assert 100.0 - 100.0 / (1.0 + avg_gain / avg_loss) == pytest.approx(out[-1])
+
+    def test_indicators_batch_pads_short_histories(self, close_prices):
+        """Test batch kernel rows match the single-series kernel"""
+        single = np.empty((len(close_prices), 6))
+        indicator_kernels.indicators(close_prices, single, 20, 2.0, 50, 14, 3, 3)
+
+        closes = np.full((2, len(close_prices)), np.nan)
+        closes[0] = close_prices
+        closes[1, 50:] = close_prices[:-50]
+        out = np.empty(closes.shape + (6,))
+        indicator_kernels.indicators_batch(closes, out, 20, 2.0, 50, 14, 3, 3)
+
+        np.testing.assert_allclose(out[0], single)
+        np.testing.assert_allclose(out[1, 50:], single[:-50])
+        assert np.isnan(out[1, :50]).all()
@@ -0,0 +1,143 @@
+"""
+Unit tests for SpotStrategy
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.strategies.boll_stoch_strategy import INDICATOR_COLUMNS
+from src.strategies.spot_strategy import SpotStrategy
+
+
+@pytest.fixture
+def strategy():
+    """Create a SpotStrategy instance"""
+    return SpotStrategy()
+
+
+@pytest.fixture
+def sample_df():
+    """Create a sample DataFrame for testing"""
+    np.random.seed(7)
+    n = 100
+    close_prices = 30000 + np.random.normal(0, 100, n).cumsum()
+    return pd.DataFrame({"close": close_prices})
+
+
+def test_calculate_indicators(strategy, sample_df):
+    """Test that all indicator columns are filled and in range"""
+    df = strategy.calculate_indicators(sample_df)
+
+    for col in ["bb_upper", "bb_middle", "bb_lower", "ema", "stoch_k", "stoch_d"]:
+        assert col in df.columns
+        assert not df[col].isna().any()
+
+    tail = df.iloc[40:]
+    assert (tail["bb_upper"] >= tail["bb_middle"]).all()
+    assert (tail["bb_middle"] >= tail["bb_lower"]).all()
+    assert tail["stoch_k"].between(0, 100).all()
+
+    expected_mid = sample_df["close"].rolling(20).mean()
+    assert np.allclose(df["bb_middle"].iloc[19:], expected_mid.iloc[19:])
+
+
+def test_calculate_indicators_warmup_uses_close(strategy, sample_df):
+    """Test that warmup rows fall back to the close price"""
+    df = strategy.calculate_indicators(sample_df.head(10).copy())
+
+    assert (df["bb_middle"] == df["close"]).all()
+    assert (df["stoch_k"] == df["close"]).all()
+    assert (df["ema"] == df["close"]).all()
+
+
+def test_update_incremental_matches_full(strategy):
+    """Test that one-bar updates track a full recompute"""
+    np.random.seed(11)
+    close_prices = 30000 + np.random.normal(0, 100, 300).cumsum()
+    full = pd.DataFrame({"close": close_prices})
+
+    strategy.update(full.iloc[:200])
+    for end in range(201, 301):
+        state = strategy.update(full.iloc[:end])
+    assert state["index"] == full.index[-1]
+
+    expected = SpotStrategy().calculate_indicators(full.copy()).iloc[-1]
+    for col in ["bb_upper", "bb_middle", "bb_lower", "ema", "stoch_k", "stoch_d"]:
+        assert state[col] == pytest.approx(expected[col], rel=1e-6)
+
+
+def test_should_buy_reads_state(strategy, sample_df):
+    """Test that should_buy works on a frame without indicator columns"""
+    should_buy, confidence, _ = strategy.should_buy(sample_df)
+
+    assert 0 <= confidence <= 1
+    # Without symbol and timeframe nothing is cached
+    assert not strategy._cache
+
+    cached = strategy.should_buy(sample_df, "BTC/USDT", "1h")
+    assert cached[:2] == (should_buy, confidence)
+    assert strategy._cache[("BTC/USDT", "1h")].state["index"] == sample_df.index[-1]
+
+
+def test_calculate_indicators_cached_by_symbol(strategy):
+    """Test cache hits and one-bar advances through the ring buffer"""
+    np.random.seed(5)
+    close_prices = 30000 + np.random.normal(0, 100, 150).cumsum()
+    full = pd.DataFrame({"close": close_prices})
+
+    first = strategy.calculate_indicators(full.iloc[:120].copy(), "BTC/USDT", "15m")
+    repeat = full.iloc[:120].copy()
+    again = strategy.calculate_indicators(repeat, "BTC/USDT", "15m")
+    assert again is repeat
+    np.testing.assert_array_equal(
+        again[INDICATOR_COLUMNS].to_numpy(), first[INDICATOR_COLUMNS].to_numpy()
+    )
+
+    # Slide a fixed-length window forward one bar at a time
+    for end in range(121, 151):
+        df = strategy.calculate_indicators(
+            full.iloc[end - 100:end].copy(), "BTC/USDT", "15m"
+        )
+
+    expected = SpotStrategy().calculate_indicators(full.copy()).iloc[-100:]
+    for col in ["bb_upper", "bb_middle", "bb_lower", "ema", "stoch_k", "stoch_d"]:
+        np.testing.assert_allclose(df[col], expected[col], rtol=1e-6)
+
+
+def test_should_sell_warmup_falls_back_to_close(strategy, sample_df):
+    """Test that NaN warmup indicators are replaced by the close price"""
+    df = sample_df.head(10).copy()
+    should_sell, confidence = strategy.should_sell(df)
+
+    # Price equals every band/EMA, so only the stochastic conditions can hold
+    assert confidence <= 0.5
+    assert list(df.columns) == ["close"]
+
+
+@pytest.mark.parametrize(
+    "balance,symbol,price,allocation,max_positions,quantity",
+    [
+        (99.0, "BTC/USDT", 30000.0, 30.0, 1, 0.00099),
+        (100.0, "ETH/USDT", 2000.0, 25.0, 2, 0.0125),
+        (999.0, "SOL/USDT", 20.0, 20.0, 2, 9.96),
+        (1000.0, "BTC/USDT", 25000.0, 15.0, 3, 0.00598),
+    ],
+)
+def test_calculate_position_size_tiers(
+    strategy, balance, symbol, price, allocation, max_positions, quantity
+):
+    """Test balance tier boundaries and symbol precision"""
+    qty, info = strategy.calculate_position_size(balance, price, symbol)
+
+    assert info["allocation_percent"] == pytest.approx(allocation)
+    assert info["max_positions"] == max_positions
+    assert qty == pytest.approx(quantity)
+
+
+def test_should_sell_stop_loss_skips_indicators(strategy, sample_df):
+    """Test that a stop-loss hit returns before touching the indicator cache"""
+    buy_price = sample_df["close"].iloc[-1] * 1.1
+
+    assert strategy.should_sell(sample_df, buy_price) == (True, 1.0)
+    assert strategy._cache == {}